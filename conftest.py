@@ -4,6 +4,7 @@ Pytest conftest file for CNV tests
 """
 
 import datetime
+import json
 import logging
 import os
 import os.path
@@ -28,17 +29,37 @@ from pytest import Item
 from pytest_testconfig import config as py_config
 
 import utilities.infra
+from utilities.api_call_accounting import (
+    API_CALLS_FILE_NAME,
+    enable_api_call_accounting,
+    get_api_calls_session_report,
+    get_api_calls_test_report,
+    pop_api_calls_fixture,
+    push_api_calls_fixture,
+    set_api_calls_phase,
+    set_api_calls_test,
+)
 from utilities.bitwarden import get_cnv_tests_secret_by_name
 from utilities.constants import QUARANTINED, TIMEOUT_5MIN, NamespacesNames
 from utilities.data_collector import (
     collect_default_cnv_must_gather_with_vm_gather,
+    get_data_collector_base_directory,
     get_data_collector_dir,
+    prepare_pytest_item_data_dir,
     set_data_collector_directory,
     set_data_collector_values,
+    write_to_file,
 )
 from utilities.database import Database
+from utilities.dv_throughput import (
+    DV_THROUGHPUT_FILE_NAME_PREFIX,
+    enable_dv_throughput_telemetry,
+    get_dv_throughput_reports,
+)
 from utilities.exceptions import MissingEnvironmentVariableError, StorageSanityError
 from utilities.logger import setup_logging
+from utilities.migration_recorder import MIGRATIONS_FILE_NAME, enable_migrations_recording, pop_migrations_records
+from utilities.namespace_pool import NAMESPACE_POOL_SIZE
 from utilities.pytest_utils import (
     config_default_storage_class,
     deploy_run_in_progress_config_map,
@@ -48,11 +69,17 @@ from utilities.pytest_utils import (
     get_cnv_version_explorer_url,
     get_matrix_params,
     reorder_early_fixtures,
+    restore_discovery_cache,
     run_in_progress_config_map,
+    save_discovery_cache,
     separator,
     skip_if_pytest_flags_exists,
     stop_if_run_in_progress,
 )
+from utilities.reaper import enable_background_teardown, save_reaper_leftovers, set_background_teardown_active
+from utilities.ssh_pool import SSH_CONNECTION_POOL
+from utilities.vm_pool import WARM_VM_POOL_SIZE
+from utilities.watch import stop_resource_caches
 
 LOGGER = logging.getLogger(__name__)
 BASIC_LOGGER = logging.getLogger("basic")
@@ -230,6 +257,25 @@ def pytest_addoption(parser):
         help="Path to pytest log file",
         default="pytest-tests.log",
     )
+    data_collector_group.addoption(
+        "--dv-throughput-telemetry",
+        help="Record the phases durations and throughput of DataVolumes created with create_dv. "
+        f"Reported per storage class in {DV_THROUGHPUT_FILE_NAME_PREFIX}-<storage class>.json files under the data "
+        "collector directory.",
+        action="store_true",
+    )
+    data_collector_group.addoption(
+        "--record-migrations",
+        help="Record the duration, downtime and data processed of the VM live migrations of each test. "
+        f"Reported in the junit properties and in {MIGRATIONS_FILE_NAME} files under the data collector directory.",
+        action="store_true",
+    )
+    data_collector_group.addoption(
+        "--api-call-accounting",
+        help="Count the API calls of each test and fixture, with their latency. "
+        f"Reported in the junit properties and in {API_CALLS_FILE_NAME} files under the data collector directory.",
+        action="store_true",
+    )
 
     # Deprecate api test_group
     deprecate_api_test_group.addoption(
@@ -258,6 +304,32 @@ def pytest_addoption(parser):
         help="Session id to use for the test run.",
         default=shortuuid.uuid(),
     )
+    session_group.addoption(
+        "--namespace-pool-size",
+        type=int,
+        default=NAMESPACE_POOL_SIZE,
+        help="Number of test modules namespaces to provision ahead of time, 0 (default) to disable",
+    )
+    session_group.addoption(
+        "--warm-vm-pool-size",
+        type=int,
+        default=WARM_VM_POOL_SIZE,
+        help="Number of running VMs of each flavor to start ahead for warm VM fixtures, e.g. warm_fedora_vm",
+    )
+    session_group.addoption(
+        "--background-teardown",
+        action="store_true",
+        default=False,
+        help="Delete VMs, DataVolumes, Secrets and Services leaving their context during test teardown in the "
+        "background, overlapping the deletion with the next test setup",
+    )
+    session_group.addoption(
+        "--golden-image-reuse",
+        action="store_true",
+        default=False,
+        help="Keep golden image DataVolumes after the session, indexed by their source image content, and reuse "
+        "or clone them for the same image and storage class in later sessions",
+    )
     # TODO: Remove this option, once tests are marked explicitly with artifactory and bitwarden markers
     session_group.addoption(
         "--skip-artifactory-check",
@@ -538,6 +610,33 @@ def pytest_runtest_makereport(item, call):
         parent = item.parent
         parent._previousfailed = item
 
+    if call.when == "teardown" and item.config.getoption("--api-call-accounting"):
+        api_calls_report = get_api_calls_test_report(test_name=item.nodeid)
+        item.user_properties.append(("api_calls", api_calls_report["total_calls"]))
+        item.user_properties.append(("api_calls_latency", api_calls_report["total_latency"]))
+        write_to_file(
+            file_name=API_CALLS_FILE_NAME,
+            content=json.dumps(api_calls_report, indent=2),
+            base_directory=prepare_pytest_item_data_dir(item=item, output_dir=get_data_collector_base_directory()),
+        )
+
+    if call.when == "teardown" and item.config.getoption("--record-migrations"):
+        if migrations := pop_migrations_records():
+            item.user_properties.append(("migrations", len(migrations)))
+            item.user_properties.append((
+                "migrations_duration",
+                sum(migration["duration"] or 0 for migration in migrations),
+            ))
+            item.user_properties.append((
+                "migrations_max_downtime_ms",
+                max((migration["downtime_ms"] or 0 for migration in migrations), default=0),
+            ))
+            write_to_file(
+                file_name=MIGRATIONS_FILE_NAME,
+                content=json.dumps(migrations, indent=2),
+                base_directory=prepare_pytest_item_data_dir(item=item, output_dir=get_data_collector_base_directory()),
+            )
+
     outcome = yield
     report = outcome.get_result()
 
@@ -551,8 +650,14 @@ def pytest_runtest_makereport(item, call):
             report.extras = extras
 
 
+@pytest.hookimpl(hookwrapper=True)
 def pytest_fixture_setup(fixturedef, request):
     LOGGER.info(f"Executing {fixturedef.scope} fixture: {fixturedef.argname}")
+    push_api_calls_fixture(fixture_name=fixturedef.argname)
+    try:
+        yield
+    finally:
+        pop_api_calls_fixture()
 
 
 def pytest_runtest_setup(item):
@@ -561,6 +666,8 @@ def pytest_runtest_setup(item):
     """
     # set the data collector directory irrespective of --data-collector. This is to enable collecting pexcpect logs
     set_data_collector_directory(item=item, directory_path=get_data_collector_dir())
+    set_api_calls_test(test_name=item.nodeid)
+    set_background_teardown_active(active=False)
     if item.config.getoption("--data-collector"):
         # before the setup work starts, insert current epoch time into the database
         try:
@@ -581,10 +688,13 @@ def pytest_runtest_setup(item):
 
 def pytest_runtest_call(item):
     BASIC_LOGGER.info(f"{separator(symbol_='-', val='CALL')}")
+    set_api_calls_phase(phase="call")
 
 
 def pytest_runtest_teardown(item):
     BASIC_LOGGER.info(f"{separator(symbol_='-', val='TEARDOWN')}")
+    set_api_calls_phase(phase="teardown")
+    set_background_teardown_active(active=True)
     # reset data collector after each tests
     py_config["data_collector"]["collector_directory"] = py_config["data_collector"]["data_collector_base_directory"]
 
@@ -657,6 +767,18 @@ def pytest_sessionstart(session):
         log_level=session.config.getoption("log_cli_level") or logging.INFO,
     )
 
+    if not skip_if_pytest_flags_exists(pytest_config=session.config):
+        restore_discovery_cache()
+        if session.config.getoption("--api-call-accounting"):
+            enable_api_call_accounting()
+        if session.config.getoption("--background-teardown"):
+            enable_background_teardown()
+        if session.config.getoption("--dv-throughput-telemetry"):
+            enable_dv_throughput_telemetry()
+        if session.config.getoption("--record-migrations"):
+            enable_migrations_recording()
+    py_config["golden_image_reuse"] = session.config.getoption("--golden-image-reuse")
+
     # Save the default storage_class_matrix before it is updated
     # with runtime storage_class_matrix value(s)
     py_config["system_storage_class_matrix"] = py_config.get("storage_class_matrix", [])
@@ -704,9 +826,22 @@ def pytest_sessionstart(session):
 
 def pytest_sessionfinish(session, exitstatus):
     shutil.rmtree(path=session.config.option.basetemp, ignore_errors=True)
+    SSH_CONNECTION_POOL.close()
+    stop_resource_caches()
     if not skip_if_pytest_flags_exists(pytest_config=session.config):
+        if session.config.getoption("--background-teardown"):
+            save_reaper_leftovers()
         run_in_progress_config_map().clean_up()
         deploy_run_in_progress_namespace().clean_up()
+        save_discovery_cache()
+        if session.config.getoption("--api-call-accounting"):
+            write_to_file(
+                file_name=API_CALLS_FILE_NAME,
+                content=get_api_calls_session_report(),
+                base_directory=get_data_collector_base_directory(),
+            )
+        for file_name, report in get_dv_throughput_reports().items():
+            write_to_file(file_name=file_name, content=report, base_directory=get_data_collector_base_directory())
 
     reporter = session.config.pluginmanager.get_plugin("terminalreporter")
     reporter.summary_stats()
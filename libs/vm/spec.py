@@ -1,31 +1,66 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+import copy
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar
 
 from ocp_resources.virtual_machine import VirtualMachine
 
+IMMUTABLE_VALUE_TYPES = (str, int, float, bool)
 
-@dataclass
-class VMSpec:
+
+class SpecObject:
+    """
+    Base of the spec dataclasses.
+
+    to_dict is equivalent to dataclasses.asdict with None fields filtered out, without its generic recursive
+    deep copy: only nested spec objects, lists and dicts are rebuilt, immutable values are used as is and other
+    values are deep copied.
+    """
+
+    __slots__ = ()
+    __dataclass_fields__: ClassVar[dict[str, Any]]
+
+    def to_dict(self) -> dict[str, Any]:
+        body = {}
+        for field in fields(self):
+            if (value := getattr(self, field.name)) is not None:
+                body[field.name] = _value_to_dict(value=value)
+        return body
+
+
+def _value_to_dict(value: Any) -> Any:
+    if isinstance(value, IMMUTABLE_VALUE_TYPES):
+        return value
+    if isinstance(value, SpecObject):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_value_to_dict(value=item) for item in value]
+    if isinstance(value, dict):
+        return {_value_to_dict(value=key): _value_to_dict(value=item) for key, item in value.items()}
+    return copy.deepcopy(value)
+
+
+@dataclass(slots=True)
+class VMSpec(SpecObject):
     template: Template
     runStrategy: str = VirtualMachine.RunStrategy.HALTED  # noqa: N815
 
 
-@dataclass
-class Template:
+@dataclass(slots=True)
+class Template(SpecObject):
     spec: VMISpec
     metadata: Metadata | None = None
 
 
-@dataclass
-class Metadata:
+@dataclass(slots=True)
+class Metadata(SpecObject):
     labels: dict[str, str] | None = None
     annotations: dict[str, str] | None = None
 
 
-@dataclass
-class VMISpec:
+@dataclass(slots=True)
+class VMISpec(SpecObject):
     domain: Domain
     networks: list[Network] | None = None
     volumes: list[Volume] | None = None
@@ -33,43 +68,43 @@ class VMISpec:
     affinity: Affinity | None = None
 
 
-@dataclass
-class Domain:
+@dataclass(slots=True)
+class Domain(SpecObject):
     cpu: CPU | None = None
     memory: Memory | None = None
     devices: Devices | None = None
 
 
-@dataclass
-class CPU:
+@dataclass(slots=True)
+class CPU(SpecObject):
     cores: int
 
 
-@dataclass
-class Memory:
+@dataclass(slots=True)
+class Memory(SpecObject):
     guest: str
 
 
-@dataclass
-class Devices:
+@dataclass(slots=True)
+class Devices(SpecObject):
     disks: list[SpecDisk] | None = None
     interfaces: list[Interface] | None = None
     rng: dict[Any, Any] | None = None
 
 
-@dataclass
-class SpecDisk:
+@dataclass(slots=True)
+class SpecDisk(SpecObject):
     name: str
     disk: Disk
 
 
-@dataclass
-class Disk:
+@dataclass(slots=True)
+class Disk(SpecObject):
     bus: str
 
 
-@dataclass
-class Interface:
+@dataclass(slots=True)
+class Interface(SpecObject):
     name: str
     masquerade: dict[Any, Any] | None = None
     bridge: dict[Any, Any] | None = None
@@ -77,65 +112,65 @@ class Interface:
     binding: NetBinding | None = None
 
 
-@dataclass
-class NetBinding:
+@dataclass(slots=True)
+class NetBinding(SpecObject):
     name: str
 
 
-@dataclass
-class Network:
+@dataclass(slots=True)
+class Network(SpecObject):
     name: str
     pod: dict[Any, Any] | None = None
     multus: Multus | None = None
 
 
-@dataclass
-class Multus:
+@dataclass(slots=True)
+class Multus(SpecObject):
     networkName: str  # noqa: N815
 
 
-@dataclass
-class Affinity:
+@dataclass(slots=True)
+class Affinity(SpecObject):
     podAntiAffinity: PodAntiAffinity  # noqa: N815
 
 
-@dataclass
-class PodAntiAffinity:
+@dataclass(slots=True)
+class PodAntiAffinity(SpecObject):
     requiredDuringSchedulingIgnoredDuringExecution: list[PodAffinityTerm]  # noqa: N815
 
 
-@dataclass
-class PodAffinityTerm:
+@dataclass(slots=True)
+class PodAffinityTerm(SpecObject):
     labelSelector: LabelSelector  # noqa: N815
     topologyKey: str  # noqa: N815
     namespaceSelector: dict[str, Any] | None = None  # noqa: N815
 
 
-@dataclass
-class LabelSelector:
+@dataclass(slots=True)
+class LabelSelector(SpecObject):
     matchExpressions: list[LabelSelectorRequirement]  # noqa: N815
 
 
-@dataclass
-class LabelSelectorRequirement:
+@dataclass(slots=True)
+class LabelSelectorRequirement(SpecObject):
     operator: str
     key: str
     values: list[str]
 
 
-@dataclass
-class Volume:
+@dataclass(slots=True)
+class Volume(SpecObject):
     name: str
     containerDisk: ContainerDisk | None = None  # noqa: N815
     cloudInitNoCloud: CloudInitNoCloud | None = None  # noqa: N815
 
 
-@dataclass
-class ContainerDisk:
+@dataclass(slots=True)
+class ContainerDisk(SpecObject):
     image: str
 
 
-@dataclass
-class CloudInitNoCloud:
+@dataclass(slots=True)
+class CloudInitNoCloud(SpecObject):
     networkData: str  # noqa: N815
     userData: str | None = None  # noqa: N815
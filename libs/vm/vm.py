@@ -1,8 +1,6 @@
 from __future__ import annotations
 
 import uuid
-from dataclasses import asdict
-from typing import Any
 
 from kubernetes.dynamic import DynamicClient
 from ocp_resources.node import Node
@@ -32,7 +30,7 @@ class BaseVirtualMachine(VirtualMachine):
         self._name = self._new_unique_name(prefix=name)
         self._spec = spec
         self._os_distribution = os_distribution
-        vm_spec = asdict(obj=spec, dict_factory=self._filter_out_none_values)
+        vm_spec = spec.to_dict()
         super().__init__(
             namespace=namespace,
             name=self._name,
@@ -46,10 +44,6 @@ class BaseVirtualMachine(VirtualMachine):
     def _new_unique_name(prefix: str) -> str:
         return f"{prefix}-{uuid.uuid4().hex[:16]}"
 
-    @staticmethod
-    def _filter_out_none_values(data: list[tuple[str, Any]]) -> dict[str, Any]:
-        return {key: val for (key, val) in data if val is not None}
-
     @property
     def login_params(self) -> dict[str, str]:
         return py_config["os_login_param"][self._os_distribution]
@@ -125,7 +125,7 @@ def test_ceph_storage_outage(
     # Verify that dv and vm are not ready while chaos is being injected.
     chaos_dv_rhel9.pvc.wait_for_status(status=PersistentVolumeClaim.Status.PENDING, sleep=TIMEOUT_2MIN)
     expected_status = VirtualMachine.Status.PROVISIONING
-    chaos_vm_rhel9_with_dv.wait_for_specific_status(status=expected_status, sleep=TIMEOUT_2MIN)
+    chaos_vm_rhel9_with_dv.wait_for_specific_status(status=expected_status)
 
     # Verify that vm creation is resumed and vm reaches running state after deployment is restored.
     downscaled_storage_provisioner_deployment["deployment"].scale_replicas(
@@ -125,6 +125,7 @@ from utilities.constants import (
     UpgradeStreams,
 )
 from utilities.exceptions import MissingEnvironmentVariableError
+from utilities.golden_images import delete_stale_golden_images
 from utilities.infra import (
     ClusterHosts,
     ExecCommandOnPod,
@@ -160,6 +161,7 @@ from utilities.infra import (
     verify_image_info,
     wait_for_pods_deletion,
 )
+from utilities.namespace_pool import NamespacePool
 from utilities.network import (
     EthernetNetworkConfigurationPolicy,
     MacPool,
@@ -180,6 +182,7 @@ from utilities.operator import (
     get_hco_csv_name_by_version,
     get_machine_config_pool_by_name,
 )
+from utilities.reaper import delete_reaper_leftovers
 from utilities.ssp import get_data_import_crons, get_ssp_resource
 from utilities.storage import (
     create_or_update_data_source,
@@ -211,6 +214,8 @@ from utilities.virt import (
     wait_for_kv_stabilize,
     wait_for_windows_vm,
 )
+from utilities.vm_pool import WarmVMPool
+from utilities.watch import cached_resource_instance, get_resource_cache
 
 LOGGER = logging.getLogger(__name__)
 HTTP_SECRET_NAME = "htpass-secret-for-cnv-tests"
@@ -425,21 +430,29 @@ def unprivileged_client(
 
 @pytest.fixture(scope="session")
 def nodes(admin_client):
-    yield list(Node.get(dyn_client=admin_client))
+    # Nodes are read throughout the session, keep them in a watch synchronized cache
+    nodes_cache = get_resource_cache(client=admin_client, resource_class=Node)
+    if nodes_cache:
+        yield [Node(client=admin_client, name=raw_node["metadata"]["name"]) for raw_node in nodes_cache.list()]
+    else:
+        yield list(Node.get(dyn_client=admin_client))
 
 
 @pytest.fixture(scope="session")
 def schedulable_nodes(nodes):
     """Get nodes marked as schedulable by kubevirt"""
     schedulable_label = "kubevirt.io/schedulable"
+    nodes_instances = {node.name: cached_resource_instance(resource=node) for node in nodes}
     yield [
         node
         for node in nodes
-        if schedulable_label in node.labels.keys()
-        and node.labels[schedulable_label] == "true"
-        and not node.instance.spec.unschedulable
-        and not kubernetes_taint_exists(node)
-        and node.kubelet_ready
+        if nodes_instances[node.name].metadata.labels.get(schedulable_label) == "true"
+        and not nodes_instances[node.name].spec.unschedulable
+        and not kubernetes_taint_exists(node=node)
+        and any(
+            condition.reason == "KubeletReady" and condition.status == Node.Condition.Status.TRUE
+            for condition in nodes_instances[node.name].status.conditions
+        )
     ]
 
 
@@ -646,24 +659,94 @@ def nodes_available_nics(nodes_active_nics):
     return {node: nodes_active_nics[node]["available"] for node in nodes_active_nics.keys()}
 
 
+@pytest.fixture(scope="session")
+def namespace_pool(request, admin_client, unprivileged_client):
+    """
+    Provision the namespaces of the upcoming modules using the default `namespace` fixture in the background,
+    and delete them asynchronously.
+    """
+    pooled_names = []
+    for item in request.session.items:
+        callspec = getattr(item, "callspec", None)
+        if "namespace" in item.fixturenames and not (callspec and "namespace" in callspec.params):
+            name = generate_namespace_name(file_path=item.fspath.strpath.split(f"{os.path.dirname(__file__)}/")[1])
+            if name not in pooled_names:
+                pooled_names.append(name)
+
+    with NamespacePool(
+        names=pooled_names,
+        admin_client=admin_client,
+        unprivileged_client=unprivileged_client,
+        size=request.config.getoption("namespace_pool_size"),
+        delete_timeout=TIMEOUT_6MIN,
+    ) as pool:
+        yield pool
+
+
 @pytest.fixture(scope="module")
-def namespace(request, admin_client, unprivileged_client):
+def namespace(request, admin_client, unprivileged_client, namespace_pool):
     """
     To create namespace using admin client, pass {"use_unprivileged_client": False} to request.param
     (default for "use_unprivileged_client" is True)
+
+    Without request.param, the namespace is taken from namespace_pool when it is enabled (--namespace-pool-size > 0).
     """
+    name = generate_namespace_name(file_path=request.fspath.strpath.split(f"{os.path.dirname(__file__)}/")[1])
+    if not hasattr(request, "param") and request.config.getoption("namespace_pool_size"):
+        pooled_namespace = namespace_pool.acquire(name=name)
+        yield pooled_namespace
+        namespace_pool.release(namespace=pooled_namespace)
+        return
+
     use_unprivileged_client = getattr(request, "param", {}).get("use_unprivileged_client", True)
     teardown = getattr(request, "param", {}).get("teardown", True)
     unprivileged_client = unprivileged_client if use_unprivileged_client else None
     yield from create_ns(
         unprivileged_client=unprivileged_client,
         admin_client=admin_client,
-        name=generate_namespace_name(file_path=request.fspath.strpath.split(f"{os.path.dirname(__file__)}/")[1]),
+        name=name,
         teardown=teardown,
         delete_timeout=TIMEOUT_6MIN,
     )
 
 
+@pytest.fixture(scope="session")
+def warm_vm_pool(request, admin_client, unprivileged_client):
+    """
+    Running VMs leased to tests which do not change the VM, see warm_fedora_vm.
+    """
+    for pool_namespace in create_ns(
+        name="warm-vm-pool",
+        unprivileged_client=unprivileged_client,
+        admin_client=admin_client,
+        delete_timeout=TIMEOUT_6MIN,
+    ):
+        with WarmVMPool(
+            namespace=pool_namespace.name,
+            client=unprivileged_client,
+            size=request.config.getoption("warm_vm_pool_size"),
+        ) as pool:
+            yield pool
+
+
+@pytest.fixture()
+def warm_fedora_vm(request, warm_vm_pool):
+    """
+    Running Fedora VM with SSH, for tests which do not change the VM; the VM is not in the test `namespace`.
+
+    The VM is verified and reset when the test ends. It is recycled if the test failed, is marked destructive or
+    called warm_vm_pool.mark_dirty(vm=warm_fedora_vm).
+    """
+    tests_failed = request.session.testsfailed
+    vm = warm_vm_pool.lease(flavor=OS_FLAVOR_FEDORA)
+    yield vm
+    warm_vm_pool.release(
+        vm=vm,
+        flavor=OS_FLAVOR_FEDORA,
+        dirty=request.session.testsfailed > tests_failed or bool(request.node.get_closest_marker("destructive")),
+    )
+
+
 @pytest.fixture(scope="session")
 def leftovers_cleanup(admin_client, cnv_tests_utilities_namespace, identity_provider_config):
     LOGGER.info("Checking for leftover resources")
@@ -684,6 +767,13 @@ def leftovers_cleanup(admin_client, cnv_tests_utilities_namespace, identity_prov
         if resource_ and resource_.exists:
             resource_.delete(wait=True)
 
+    #  Delete resources the background teardown of a previous run did not delete
+    delete_reaper_leftovers(client=admin_client)
+
+    #  Delete golden images kept by previous runs which were not used recently
+    if py_config.get("golden_image_reuse"):
+        delete_stale_golden_images(client=admin_client, namespace=py_config["golden_images_namespace"])
+
     #  Remove leftovers from OAuth
     if not identity_provider_config:
         # When running CI (k8s) OAuth is not exists on the cluster.
@@ -1413,6 +1503,12 @@ def hyperconverged_ovs_annotations_enabled_scope_session(
 
 @pytest.fixture(scope="session")
 def cluster_storage_classes(admin_client):
+    storage_classes_cache = get_resource_cache(client=admin_client, resource_class=StorageClass)
+    if storage_classes_cache:
+        return [
+            StorageClass(client=admin_client, name=raw_storage_class["metadata"]["name"])
+            for raw_storage_class in storage_classes_cache.list()
+        ]
     return list(StorageClass.get(dyn_client=admin_client))
 
 
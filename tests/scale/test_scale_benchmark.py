@@ -12,9 +12,6 @@ from kubernetes.dynamic.exceptions import ForbiddenError
 from ocp_resources.data_source import DataSource
 from ocp_resources.datavolume import DataVolume
 from ocp_resources.template import Template
-from ocp_resources.virtual_machine_instance_migration import (
-    VirtualMachineInstanceMigration,
-)
 from pyhelper_utils.shell import run_command
 from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 
@@ -26,8 +23,8 @@ from tests.os_params import (
     WINDOWS_LATEST,
     WINDOWS_LATEST_LABELS,
 )
+from utilities.bulk_operations import run_bulk_operation
 from utilities.constants import (
-    NODE_STR,
     OS_FLAVOR_FEDORA,
     OS_FLAVOR_RHEL,
     OS_FLAVOR_WINDOWS,
@@ -41,19 +38,14 @@ from utilities.infra import (
     get_artifactory_config_map,
     get_artifactory_secret,
 )
+from utilities.migration_orchestrator import MigrationOrchestrator
 from utilities.must_gather import run_must_gather
-from utilities.storage import generate_data_source_dict, get_test_artifact_server_url
-from utilities.virt import (
-    VirtualMachineForTestsFromTemplate,
-    verify_vm_migrated,
-    wait_for_migration_finished,
-)
+from utilities.storage import generate_data_source_dict, get_test_artifact_server_url, import_data_volumes
+from utilities.virt import VirtualMachineForTestsFromTemplate
 
 LOGGER = logging.getLogger(__name__)
 OCS = "ocs"
 NFS = "nfs"
-VMI_SOURCE_POD_STR = "vmi_source_pod"
-MIGRATION_INSTANCE_STR = "migration_instance"
 
 SCALE_STORAGE_TYPES = {
     OCS: StorageClassNames.CEPH_RBD_VIRTUALIZATION,
@@ -94,15 +86,17 @@ def all_vms_running(vms):
 
 
 def delete_resources(resources):
-    deleted_resources = []
-    for _resource in resources:
+    def _delete(_resource):
         try:
-            _resource.delete()
-            deleted_resources.append(_resource)
+            return _resource.delete()
         except ForbiddenError:
-            pass
-    for _resource in deleted_resources:
-        _resource.wait_deleted()
+            return False
+
+    deleted = run_bulk_operation(func=_delete, resources=resources)
+    run_bulk_operation(
+        func=lambda _resource: _resource.wait_deleted(),
+        resources=[_resource for _resource, _deleted in zip(resources, deleted) if _deleted],
+    )
 
 
 def save_must_gather_logs(must_gather_image_url):
@@ -125,13 +119,6 @@ def failure_finalizer(vms_list, must_gather_image_url):
     )
 
 
-def start_live_migration(vm):
-    with VirtualMachineInstanceMigration(
-        name=vm.name, namespace=vm.namespace, vmi_name=vm.vmi.name, teardown=False
-    ) as migration:
-        return migration
-
-
 @pytest.fixture(scope="class")
 def fail_if_param_vms_zero(expected_num_of_vms):
     if expected_num_of_vms == 0:
@@ -272,10 +259,8 @@ def golden_images_scale_dvs(request, keep_resources, admin_client, golden_images
                 secret=artifactory_secret,
                 cert_configmap=artifactory_config_map.name,
             )
-            golden_images_scale_dv.deploy()
             dvs_list.append(golden_images_scale_dv)
-    for dv in dvs_list:
-        dv.wait_for_status(status=DataVolume.Status.SUCCEEDED, timeout=TIMEOUT_30MIN)
+    import_data_volumes(dvs=dvs_list)
     yield dvs_list
 
     cleanup_artifactory_secret_and_config_map(
@@ -351,19 +336,6 @@ def scale_vms(
     yield vms_batches_list
 
 
-@pytest.fixture(scope="class")
-def vm_migration_info(scale_vms):
-    vm_migration_info = {}
-    for batch in scale_vms:
-        for vm in batch:
-            vm_migration_info[vm.name] = {
-                NODE_STR: vm.vmi.node,
-                VMI_SOURCE_POD_STR: vm.vmi.virt_launcher_pod,
-                MIGRATION_INSTANCE_STR: start_live_migration(vm=vm),
-            }
-    return vm_migration_info
-
-
 @pytest.fixture(scope="class")
 def all_vms_objects(scale_vms):
     all_vms_objects = []
@@ -381,9 +353,7 @@ class TestScale:
         scale_vms,
     ):
         log_nodes_load_data()
-        for batch in scale_vms:
-            for vm in batch:
-                vm.deploy()
+        run_bulk_operation(func=lambda vm: vm.deploy(), resources=[vm for batch in scale_vms for vm in batch])
 
     @pytest.mark.dependency(
         name="test_start_vms",
@@ -441,20 +411,14 @@ class TestScale:
     @pytest.mark.polarion("CNV-8993")
     def test_mass_vm_live_migration(
         self,
+        admin_client,
         skip_if_not_run_live_migration,
-        scale_vms,
-        vm_migration_info,
+        all_vms_objects,
     ):
-        for batch in scale_vms:
-            for vm in batch:
-                wait_for_migration_finished(
-                    vm=vm,
-                    migration=vm_migration_info[vm.name][MIGRATION_INSTANCE_STR],
-                )
-                verify_vm_migrated(
-                    vm=vm,
-                    node_before=vm_migration_info[vm.name][NODE_STR],
-                )
+        migrations_result = MigrationOrchestrator(vms=all_vms_objects, max_attempts=1, admin_client=admin_client).run()
+        assert not migrations_result.failed, (
+            f"Some VMs failed to migrate - {migrations_result.failed}, errors: {migrations_result.errors}"
+        )
 
     @pytest.mark.order(after="test_scale_vms_running_stability")
     @pytest.mark.polarion("CNV-8883")
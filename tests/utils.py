@@ -22,6 +22,7 @@ from ocp_resources.virtual_machine_instance_migration import VirtualMachineInsta
 from pyhelper_utils.shell import run_ssh_commands
 from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 
+from utilities.bulk_operations import BULK_MAX_WORKERS, run_bulk_operation
 from utilities.constants import (
     DISK_SERIAL,
     HCO_DEFAULT_CPU_MODEL_KEY,
@@ -34,6 +35,7 @@ from utilities.constants import (
     TIMEOUT_30MIN,
     Images,
 )
+from utilities.exceptions import BulkOperationError
 from utilities.hco import ResourceEditorValidateHCOReconcile
 from utilities.infra import (
     ExecCommandOnPod,
@@ -47,6 +49,7 @@ from utilities.virt import (
     VirtualMachineForTestsFromTemplate,
     fedora_vm_body,
     get_created_migration_job,
+    get_fedora_vm_image,
     prepare_cloud_init_user_data,
     running_vm,
     wait_for_migration_finished,
@@ -69,10 +72,13 @@ def create_vms(
     client=None,
     ssh=True,
     node_selector_labels=None,
+    max_workers=BULK_MAX_WORKERS,
 ):
     """
     Create n number of fedora vms.
 
+    The VMs bodies are rendered from a single image lookup, and the VMs are deployed concurrently.
+
     Args:
         name_prefix (str): prefix to be used to name virtualmachines
         namespace_name (str): Namespace to be used for vm creation
@@ -80,24 +86,43 @@ def create_vms(
         node_selector_labels (str): Labels for node selector.
         client (DynamicClient): DynamicClient object
         ssh (bool): enable SSH on the VM
+        max_workers (int): maximum number of concurrent deployments
 
     Returns:
-        list: List of VirtualMachineForTests
+        list: List of VirtualMachineForTests, ordered by index
+
+    Raises:
+        BulkOperationError: if any VM deployment failed, after deleting the deployed VMs
     """
+    image = get_fedora_vm_image()
     vms_list = []
     for idx in range(vm_count):
         vm_name = f"{name_prefix}-{idx}"
-        with VirtualMachineForTests(
-            name=vm_name,
-            namespace=namespace_name,
-            body=fedora_vm_body(name=vm_name),
-            node_selector_labels=node_selector_labels,
-            teardown=False,
-            run_strategy=VirtualMachine.RunStrategy.ALWAYS,
-            ssh=ssh,
-            client=client,
-        ) as vm:
-            vms_list.append(vm)
+        vms_list.append(
+            VirtualMachineForTests(
+                name=vm_name,
+                namespace=namespace_name,
+                body=fedora_vm_body(name=vm_name, image=image),
+                node_selector_labels=node_selector_labels,
+                teardown=False,
+                run_strategy=VirtualMachine.RunStrategy.ALWAYS,
+                ssh=ssh,
+                client=client,
+            )
+        )
+
+    try:
+        run_bulk_operation(func=lambda vm: vm.deploy(), resources=vms_list, max_workers=max_workers)
+    except BulkOperationError:
+        failed_vms = [vm for vm in vms_list if not vm.exists]
+        LOGGER.error(f"Failed to deploy VMs {[vm.name for vm in failed_vms]}, deleting the deployed VMs")
+        run_bulk_operation(
+            func=lambda vm: vm.clean_up(),
+            resources=[vm for vm in vms_list if vm not in failed_vms],
+            max_workers=max_workers,
+        )
+        raise
+
     return vms_list
 
 
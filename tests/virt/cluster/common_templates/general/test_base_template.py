@@ -18,6 +18,8 @@ from pytest_testconfig import config as py_config
 from tests.os_params import FEDORA_LATEST_LABELS
 from tests.virt.cluster.common_templates.constants import HYPERV_FEATURES_LABELS_VM_YAML
 from utilities.constants import DATA_SOURCE_NAME, DATA_SOURCE_NAMESPACE, Images
+from utilities.exceptions import TemplateProcessingError
+from utilities.template_processing import process_template_dict
 
 pytestmark = [pytest.mark.post_upgrade, pytest.mark.sno]
 
@@ -562,3 +564,32 @@ def test_suggested_image_annotation_exists(os_base_templates, annotation_list):
         f"{template.ApiGroup.TEMPLATE_KUBEVIRT_IO}/{annotation}, was not found in {failed_templates_dict[annotation]}"
         for annotation in failed_templates_dict
     )
+
+
+@pytest.mark.s390x
+def test_common_templates_local_processing(admin_client, base_templates):
+    """Verify common templates processed locally match the processedtemplates API result"""
+    mismatched_templates = {}
+    for template in base_templates:
+        template_dict = template.instance.to_dict()
+        # Generated parameters get the same value locally and on the server
+        parameters = {
+            parameter["name"]: f"{template.name}-{parameter['name'].lower().replace('_', '-')}"
+            for parameter in template_dict["parameters"]
+            if parameter.get("generate")
+        }
+        # Same as Template.process
+        template_dict["objects"][0]["metadata"]["labels"]["vm.kubevirt.io/template.namespace"] = template_dict[
+            "metadata"
+        ]["namespace"]
+        try:
+            local_objects = process_template_dict(template=template_dict, parameters=parameters)
+        except TemplateProcessingError as exp:
+            mismatched_templates[template.name] = f"local processing failed: {exp}"
+            continue
+
+        server_objects = template.process(client=admin_client, **parameters)
+        if local_objects != server_objects:
+            mismatched_templates[template.name] = {"local": local_objects, "server": server_objects}
+
+    assert not mismatched_templates, f"Local template processing differs from the server: {mismatched_templates}"
@@ -27,11 +27,12 @@ pytestmark = [pytest.mark.longevity, pytest.mark.special_infra]
     ],
     indirect=True,
 )
-def test_migration_storm_linux_vms(linux_vms_with_pids):
+def test_migration_storm_linux_vms(admin_client, linux_vms_with_pids):
     run_migration_loop(
         iterations=int(py_config["linux_iterations"]),
         vms_with_pids=linux_vms_with_pids,
         os_type=LINUX_OS_PREFIX,
+        admin_client=admin_client,
     )
 
 
@@ -46,11 +47,12 @@ def test_migration_storm_linux_vms(linux_vms_with_pids):
     ],
     indirect=True,
 )
-def test_migration_storm_windows_vms(windows_vms_with_pids):
+def test_migration_storm_windows_vms(admin_client, windows_vms_with_pids):
     run_migration_loop(
         iterations=int(py_config["windows_iterations"]),
         vms_with_pids=windows_vms_with_pids,
         os_type=WINDOWS_OS_PREFIX,
+        admin_client=admin_client,
     )
 
 
@@ -65,10 +67,11 @@ def test_migration_storm_windows_vms(windows_vms_with_pids):
     ],
     indirect=True,
 )
-def test_migration_storm_wsl2_vms(wsl2_vms_with_pids):
+def test_migration_storm_wsl2_vms(admin_client, wsl2_vms_with_pids):
     run_migration_loop(
         iterations=int(py_config["windows_iterations"]),
         vms_with_pids=wsl2_vms_with_pids,
         os_type=WINDOWS_OS_PREFIX,
+        admin_client=admin_client,
         wsl2_guest=True,
     )
@@ -16,13 +16,15 @@ from tests.virt.cluster.longevity_tests.constants import (
     WINDOWS_OS_PREFIX,
 )
 from tests.virt.utils import migrate_and_verify_multi_vms, verify_wsl2_guest_works
-from utilities.constants import TCP_TIMEOUT_30SEC, TIMEOUT_5MIN, TIMEOUT_30MIN, TIMEOUT_40MIN, TIMEOUT_60MIN, WIN_10
+from utilities.bulk_operations import run_bulk_operation
+from utilities.constants import TCP_TIMEOUT_30SEC, TIMEOUT_5MIN, TIMEOUT_40MIN, TIMEOUT_60MIN, WIN_10
 from utilities.infra import (
     cleanup_artifactory_secret_and_config_map,
     get_artifactory_config_map,
     get_artifactory_secret,
 )
-from utilities.storage import get_test_artifact_server_url
+from utilities.migration_orchestrator import MIGRATION_MAX_ATTEMPTS
+from utilities.storage import get_test_artifact_server_url, import_data_volumes
 from utilities.virt import (
     VirtualMachineForTests,
     VirtualMachineForTestsFromTemplate,
@@ -41,13 +43,13 @@ def decorate_log(msg):
     return f"{msg_decor}{msg}{msg_decor}"
 
 
-def run_migration_loop(iterations, vms_with_pids, os_type, wsl2_guest=False):
+def run_migration_loop(iterations, vms_with_pids, os_type, admin_client, wsl2_guest=False):
     for iteration in range(iterations):
         LOGGER.info(decorate_log(f"Iteration {iteration + 1}"))
 
         LOGGER.info(decorate_log("VM Migration"))
         vm_list = [vms_with_pids[vm_name]["vm"] for vm_name in vms_with_pids]
-        migrate_and_verify_multi_vms(vm_list=vm_list)
+        migrate_and_verify_multi_vms(vm_list=vm_list, admin_client=admin_client, max_attempts=MIGRATION_MAX_ATTEMPTS)
 
         LOGGER.info(decorate_log("PID check"))
         verify_pid_after_migrate_multi_vms(vms_with_pids=vms_with_pids, os_type=os_type)
@@ -252,23 +254,21 @@ def wait_windows_reboot_multi_vm(vm_list):
 
 
 def deploy_and_start_vms(vm_list):
+    def _deploy_and_start(_vm):
+        _vm.deploy()
+        _vm.start()
+
     try:
-        for vm in vm_list:
-            vm.deploy()
-            vm.start()
+        run_bulk_operation(func=_deploy_and_start, resources=vm_list)
         yield vm_list
     finally:
-        for vm in vm_list:
-            vm.clean_up()
+        run_bulk_operation(func=lambda _vm: _vm.clean_up(), resources=vm_list)
 
 
 def deploy_and_wait_for_dvs(dv_dict):
     dv_list = dv_dict.values()
     try:
-        for dv in dv_list:
-            dv.deploy()
-        for dv in dv_list:
-            dv.wait_for_dv_success(timeout=TIMEOUT_30MIN)
+        import_data_volumes(dvs=list(dv_list))
         yield dv_dict
     finally:
         for dv in dv_list:
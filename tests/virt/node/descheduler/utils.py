@@ -10,6 +10,7 @@ from tests.virt.node.descheduler.constants import (
     DESCHEDULING_INTERVAL_120SEC,
     RUNNING_PING_PROCESS_NAME_IN_VM,
 )
+from utilities.bulk_operations import run_bulk_operation
 from utilities.constants import (
     TIMEOUT_1MIN,
     TIMEOUT_5MIN,
@@ -21,6 +22,7 @@ from utilities.virt import (
     VirtualMachineForTests,
     fedora_vm_body,
     fetch_pid_from_linux_vm,
+    get_fedora_vm_image,
     running_vm,
     start_and_fetch_processid_on_linux_vm,
 )
@@ -247,22 +249,24 @@ def deploy_vms(
     vm_affinity=None,
 ):
     vms = []
+    image = get_fedora_vm_image()
     for vm_index in range(vm_count):
         vm_name = f"vm-{vm_prefix}-{vm_index}"
-        vm = VirtualMachineForDeschedulerTest(
-            name=vm_name,
-            namespace=namespace_name,
-            client=client,
-            cpu_requests=deployment_size["cpu"],
-            memory_guest=deployment_size["memory"].bytes,
-            cpu_model=cpu_model,
-            descheduler_eviction=descheduler_eviction,
-            body=fedora_vm_body(name=vm_name),
-            node_selector_labels=node_selector_labels,
-            vm_affinity=vm_affinity,
+        vms.append(
+            VirtualMachineForDeschedulerTest(
+                name=vm_name,
+                namespace=namespace_name,
+                client=client,
+                cpu_requests=deployment_size["cpu"],
+                memory_guest=deployment_size["memory"].bytes,
+                cpu_model=cpu_model,
+                descheduler_eviction=descheduler_eviction,
+                body=fedora_vm_body(name=vm_name, image=image),
+                node_selector_labels=node_selector_labels,
+                vm_affinity=vm_affinity,
+            )
         )
-        vm.deploy()
-        vms.append(vm)
+    run_bulk_operation(func=lambda vm: vm.deploy(), resources=vms)
 
     for vm in vms:
         running_vm(vm=vm)
@@ -42,17 +42,15 @@ from utilities.hco import (
     wait_for_hco_conditions,
 )
 from utilities.infra import ExecCommandOnPod, get_pod_by_name_prefix
+from utilities.migration_orchestrator import MigrationOrchestrator
 from utilities.virt import (
     VirtualMachineForTests,
     fetch_pid_from_linux_vm,
     fetch_pid_from_windows_vm,
     kill_processes_by_name_linux,
-    migrate_vm_and_verify,
     pause_optional_migrate_unpause_and_check_connectivity,
     start_and_fetch_processid_on_linux_vm,
     start_and_fetch_processid_on_windows_vm,
-    verify_vm_migrated,
-    wait_for_migration_finished,
     wait_for_updated_kv_value,
 )
 
@@ -201,29 +199,19 @@ def start_stress_on_vm(vm, stress_command):
     )
 
 
-def migrate_and_verify_multi_vms(vm_list):
-    vms_dict = {}
-    failed_migrations_list = []
-
-    for vm in vm_list:
-        vms_dict[vm.name] = {
-            "node_before": vm.vmi.node,
-            "vm_mig": migrate_vm_and_verify(vm=vm, wait_for_migration_success=False),
-        }
-
-    for vm in vm_list:
-        migration = vms_dict[vm.name]["vm_mig"]
-        wait_for_migration_finished(vm=vm, migration=migration)
-        migration.clean_up()
-
-    for vm in vm_list:
-        vm_sources = vms_dict[vm.name]
-        try:
-            verify_vm_migrated(vm=vm, node_before=vm_sources["node_before"])
-        except (AssertionError, TimeoutExpiredError):
-            failed_migrations_list.append(vm.name)
+def migrate_and_verify_multi_vms(vm_list, admin_client, max_attempts=1):
+    """
+    Migrate VMs concurrently and verify they migrated.
 
-    assert not failed_migrations_list, f"Some VMs failed to migrate - {failed_migrations_list}"
+    Args:
+        vm_list (list): VMs to migrate
+        admin_client (DynamicClient): admin client
+        max_attempts (int): migration attempts per VM; only loops driving a workload should retry failed migrations
+    """
+    migrations_result = MigrationOrchestrator(vms=vm_list, admin_client=admin_client, max_attempts=max_attempts).run()
+    assert not migrations_result.failed, (
+        f"Some VMs failed to migrate - {migrations_result.failed}, errors: {migrations_result.errors}"
+    )
 
 
 # AAQ
@@ -0,0 +1,207 @@
+"""
+Count the Kubernetes API calls made through the DynamicClient (used by ocp_resources), with their latency,
+attributed to the running test and fixture.
+"""
+
+import bisect
+import functools
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Any
+
+from kubernetes.dynamic.client import DynamicClient
+
+LOGGER = logging.getLogger(__name__)
+
+API_CALLS_FILE_NAME = "api-calls.json"
+# Latency histogram upper bounds, in seconds; the last bucket holds all slower calls
+LATENCY_BUCKETS = [0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+SESSION_SCOPE = "session"
+NAMESPACE_SUBRESOURCES = ("status", "finalize")
+
+
+class ApiCallsRecorder:
+    """
+    Record API calls per test and per phase (setup, call, teardown) or fixture.
+
+    Calls made from other threads (bulk operations, resource caches) are attributed to the running test as well.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.test_name = SESSION_SCOPE
+        self.phase = SESSION_SCOPE
+        self.fixtures: list[str] = []
+        # {test name: {(phase or fixture, verb, kind, namespace): call stats}}
+        self.calls: dict[str, dict[tuple[str, str, str, str], dict[str, Any]]] = defaultdict(dict)
+
+    @property
+    def owner(self) -> str:
+        return f"fixture:{self.fixtures[-1]}" if self.fixtures else self.phase
+
+    def record(self, verb: str, kind: str, namespace: str, latency: float) -> None:
+        with self._lock:
+            stats = self.calls[self.test_name].setdefault(
+                (self.owner, verb, kind, namespace),
+                {"count": 0, "latency": 0.0, "max_latency": 0.0, "histogram": [0] * (len(LATENCY_BUCKETS) + 1)},
+            )
+            stats["count"] += 1
+            stats["latency"] += latency
+            stats["max_latency"] = max(stats["max_latency"], latency)
+            stats["histogram"][bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def test_report(self, test_name: str) -> dict[str, Any]:
+        """
+        Args:
+            test_name (str): test node id
+
+        Returns:
+            dict: total calls and latency of the test, and its calls by phase or fixture, verb, kind and namespace,
+                most frequent first
+        """
+        with self._lock:
+            test_calls = dict(self.calls.get(test_name, {}))
+
+        calls = [
+            {
+                "owner": owner,
+                "verb": verb,
+                "kind": kind,
+                "namespace": namespace,
+                "count": stats["count"],
+                "latency": round(stats["latency"], 3),
+                "max_latency": round(stats["max_latency"], 3),
+                "latency_histogram": {
+                    f"le_{bucket}": count
+                    for bucket, count in zip([*LATENCY_BUCKETS, "inf"], stats["histogram"])
+                    if count
+                },
+            }
+            for (owner, verb, kind, namespace), stats in test_calls.items()
+        ]
+        return {
+            "total_calls": sum(call["count"] for call in calls),
+            "total_latency": round(sum(stats["latency"] for stats in test_calls.values()), 3),
+            "calls": sorted(calls, key=lambda call: call["count"], reverse=True),
+        }
+
+    def fixtures_report(self) -> dict[str, dict[str, Any]]:
+        """
+        Returns:
+            dict: total calls and latency per phase or fixture over the whole session, chattiest first
+        """
+        owners: dict[str, dict[str, Any]] = defaultdict(lambda: {"count": 0, "latency": 0.0})
+        with self._lock:
+            for test_calls in self.calls.values():
+                for (owner, _, _, _), stats in test_calls.items():
+                    owners[owner]["count"] += stats["count"]
+                    owners[owner]["latency"] += stats["latency"]
+
+        return {
+            owner: {"count": stats["count"], "latency": round(stats["latency"], 3)}
+            for owner, stats in sorted(owners.items(), key=lambda owner: owner[1]["count"], reverse=True)
+        }
+
+
+API_CALLS_RECORDER = ApiCallsRecorder()
+
+
+def parse_api_path(path: str, watch: bool = False, method: str = "get") -> tuple[str, str, str]:
+    """
+    Get the verb, resource kind and namespace of an API request.
+
+    Args:
+        path (str): request path, e.g. /apis/kubevirt.io/v1/namespaces/my-ns/virtualmachines/my-vm
+        watch (bool): True if this is a watch request
+        method (str): HTTP method
+
+    Returns:
+        tuple: verb (get, list, watch, post, put, patch, delete), resource plural name (with subresource, if any)
+            or "discovery", namespace (empty for cluster scoped resources)
+    """
+    segments = path.split("?")[0].strip("/").split("/")
+    if segments[0] == "api":
+        resource_segments = segments[2:]
+    elif segments[0] == "apis":
+        resource_segments = segments[3:]
+    else:
+        resource_segments = []
+
+    namespace = ""
+    if (
+        len(resource_segments) > 2
+        and resource_segments[0] == "namespaces"
+        and resource_segments[2] not in NAMESPACE_SUBRESOURCES
+    ):
+        namespace = resource_segments[1]
+        resource_segments = resource_segments[2:]
+
+    kind = "/".join(resource_segments[:1] + resource_segments[2:3]) or "discovery"
+    verb = method.lower()
+    if verb == "get" and len(resource_segments) == 1:
+        verb = "watch" if watch else "list"
+
+    return verb, kind, namespace
+
+
+def enable_api_call_accounting() -> None:
+    """
+    Record every DynamicClient request in API_CALLS_RECORDER.
+    """
+    if getattr(DynamicClient.request, "api_call_accounting", False):
+        return
+
+    original_request = DynamicClient.request
+
+    @functools.wraps(original_request)
+    def _request(self, method, path, body=None, **params):
+        start_time = time.monotonic()
+        try:
+            return original_request(self, method, path, body=body, **params)
+        finally:
+            verb, kind, namespace = parse_api_path(path=path, watch=bool(params.get("watch")), method=method)
+            API_CALLS_RECORDER.record(verb=verb, kind=kind, namespace=namespace, latency=time.monotonic() - start_time)
+
+    _request.api_call_accounting = True  # type: ignore[attr-defined]
+    DynamicClient.request = _request  # type: ignore[method-assign]
+    LOGGER.info("API call accounting is enabled")
+
+
+def set_api_calls_test(test_name: str) -> None:
+    API_CALLS_RECORDER.test_name = test_name
+    API_CALLS_RECORDER.fixtures.clear()
+    set_api_calls_phase(phase="setup")
+
+
+def set_api_calls_phase(phase: str) -> None:
+    API_CALLS_RECORDER.phase = phase
+
+
+def push_api_calls_fixture(fixture_name: str) -> None:
+    API_CALLS_RECORDER.fixtures.append(fixture_name)
+
+
+def pop_api_calls_fixture() -> None:
+    if API_CALLS_RECORDER.fixtures:
+        API_CALLS_RECORDER.fixtures.pop()
+
+
+def get_api_calls_test_report(test_name: str) -> dict[str, Any]:
+    return API_CALLS_RECORDER.test_report(test_name=test_name)
+
+
+def get_api_calls_session_report() -> str:
+    """
+    Returns:
+        str: JSON report of the calls per phase or fixture, and the calls made outside of tests
+    """
+    return json.dumps(
+        {
+            "fixtures": API_CALLS_RECORDER.fixtures_report(),
+            SESSION_SCOPE: API_CALLS_RECORDER.test_report(test_name=SESSION_SCOPE),
+        },
+        indent=2,
+    )
@@ -0,0 +1,81 @@
+"""
+Offline benchmarks fixtures: resources are built with a stub client, so no cluster is needed.
+"""
+
+import os
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Callable
+
+import paramiko
+import pytest
+from pytest_testconfig import config as py_config
+
+from utilities.constants import CNV_VM_SSH_KEY_PATH, OS_FLAVOR_FEDORA, OS_FLAVOR_RHEL
+
+
+class StubResources:
+    @staticmethod
+    def search(group: str | None = None, kind: str | None = None, **kwargs: Any) -> list[SimpleNamespace]:
+        return [SimpleNamespace(api_version="v1", group_version=f"{group}/v1" if group else "v1")]
+
+
+class StubDynamicClient:
+    """
+    Client which only resolves resources API versions, enough to build resources bodies.
+    """
+
+    resources = StubResources()
+
+
+@pytest.fixture(scope="session")
+def stub_client():
+    return StubDynamicClient()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def offline_vm_configuration(tmp_path_factory):
+    ssh_key_path = os.path.join(tmp_path_factory.mktemp(basename="ssh"), "id_rsa")
+    paramiko.RSAKey.generate(bits=2048).write_private_key_file(filename=ssh_key_path)
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv(CNV_VM_SSH_KEY_PATH, ssh_key_path)
+        monkeypatch.setitem(
+            py_config,
+            "os_login_param",
+            {
+                os_flavor: {"username": "benchmark", "password": "benchmark"}
+                for os_flavor in (OS_FLAVOR_FEDORA, OS_FLAVOR_RHEL)
+            },
+        )
+        yield
+
+
+@pytest.fixture()
+def vm_body_benchmark(benchmark):
+    """
+    Benchmark a VM body build, and record its memory allocations (tracemalloc) in the benchmark extra info.
+
+    Returns:
+        Callable: gets the build function and the allowed allocations peak (KiB) of a single build
+    """
+
+    def _vm_body_benchmark(build: Callable[[], Any], max_allocated_peak_kib: int) -> None:
+        # Warm up, so one time initializations (compiled templates, imports) are not counted
+        build()
+        tracemalloc.start()
+        try:
+            build()
+            allocated_retained, allocated_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        allocated_peak_kib = allocated_peak // 1024
+        benchmark.extra_info["allocated_peak_kib"] = allocated_peak_kib
+        benchmark.extra_info["allocated_retained_kib"] = allocated_retained // 1024
+        benchmark(build)
+        assert allocated_peak_kib <= max_allocated_peak_kib, (
+            f"VM body build allocations peak {allocated_peak_kib} KiB exceeds {max_allocated_peak_kib} KiB"
+        )
+
+    return _vm_body_benchmark
@@ -0,0 +1,136 @@
+"""
+VM body generation benchmarks, for the main VM flavors.
+
+A VM body is the resource dict sent to the cluster: VirtualMachineForTests.to_dict, or libs.vm BaseVirtualMachine
+(VMSpec conversion and to_dict).
+test_vm_spec_to_dict benchmarks the VMSpec conversion alone, with the secondary networks of a network tests VM.
+Each benchmark also fails if a single body build allocates more than its budget.
+"""
+
+import pytest
+
+from libs.vm.factory import base_vmspec
+from libs.vm.spec import CPU, CloudInitNoCloud, Interface, Memory, Multus, NetBinding, Network
+from libs.vm.vm import BaseVirtualMachine, cloudinitdisk_storage, containerdisk_storage
+from utilities.constants import OS_FLAVOR_FEDORA, OS_FLAVOR_RHEL
+from utilities.network import compose_cloud_init_data_dict
+from utilities.virt import VirtualMachineForTests, fedora_vm_body
+
+BENCHMARK_NAMESPACE = "benchmark"
+FEDORA_IMAGE = f"quay.io/containerdisks/fedora:41@sha256:{'0' * 64}"
+RHEL_IMAGE = f"registry.redhat.io/rhel9/rhel-guest-image:9.5@sha256:{'1' * 64}"
+SECONDARY_NETWORKS = {f"nad-{index}": f"nad-{index}" for index in range(1, 3)}
+LIBS_SECONDARY_NETWORKS_COUNT = 8
+
+
+def fedora_container_disk_vm(client):
+    vm = VirtualMachineForTests(
+        name="fedora-vm",
+        namespace=BENCHMARK_NAMESPACE,
+        client=client,
+        body=fedora_vm_body(name="fedora-vm", image=FEDORA_IMAGE),
+    )
+    vm.to_dict()
+    return vm.res
+
+
+def rhel_data_volume_template_vm(client):
+    vm = VirtualMachineForTests(
+        name="rhel-vm",
+        namespace=BENCHMARK_NAMESPACE,
+        client=client,
+        os_flavor=OS_FLAVOR_RHEL,
+        cpu_cores=2,
+        memory_guest="4Gi",
+        data_volume_template={
+            "metadata": {"name": "rhel-dv"},
+            "spec": {
+                "source": {"registry": {"url": f"docker://{RHEL_IMAGE}"}},
+                "storage": {"accessModes": ["ReadWriteMany"], "resources": {"requests": {"storage": "30Gi"}}},
+            },
+        },
+    )
+    vm.to_dict()
+    return vm.res
+
+
+def fedora_secondary_networks_vm(client):
+    vm = VirtualMachineForTests(
+        name="fedora-networks-vm",
+        namespace=BENCHMARK_NAMESPACE,
+        client=client,
+        os_flavor=OS_FLAVOR_FEDORA,
+        body=fedora_vm_body(name="fedora-networks-vm", image=FEDORA_IMAGE),
+        interfaces=sorted(SECONDARY_NETWORKS),
+        networks=SECONDARY_NETWORKS,
+        cloud_init_data=compose_cloud_init_data_dict(
+            network_data={
+                "ethernets": {
+                    f"eth{index}": {"addresses": [f"10.200.{index}.1/24"]}
+                    for index in range(1, len(SECONDARY_NETWORKS) + 1)
+                }
+            }
+        ),
+    )
+    vm.to_dict()
+    return vm.res
+
+
+def libs_fedora_vm_spec():
+    spec = base_vmspec()
+    vmi_spec = spec.template.spec
+    vmi_spec.domain.cpu = CPU(cores=1)
+    vmi_spec.domain.memory = Memory(guest="1Gi")
+    container_disk, container_disk_volume = containerdisk_storage(image=FEDORA_IMAGE)
+    cloud_init_disk, cloud_init_volume = cloudinitdisk_storage(
+        data=CloudInitNoCloud(networkData="", userData="#cloud-config\n")
+    )
+    vmi_spec.domain.devices.disks = [container_disk, cloud_init_disk]
+    vmi_spec.volumes = [container_disk_volume, cloud_init_volume]
+    return spec
+
+
+def libs_secondary_networks_vm_spec():
+    spec = libs_fedora_vm_spec()
+    vmi_spec = spec.template.spec
+    vmi_spec.domain.devices.interfaces = [Interface(name="default", masquerade={})]
+    vmi_spec.networks = [Network(name="default", pod={})]
+    for index in range(1, LIBS_SECONDARY_NETWORKS_COUNT + 1):
+        vmi_spec.domain.devices.interfaces.append(
+            Interface(name=f"nad-{index}", bridge={}, binding=NetBinding(name="l2bridge"))
+        )
+        vmi_spec.networks.append(Network(name=f"nad-{index}", multus=Multus(networkName=f"nad-{index}")))
+    return spec
+
+
+def libs_fedora_vm(client):
+    vm = BaseVirtualMachine(
+        namespace=BENCHMARK_NAMESPACE,
+        name="libs-fedora-vm",
+        spec=libs_fedora_vm_spec(),
+        os_distribution=OS_FLAVOR_FEDORA,
+        client=client,
+    )
+    vm.to_dict()
+    return vm.res
+
+
+@pytest.mark.parametrize(
+    "build_vm_body, max_allocated_peak_kib",
+    [
+        pytest.param(fedora_container_disk_vm, 48, id="fedora-container-disk"),
+        pytest.param(rhel_data_volume_template_vm, 48, id="rhel-data-volume-template"),
+        pytest.param(fedora_secondary_networks_vm, 48, id="fedora-secondary-networks"),
+        pytest.param(libs_fedora_vm, 12, id="libs-fedora"),
+    ],
+)
+def test_vm_body(vm_body_benchmark, stub_client, build_vm_body, max_allocated_peak_kib):
+    vm_body_benchmark(
+        build=lambda: build_vm_body(client=stub_client),
+        max_allocated_peak_kib=max_allocated_peak_kib,
+    )
+
+
+def test_vm_spec_to_dict(vm_body_benchmark):
+    spec = libs_secondary_networks_vm_spec()
+    vm_body_benchmark(build=spec.to_dict, max_allocated_peak_kib=8)
@@ -0,0 +1,35 @@
+"""
+YAML template render benchmarks, for the Fedora VM manifest used by fedora_vm_body.
+
+jinja2-safe-load renders and parses the template on every call, as generate_dict_from_yaml_template did before
+templates were compiled; compiled renders the template from the compiled templates registry.
+"""
+
+import jinja2
+import pytest
+import yaml
+
+from utilities.virt import get_compiled_yaml_template, get_fedora_vm_manifest
+
+TEMPLATE_VARIABLES = {"name": "fedora-vm", "image": f"quay.io/containerdisks/fedora:41@sha256:{'0' * 64}"}
+
+
+def jinja2_safe_load_render(data):
+    return yaml.safe_load(jinja2.Template(data).render(**TEMPLATE_VARIABLES))
+
+
+def compiled_render(data):
+    return get_compiled_yaml_template(data=data).render(**TEMPLATE_VARIABLES)
+
+
+@pytest.mark.benchmark(group="fedora-vm-template-render")
+@pytest.mark.parametrize(
+    "render",
+    [
+        pytest.param(jinja2_safe_load_render, id="jinja2-safe-load"),
+        pytest.param(compiled_render, id="compiled"),
+    ],
+)
+def test_fedora_vm_template_render(benchmark, render):
+    data = get_fedora_vm_manifest()
+    assert benchmark(render, data) == jinja2_safe_load_render(data=data)
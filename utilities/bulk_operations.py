@@ -0,0 +1,122 @@
+"""
+Run many API operations (deploy, delete, patch) concurrently, within a client side operations rate limit.
+
+The limit is on operations, not on API requests: an operation such as vm.deploy() or vm.clean_up() may send several
+requests to the API server.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from kubernetes.dynamic.exceptions import ConflictError, TooManyRequestsError
+
+from utilities.constants import TIMEOUT_1SEC
+from utilities.exceptions import BulkOperationError
+
+LOGGER = logging.getLogger(__name__)
+
+BULK_MAX_WORKERS = 10
+BULK_OPERATIONS_PER_SECOND = 20
+BULK_OPERATIONS_BURST = 40
+BULK_MAX_RETRIES = 5
+
+
+class OperationsRateLimiter:
+    """
+    Token bucket shared by the workers of a bulk operation: up to `burst` operations at once, refilled at
+    `operations_per_second` operations per second.
+    """
+
+    def __init__(self, operations_per_second: float, burst: int) -> None:
+        self.operations_per_second = operations_per_second
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.operations_per_second)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.operations_per_second
+            time.sleep(wait_time)
+
+
+def _is_retryable_error(exception: Exception) -> bool:
+    if isinstance(exception, TooManyRequestsError):
+        return True
+    # A conflict on update is retried; an AlreadyExists conflict on create will not resolve by retrying
+    return isinstance(exception, ConflictError) and "already exists" not in str(exception)
+
+
+def run_bulk_operation(
+    func: Callable[[Any], Any],
+    resources: list[Any],
+    max_workers: int = BULK_MAX_WORKERS,
+    operations_per_second: float = BULK_OPERATIONS_PER_SECOND,
+    burst: int = BULK_OPERATIONS_BURST,
+    max_retries: int = BULK_MAX_RETRIES,
+) -> list[Any]:
+    """
+    Run func on every resource concurrently, on a bounded thread pool and within an operations rate limit.
+
+    Each call of func, including a retry, is counted as one operation against the limit, whatever the number of API
+    requests it sends. Calls failing on 429 (TooManyRequests) or
+    on update conflicts are retried with exponential backoff.
+    All calls run to completion, failures are collected and raised together.
+
+    Args:
+        func (Callable): operation to run, gets a resource, e.g. lambda vm: vm.deploy()
+        resources (list): resources to run the operation on
+        max_workers (int): maximum number of concurrent operations
+        operations_per_second (float): maximum average func calls per second
+        burst (int): maximum func calls started at once
+        max_retries (int): maximum retries of a single operation
+
+    Returns:
+        list: func results, in resources order
+
+    Raises:
+        BulkOperationError: if any operation failed, with the errors of all failed operations
+    """
+    rate_limiter = OperationsRateLimiter(operations_per_second=operations_per_second, burst=burst)
+
+    def _run(_resource: Any) -> Any:
+        for attempt in range(max_retries + 1):
+            rate_limiter.acquire()
+            try:
+                return func(_resource)
+            except Exception as exp:
+                if attempt == max_retries or not _is_retryable_error(exception=exp):
+                    raise
+                LOGGER.warning(f"Retrying operation on {getattr(_resource, 'name', _resource)}: {exp}")
+                time.sleep(TIMEOUT_1SEC * 2**attempt)
+
+    LOGGER.info(
+        f"Running bulk operation on {len(resources)} resources, max_workers={max_workers}, "
+        f"operations_per_second={operations_per_second}"
+    )
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_run, resource) for resource in resources]
+
+    results: list[Any] = []
+    errors: dict[str, BaseException] = {}
+    for resource, future in zip(resources, futures):
+        if exception := future.exception():
+            errors[getattr(resource, "name", str(resource))] = exception
+            results.append(None)
+        else:
+            results.append(future.result())
+
+    if errors:
+        raise BulkOperationError(errors=errors)
+
+    return results
@@ -0,0 +1,220 @@
+"""
+DataVolume import, clone and upload throughput, per storage class.
+
+A sampler thread polls the DataVolume status while it is populated, and records when each phase ends:
+scheduling (importer/cloner/upload pod scheduled), pod start (Running condition), transfer (progress 100%) and
+conversion (Succeeded). Throughput is the requested size divided by the transfer and by the whole population time.
+"""
+
+import json
+import logging
+import statistics
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Generator
+
+import bitmath
+from ocp_resources.datavolume import DataVolume
+
+from utilities.constants import TIMEOUT_1SEC, TIMEOUT_60MIN
+
+LOGGER = logging.getLogger(__name__)
+
+DV_THROUGHPUT_FILE_NAME_PREFIX = "dv-throughput"
+DV_OPERATIONS = {"pvc": "clone", "upload": "upload"}
+SCHEDULED_PHASES = (
+    DataVolume.Status.IMPORT_SCHEDULED,
+    DataVolume.Status.ClONE_SCHEDULED,
+    DataVolume.Status.UPLOAD_SCHEDULED,
+)
+IN_PROGRESS_PHASES = (
+    DataVolume.Status.IMPORT_IN_PROGRESS,
+    DataVolume.Status.CLONE_IN_PROGRESS,
+    DataVolume.Status.UPLOAD_IN_PROGRESS,
+    DataVolume.Status.UPLOAD_READY,
+)
+DV_RUNNING_CONDITION = "Running"
+# Phases end times, in order; a phase end which was not sampled is set to the end of the next sampled phase
+PHASES = ("scheduling", "pod_start", "transfer", "conversion")
+
+
+class DataVolumeThroughputRecorder:
+    """
+    Collect DataVolumes throughput records per storage class.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.enabled = False
+        self.records: dict[str, list[dict[str, Any]]] = defaultdict(list)
+
+    def record(self, storage_class: str, record: dict[str, Any]) -> None:
+        with self._lock:
+            self.records[storage_class].append(record)
+
+    def storage_class_report(self, storage_class: str) -> dict[str, Any]:
+        """
+        Args:
+            storage_class (str): storage class name
+
+        Returns:
+            dict: DataVolumes records, with the median throughput and phases durations per operation
+        """
+        records = self.records[storage_class]
+        summary: dict[str, dict[str, Any]] = {}
+        for operation in sorted({record["operation"] for record in records}):
+            succeeded = [
+                record
+                for record in records
+                if record["operation"] == operation and record["phase"] == DataVolume.Status.SUCCEEDED
+            ]
+            summary[operation] = {"count": len(succeeded)}
+            for key in ("bytes_per_second", "transfer_bytes_per_second", *PHASES):
+                values = [record[key] for record in succeeded if record[key] is not None]
+                summary[operation][f"median_{key}"] = statistics.median(values) if values else None
+
+        return {"storage_class": storage_class, "summary": summary, "data_volumes": records}
+
+
+DV_THROUGHPUT_RECORDER = DataVolumeThroughputRecorder()
+
+
+def enable_dv_throughput_telemetry() -> None:
+    DV_THROUGHPUT_RECORDER.enabled = True
+    LOGGER.info("DataVolume throughput telemetry is enabled")
+
+
+def get_dv_throughput_reports() -> dict[str, str]:
+    """
+    Returns:
+        dict: JSON report file name by storage class
+    """
+    return {
+        f"{DV_THROUGHPUT_FILE_NAME_PREFIX}-{storage_class}.json": json.dumps(
+            DV_THROUGHPUT_RECORDER.storage_class_report(storage_class=storage_class), indent=2
+        )
+        for storage_class in DV_THROUGHPUT_RECORDER.records
+    }
+
+
+class DataVolumeThroughputSampler:
+    """
+    Sample a DataVolume status in a thread, until it succeeds, fails or the sampler is stopped.
+    """
+
+    def __init__(self, dv: DataVolume, size: str, source: str) -> None:
+        """
+        Args:
+            dv (DataVolume): deployed DataVolume
+            size (str): requested size, e.g. 5Gi
+            source (str): DataVolume source, e.g. http, pvc, upload
+        """
+        self.dv = dv
+        self.size_bytes = int(bitmath.parse_string_unsafe(size).bytes) if size else None
+        self.operation = DV_OPERATIONS.get(source, "import")
+        self.phase: str | None = None
+        self.start_time = time.monotonic()
+        # Phase name: seconds since the DataVolume was deployed, when the phase ended
+        self.ended: dict[str, float] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"dv-throughput-{dv.name}", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.is_set() and time.monotonic() - self.start_time < TIMEOUT_60MIN:
+            try:
+                if self._sample(status=self.dv.instance.status):
+                    break
+            except Exception as exp:
+                LOGGER.warning(f"Failed to sample DataVolume {self.dv.name} status: {exp}")
+            self._stop.wait(timeout=TIMEOUT_1SEC)
+
+        self._record()
+
+    def _sample(self, status: Any) -> bool:
+        if not status:
+            return False
+
+        self.phase = status.phase
+        running = any(
+            condition.type == DV_RUNNING_CONDITION and condition.status == DataVolume.Condition.Status.TRUE
+            for condition in status.conditions or []
+        )
+        progress = status.progress or ""
+        reached = {
+            "scheduling": self.phase in SCHEDULED_PHASES + IN_PROGRESS_PHASES or running,
+            "pod_start": self.phase in IN_PROGRESS_PHASES or running,
+            "transfer": progress.endswith("%") and float(progress.rstrip("%")) >= 100,
+            "conversion": self.phase == DataVolume.Status.SUCCEEDED,
+        }
+        now = time.monotonic() - self.start_time
+        for phase in reversed(PHASES):
+            if reached[phase] or phase in self.ended:
+                for earlier_phase in PHASES[: PHASES.index(phase) + 1]:
+                    self.ended.setdefault(earlier_phase, now)
+                break
+
+        return self.phase in (DataVolume.Status.SUCCEEDED, DataVolume.Status.FAILED)
+
+    def _record(self) -> None:
+        durations: dict[str, float | None] = {}
+        previous_end = 0.0
+        for phase in PHASES:
+            durations[phase] = round(self.ended[phase] - previous_end, 3) if phase in self.ended else None
+            previous_end = self.ended.get(phase, previous_end)
+
+        populated = (
+            self.ended["conversion"] - self.ended["pod_start"]
+            if "conversion" in self.ended and "pod_start" in self.ended
+            else None
+        )
+        DV_THROUGHPUT_RECORDER.record(
+            storage_class=self.dv.storage_class or "default",
+            record={
+                "name": self.dv.name,
+                "namespace": self.dv.namespace,
+                "operation": self.operation,
+                "phase": self.phase,
+                "size_bytes": self.size_bytes,
+                **durations,
+                "bytes_per_second": _bytes_per_second(size_bytes=self.size_bytes, seconds=populated),
+                "transfer_bytes_per_second": _bytes_per_second(
+                    size_bytes=self.size_bytes, seconds=durations["transfer"]
+                ),
+                "timestamp": time.time(),
+            },
+        )
+
+
+def _bytes_per_second(size_bytes: int | None, seconds: float | None) -> float | None:
+    return round(size_bytes / seconds) if size_bytes and seconds else None
+
+
+@contextmanager
+def sample_dv_throughput(dv: DataVolume, size: str, source: str) -> Generator[None, None, None]:
+    """
+    Record the DataVolume throughput while in the context, if DataVolume throughput telemetry is enabled.
+
+    Args:
+        dv (DataVolume): deployed DataVolume
+        size (str): requested size, e.g. 5Gi
+        source (str): DataVolume source, e.g. http, pvc, upload
+    """
+    if not DV_THROUGHPUT_RECORDER.enabled:
+        yield
+        return
+
+    sampler = DataVolumeThroughputSampler(dv=dv, size=size, source=source)
+    sampler.start()
+    try:
+        yield
+    finally:
+        sampler.stop()
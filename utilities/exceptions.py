@@ -95,3 +95,42 @@ class MissingResourceException(Exception):
 
 class UnsupportedGPUDeviceError(Exception):
     """Exception raised when a GPU device ID is not supported."""
+
+
+class BulkOperationError(Exception):
+    def __init__(self, errors):
+        self.errors = errors
+
+    def __str__(self):
+        return f"{len(self.errors)} operations failed: {self.errors}"
+
+
+class NamespaceDeletionError(Exception):
+    def __init__(self, errors):
+        self.errors = errors
+
+    def __str__(self):
+        return f"Failed to delete namespaces {list(self.errors)}: {self.errors}"
+
+
+class DataVolumeImportError(Exception):
+    def __init__(self, dv_name, namespace, status):
+        self.dv_name = dv_name
+        self.namespace = namespace
+        self.status = status
+
+    def __str__(self):
+        return f"DataVolume {self.dv_name} in namespace {self.namespace} import failed, status: {self.status}"
+
+
+class ImageInfoNotCachedError(Exception):
+    def __init__(self, image, architecture):
+        self.image = image
+        self.architecture = architecture
+
+    def __str__(self):
+        return f"Image info of {self.image} ({self.architecture}) is not cached, cannot resolve it in offline mode"
+
+
+class TemplateProcessingError(Exception):
+    pass
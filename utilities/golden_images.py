@@ -0,0 +1,142 @@
+"""
+Index of golden image volumes, to reuse imported images across sessions.
+
+Golden image DataVolumes imported from the artifact server are labeled with a hash of their source URL and content
+(ETag or checksum), and with their storage class; their PVCs get the same labels.
+A golden image with the same source content on the same storage class is reused or cloned instead of importing
+the image again, and indexed golden images which were not used for GOLDEN_IMAGE_MAX_IDLE are deleted.
+"""
+
+import hashlib
+import logging
+import time
+from typing import Any
+
+import requests
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.exceptions import NotFoundError
+from ocp_resources.datavolume import DataVolume
+from ocp_resources.resource import ResourceEditor
+
+import utilities.infra
+from utilities.exceptions import UrlNotFoundError
+
+LOGGER = logging.getLogger(__name__)
+
+GOLDEN_IMAGE_SOURCE_LABEL = "cnv-tests/golden-image-source"
+GOLDEN_IMAGE_STORAGE_CLASS_LABEL = "cnv-tests/golden-image-storage-class"
+GOLDEN_IMAGE_URL_ANNOTATION = "cnv-tests/golden-image-url"
+GOLDEN_IMAGE_CONTENT_ANNOTATION = "cnv-tests/golden-image-content"
+GOLDEN_IMAGE_LAST_USED_ANNOTATION = "cnv-tests/golden-image-last-used"
+# Response headers identifying the content of a URL, by preference
+CONTENT_ID_HEADERS = ("X-Checksum-Sha256", "X-Checksum-Sha1", "ETag")
+GOLDEN_IMAGE_MAX_IDLE = 7 * 24 * 60 * 60
+# Label values are limited to 63 characters
+SOURCE_HASH_LENGTH = 40
+
+
+def get_url_content_id(url: str) -> str:
+    """
+    Args:
+        url (str): artifact server URL
+
+    Returns:
+        str: content checksum or ETag; Last-Modified and Content-Length if the server reports neither
+
+    Raises:
+        UrlNotFoundError: if the URL does not exist
+    """
+    response = requests.head(url, headers=utilities.infra.get_artifactory_header(), verify=False, allow_redirects=True)
+    if response.status_code != requests.codes.ok:
+        raise UrlNotFoundError(url_request=response)
+
+    for header in CONTENT_ID_HEADERS:
+        if content_id := response.headers.get(header):
+            return content_id.strip('"')
+
+    return f"{response.headers.get('Last-Modified')}-{response.headers.get('Content-Length')}"
+
+
+def get_golden_image_labels(url: str, content_id: str, storage_class: str) -> dict[str, str]:
+    source_hash = hashlib.sha256(f"{url}|{content_id}".encode("utf-8")).hexdigest()[:SOURCE_HASH_LENGTH]
+    return {GOLDEN_IMAGE_SOURCE_LABEL: source_hash, GOLDEN_IMAGE_STORAGE_CLASS_LABEL: storage_class}
+
+
+def get_golden_image_annotations(url: str, content_id: str) -> dict[str, str]:
+    return {
+        GOLDEN_IMAGE_URL_ANNOTATION: url,
+        GOLDEN_IMAGE_CONTENT_ANNOTATION: content_id,
+        GOLDEN_IMAGE_LAST_USED_ANNOTATION: str(int(time.time())),
+    }
+
+
+def is_golden_image_up_to_date(dv: DataVolume, labels: dict[str, str]) -> bool:
+    """
+    Args:
+        dv (DataVolume): golden image DataVolume
+        labels (dict): golden image labels of the current source content
+
+    Returns:
+        bool: True if the DataVolume was not indexed (created before the index, kept as is) or has the same content
+    """
+    dv_labels = dv.instance.metadata.labels or {}
+    return (
+        GOLDEN_IMAGE_SOURCE_LABEL not in dv_labels
+        or dv_labels[GOLDEN_IMAGE_SOURCE_LABEL] == (labels[GOLDEN_IMAGE_SOURCE_LABEL])
+    )
+
+
+def find_golden_image(client: DynamicClient, namespace: str, labels: dict[str, str]) -> DataVolume | None:
+    """
+    Args:
+        client (DynamicClient): admin client
+        namespace (str): golden images namespace
+        labels (dict): golden image labels
+
+    Returns:
+        DataVolume or None: succeeded golden image DataVolume with the same source content and storage class
+    """
+    for dv in DataVolume.get(
+        dyn_client=client,
+        namespace=namespace,
+        label_selector=",".join(f"{key}={value}" for key, value in labels.items()),
+    ):
+        if dv.instance.status.phase == DataVolume.Status.SUCCEEDED:
+            return dv
+
+    return None
+
+
+def mark_golden_image_used(dv: DataVolume, labels: dict[str, str] | None = None) -> None:
+    """
+    Set the golden image last used time, and its labels, on the DataVolume and its PVC.
+
+    Args:
+        dv (DataVolume): golden image DataVolume
+        labels (dict, optional): golden image labels, for a newly created DataVolume
+    """
+    metadata: dict[str, Any] = {"annotations": {GOLDEN_IMAGE_LAST_USED_ANNOTATION: str(int(time.time()))}}
+    if labels:
+        metadata["labels"] = labels
+
+    for resource in (dv, dv.pvc):
+        ResourceEditor(patches={resource: {"metadata": metadata}}).update()
+
+
+def delete_stale_golden_images(client: DynamicClient, namespace: str, max_idle: int = GOLDEN_IMAGE_MAX_IDLE) -> None:
+    """
+    Delete the indexed golden images which were not used for max_idle seconds.
+
+    Args:
+        client (DynamicClient): admin client
+        namespace (str): golden images namespace
+        max_idle (int): maximum time since the golden image was last used, in seconds
+    """
+    for dv in DataVolume.get(dyn_client=client, namespace=namespace, label_selector=GOLDEN_IMAGE_SOURCE_LABEL):
+        try:
+            last_used = int((dv.instance.metadata.annotations or {}).get(GOLDEN_IMAGE_LAST_USED_ANNOTATION, 0))
+            if time.time() - last_used > max_idle:
+                LOGGER.info(f"Deleting golden image {dv.name}, not used since {time.ctime(last_used)}")
+                dv.clean_up()
+        except NotFoundError:
+            continue
@@ -112,7 +112,11 @@ def wait_for_hco_conditions(
     stabilize first, before checking hco.status.conditions. Please note, EXPECTED_STATUS_CONDITIONS defines what all
     CRs can be checked currently. Any new CRs and associated default conditions need to be added in
     EXPECTED_STATUS_CONDITIONS in order for option list_dependent_crs_to_check to work as expected.
+
+    The conditions are watched, and must hold for the time consecutive_checks_count checks every sleep seconds would
+    take.
     """
+    stability_duration = (consecutive_checks_count - 1) * sleep
     if list_dependent_crs_to_check:
         LOGGER.info(f"Waiting for {len(list_dependent_crs_to_check)} CRs managed by HCO to reconcile: ")
         for resource in list_dependent_crs_to_check:
@@ -121,7 +125,7 @@ def wait_for_hco_conditions(
                 namespace=getattr(resource, "namespace", None),
                 resource_kind=resource,
                 expected_conditions=EXPECTED_STATUS_CONDITIONS[resource],
-                consecutive_checks_count=consecutive_checks_count,
+                stability_duration=stability_duration,
             )
     try:
         utilities.infra.wait_for_consistent_resource_conditions(
@@ -132,8 +136,7 @@ def wait_for_hco_conditions(
             condition_key1=condition_key1,
             condition_key2=condition_key2,
             total_timeout=wait_timeout,
-            polling_interval=sleep,
-            consecutive_checks_count=consecutive_checks_count,
+            stability_duration=stability_duration,
         )
     except TimeoutExpiredError:
         raise
@@ -0,0 +1,76 @@
+"""
+Persistent cache of `oc image info` results.
+
+Entries are keyed by image reference, architecture and registry config (pull secret) content, and kept next to the
+data collector directory so repeated runs on the same cluster skip registry lookups.
+Set IMAGE_INFO_CACHE_OFFLINE=true to only serve cached entries, regardless of their age.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any
+
+from utilities.constants import TIMEOUT_12HRS
+from utilities.data_collector import get_data_collector_base
+
+LOGGER = logging.getLogger(__name__)
+
+IMAGE_INFO_CACHE_DIRECTORY_NAME = "image-info-cache"
+IMAGE_INFO_CACHE_TTL = TIMEOUT_12HRS
+IMAGE_INFO_CACHE_OFFLINE = "IMAGE_INFO_CACHE_OFFLINE"
+
+
+def is_image_info_cache_offline() -> bool:
+    return os.environ.get(IMAGE_INFO_CACHE_OFFLINE, "").lower() == "true"
+
+
+def get_image_info_cache_file(image: str, architecture: str, pull_secret: str | None = None) -> str:
+    """
+    Args:
+        image (str): image reference
+        architecture (str): image OS/architecture, e.g. linux/amd64
+        pull_secret (str, optional): registry config file path
+
+    Returns:
+        str: cache file path of the image info
+    """
+    registry_config_hash = ""
+    if pull_secret:
+        with open(pull_secret, "rb") as fd:
+            registry_config_hash = hashlib.sha256(fd.read()).hexdigest()
+
+    cache_key = hashlib.sha256(f"{image}|{architecture}|{registry_config_hash}".encode("utf-8")).hexdigest()
+    return os.path.join(f"{get_data_collector_base()}{IMAGE_INFO_CACHE_DIRECTORY_NAME}", f"{cache_key}.json")
+
+
+def read_cached_image_info(cache_file: str, max_age: int | None = IMAGE_INFO_CACHE_TTL) -> dict[str, Any] | None:
+    """
+    Args:
+        cache_file (str): cache file path
+        max_age (int, optional): maximum entry age in seconds, None for any age
+
+    Returns:
+        dict or None: cached image info, None if not cached or expired
+    """
+    try:
+        with open(cache_file) as fd:
+            cached_image_info = json.load(fd)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if max_age is not None and time.time() - cached_image_info["timestamp"] > max_age:
+        return None
+
+    return cached_image_info["image_info"]
+
+
+def write_cached_image_info(cache_file: str, image: str, image_info: dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    # Write and rename, so concurrent readers never see a partial entry
+    tmp_cache_file = f"{cache_file}.{os.getpid()}.tmp"
+    with open(tmp_cache_file, "w") as fd:
+        json.dump({"image": image, "timestamp": time.time(), "image_info": image_info}, fd)
+    os.replace(tmp_cache_file, cache_file)
@@ -59,6 +59,7 @@ from requests import HTTPError, Timeout, TooManyRedirects
 from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 
 import utilities.virt
+from utilities.bulk_operations import run_bulk_operation
 from utilities.constants import (
     AMD_64,
     ARTIFACTORY_SECRET_NAME,
@@ -102,6 +103,7 @@ from utilities.exceptions import (
 from utilities.hco import wait_for_hco_conditions
 from utilities.ssp import guest_agent_version_parser
 from utilities.storage import get_test_artifact_server_url
+from utilities.watch import cached_resource_instance, get_resource_cache, wait_for_stable_state
 
 KUBERNETES_ARCH_LABEL = f"{Resource.ApiGroup.KUBERNETES_IO}/arch"
 JIRA_STATUS_CLOSED = ("on_qa", "verified", "release pending", "closed")
@@ -275,42 +277,82 @@ def wait_for_pods_deletion(pods):
         pod.wait_deleted()
 
 
-def get_pod_container_error_status(pod: Pod) -> str | None:
+def get_raw_pods(dyn_client: DynamicClient, namespace: Namespace, label: str = "") -> list[dict[str, Any]]:
+    """
+    Get the pods of a namespace as raw dicts, using a single list request.
+    """
+    return [
+        raw_pod.to_dict()
+        for raw_pod in Pod.get(
+            dyn_client=dyn_client,
+            namespace=namespace.name,
+            label_selector=label,
+            raw=True,
+        )
+    ]
+
+
+def get_raw_pod_container_error_status(raw_pod: dict[str, Any]) -> str | dict[str, Any] | None:
+    # Check the containerStatuses and if any container is in waiting state, return that information:
+    for container_status in raw_pod.get("status", {}).get("containerStatuses", []):
+        if waiting_container := container_status.get("state", {}).get("waiting"):
+            return waiting_container["reason"] if waiting_container.get("reason") else waiting_container
+    return None
+
+
+def get_pod_container_error_status(pod: Pod) -> str | dict[str, Any] | None:
     try:
-        pod_instance_status = pod.instance.status
-        # Check the containerStatuses and if any container is in waiting state, return that information:
-        for container_status in pod_instance_status.get("containerStatuses", []):
-            if waiting_container := container_status.get("state", {}).get("waiting"):
-                return waiting_container["reason"] if waiting_container.get("reason") else waiting_container
-        return None
+        return get_raw_pod_container_error_status(raw_pod=pod.instance.to_dict())
     except NotFoundError:
         LOGGER.error(f"Pod {pod.name} was not found")
         raise
 
 
-def get_not_running_pods(pods: list[Pod], filter_pods_by_name: str = "") -> list[dict[str, str]]:
+def get_not_running_raw_pods(raw_pods: list[dict[str, Any]], filter_pods_by_name: str = "") -> list[dict[str, Any]]:
+    """
+    Get the pods which are not running, evaluated from raw pod dicts (e.g. a pods list response) in a single pass.
+
+    Args:
+        raw_pods (list): raw pod dicts
+        filter_pods_by_name (str): pods which have this string in their name are ignored
+
+    Returns:
+        list: dicts of not running pod name to its phase or container error status
+    """
     pods_not_running = []
+    for raw_pod in raw_pods:
+        pod_name = raw_pod["metadata"]["name"]
+        if filter_pods_by_name and filter_pods_by_name in pod_name:
+            LOGGER.warning(f"Ignoring pod: {pod_name} for pod state validations.")
+            continue
+        pod_phase = raw_pod.get("status", {}).get("phase")
+        # Waits for all pods in a given namespace to be in final healthy state(running/completed).
+        # We also need to keep track of pods marked for deletion as not running. This would ensure any
+        # pod that was spinned up in place of pod marked for deletion, reaches healthy state before end
+        # of this check
+        if raw_pod["metadata"].get("deletionTimestamp") or pod_phase not in (
+            Pod.Status.RUNNING,
+            Pod.Status.SUCCEEDED,
+        ):
+            pods_not_running.append({pod_name: pod_phase})
+        elif container_status_error := get_raw_pod_container_error_status(raw_pod=raw_pod):
+            pods_not_running.append({pod_name: container_status_error})
+    return pods_not_running
+
+
+def get_not_running_pods(pods: list[Pod], filter_pods_by_name: str = "") -> list[dict[str, Any]]:
+    raw_pods = []
+    pods_not_running: list[dict[str, Any]] = []
     for pod in pods:
         if filter_pods_by_name and filter_pods_by_name in pod.name:
             LOGGER.warning(f"Ignoring pod: {pod.name} for pod state validations.")
             continue
         try:
-            pod_instance = pod.instance
-            # Waits for all pods in a given namespace to be in final healthy state(running/completed).
-            # We also need to keep track of pods marked for deletion as not running. This would ensure any
-            # pod that was spinned up in place of pod marked for deletion, reaches healthy state before end
-            # of this check
-            if pod_instance.metadata.get("deletionTimestamp") or pod_instance.status.phase not in (
-                pod.Status.RUNNING,
-                pod.Status.SUCCEEDED,
-            ):
-                pods_not_running.append({pod.name: pod.status})
-            elif container_status_error := get_pod_container_error_status(pod=pod):
-                pods_not_running.append({pod.name: container_status_error})
+            raw_pods.append(pod.instance.to_dict())
         except (ResourceNotFoundError, NotFoundError):
             LOGGER.warning(f"Ignoring pod {pod.name} that disappeared during cluster sanity check")
             pods_not_running.append({pod.name: "Deleted"})
-    return pods_not_running
+    return get_not_running_raw_pods(raw_pods=raw_pods) + pods_not_running
 
 
 def wait_for_pods_running(
@@ -331,10 +373,11 @@ def wait_for_pods_running(
         TimeoutExpiredError: Raises TimeoutExpiredError if any of the pods in the given namespace are not in Running
          state
     """
+    # Pods health is evaluated from the list response, a single API request per check regardless of pods count
     samples = TimeoutSampler(
         wait_timeout=TIMEOUT_2MIN,
         sleep=TIMEOUT_5SEC,
-        func=get_pods,
+        func=get_raw_pods,
         dyn_client=admin_client,
         namespace=namespace,
         exceptions_dict={NotFoundError: []},
@@ -346,7 +389,9 @@ def wait_for_pods_running(
         current_check = 0
         for sample in samples:
             if sample:
-                if not_running_pods := get_not_running_pods(pods=sample, filter_pods_by_name=filter_pods_by_name):
+                if not_running_pods := get_not_running_raw_pods(
+                    raw_pods=sample, filter_pods_by_name=filter_pods_by_name
+                ):
                     LOGGER.warning(f"Not running pods: {not_running_pods}")
                     current_check = 0
                 else:
@@ -384,6 +429,23 @@ def get_daemonset_by_name(admin_client, daemonset_name, namespace_name):
     raise ResourceNotFoundError(f"Daemonset: {daemonset_name} not found in namespace: {namespace_name}")
 
 
+def get_actual_resource_conditions(status_conditions, expected_conditions, condition_key1, condition_key2):
+    return {
+        condition[condition_key1]: condition[condition_key2]
+        for condition in status_conditions
+        if condition[condition_key1] in expected_conditions
+    }
+
+
+def get_matched_stop_conditions(status_conditions, stop_conditions):
+    actual_conditions = {condition["type"]: condition["reason"] for condition in status_conditions}
+    return {
+        type: reason
+        for type, reason in stop_conditions.items()
+        if type in actual_conditions and actual_conditions[type] == reason
+    }
+
+
 def wait_for_consistent_resource_conditions(
     dynamic_client,
     expected_conditions,
@@ -397,6 +459,7 @@ def wait_for_consistent_resource_conditions(
     consecutive_checks_count=10,
     exceptions_dict=None,
     resource_name=None,
+    stability_duration=None,
 ):
     """This function awaits certain conditions of a given resource_kind (HCO, CSV, etc.).
 
@@ -404,6 +467,8 @@ def wait_for_consistent_resource_conditions(
     against the actual conditions found in the CR.
     Since the conditions statuses might change, we use consecutive checks in order to have consistent results (stable),
     thereby ascertaining that the expected conditions are met over time.
+    If stability_duration is set, the CR is watched instead of polled, and the expected conditions must hold without
+    interruption for stability_duration seconds.
 
     Args:
         dynamic_client (DynamicClient): admin client
@@ -430,10 +495,28 @@ def wait_for_consistent_resource_conditions(
             the change in its state) has not started yet.
             2. some components are in Ready status, but others have not started the process yet.
         exceptions_dict: TimeoutSampler exceptions_dict
+        resource_name (str, optional): resource name
+        stability_duration (int, optional): time (seconds) the expected conditions must hold, replaces
+            polling_interval and consecutive_checks_count
 
     Raises:
         TimeoutExpiredError: raised when expected conditions are not met within the timeframe
     """
+    if stability_duration is not None:
+        _wait_for_stable_resource_conditions(
+            dynamic_client=dynamic_client,
+            expected_conditions=expected_conditions,
+            resource_kind=resource_kind,
+            stop_conditions=stop_conditions,
+            condition_key1=condition_key1,
+            condition_key2=condition_key2,
+            namespace=namespace,
+            total_timeout=total_timeout,
+            resource_name=resource_name,
+            stability_duration=stability_duration,
+        )
+        return
+
     samples = TimeoutSampler(
         wait_timeout=total_timeout,
         sleep=polling_interval,
@@ -456,11 +539,12 @@ def wait_for_consistent_resource_conditions(
         for sample in samples:
             status_conditions = sample[0].instance.get("status", {}).get("conditions")
             if status_conditions:
-                actual_conditions = {
-                    condition[condition_key1]: condition[condition_key2]
-                    for condition in status_conditions
-                    if condition[condition_key1] in expected_conditions
-                }
+                actual_conditions = get_actual_resource_conditions(
+                    status_conditions=status_conditions,
+                    expected_conditions=expected_conditions,
+                    condition_key1=condition_key1,
+                    condition_key2=condition_key2,
+                )
                 if actual_conditions == expected_conditions:
                     current_check += 1
                     if current_check >= consecutive_checks_count:
@@ -469,12 +553,9 @@ def wait_for_consistent_resource_conditions(
                 else:
                     current_check = 0
                     if stop_conditions:
-                        actual_conditions = {condition["type"]: condition["reason"] for condition in status_conditions}
-                        matched_stop_conditions = {
-                            type: reason
-                            for type, reason in stop_conditions.items()
-                            if type in actual_conditions and actual_conditions[type] == reason
-                        }
+                        matched_stop_conditions = get_matched_stop_conditions(
+                            status_conditions=status_conditions, stop_conditions=stop_conditions
+                        )
                         if matched_stop_conditions:
                             LOGGER.error(
                                 f"Execution halted due to matched stop conditions: {matched_stop_conditions}. "
@@ -492,6 +573,68 @@ def wait_for_consistent_resource_conditions(
         raise
 
 
+def _wait_for_stable_resource_conditions(
+    dynamic_client,
+    expected_conditions,
+    resource_kind,
+    stop_conditions,
+    condition_key1,
+    condition_key2,
+    namespace,
+    total_timeout,
+    resource_name,
+    stability_duration,
+):
+    actual_conditions = {}
+
+    def _status_conditions(_raw_resource):
+        return (_raw_resource or {}).get("status", {}).get("conditions") or []
+
+    def _expected_conditions_met(_raw_resource):
+        nonlocal actual_conditions
+        actual_conditions = get_actual_resource_conditions(
+            status_conditions=_status_conditions(_raw_resource=_raw_resource),
+            expected_conditions=expected_conditions,
+            condition_key1=condition_key1,
+            condition_key2=condition_key2,
+        )
+        return actual_conditions == expected_conditions
+
+    def _stop_conditions_met(_raw_resource):
+        status_conditions = _status_conditions(_raw_resource=_raw_resource)
+        if matched_stop_conditions := get_matched_stop_conditions(
+            status_conditions=status_conditions, stop_conditions=stop_conditions
+        ):
+            LOGGER.error(
+                f"Execution halted due to matched stop conditions: {matched_stop_conditions}. "
+                f"Current status conditions: {status_conditions}."
+            )
+            return True
+        return False
+
+    LOGGER.info(
+        f"Waiting for resource to stabilize: resource_kind={resource_kind.__name__} conditions={expected_conditions} "
+        f"timeout={total_timeout} stability_duration={stability_duration}"
+    )
+    try:
+        wait_for_stable_state(
+            client=dynamic_client,
+            resource_class=resource_kind,
+            condition=_expected_conditions_met,
+            stability_duration=stability_duration,
+            timeout=total_timeout,
+            namespace=namespace,
+            name=resource_name,
+            stop_condition=_stop_conditions_met if stop_conditions else None,
+        )
+    except TimeoutExpiredError:
+        LOGGER.error(
+            f"Timeout expired meeting conditions for resource: resource={resource_kind.kind} "
+            f"expected_conditions={expected_conditions} status_conditions={actual_conditions}"
+        )
+        raise
+
+
 def raise_multiple_exceptions(exceptions):
     """Raising multiple exceptions
 
@@ -881,12 +1024,27 @@ def get_hyperconverged_resource(client, hco_ns_name):
 
 
 def get_utility_pods_from_nodes(nodes, admin_client, label_selector):
-    pods = list(Pod.get(dyn_client=admin_client, label_selector=label_selector))
-    nodes_without_utility_pods = [node.name for node in nodes if node.name not in [pod.node.name for pod in pods]]
+    # Utility pods are used throughout the session, read them (and their nodes) from a watch synchronized cache
+    pods_cache = get_resource_cache(client=admin_client, resource_class=Pod, label_selector=label_selector)
+    if pods_cache:
+        pods_with_node_name = [
+            (
+                Pod(client=admin_client, name=raw_pod["metadata"]["name"], namespace=raw_pod["metadata"]["namespace"]),
+                raw_pod["spec"].get("nodeName"),
+            )
+            for raw_pod in pods_cache.list()
+        ]
+    else:
+        pods_with_node_name = [
+            (pod, pod.node.name) for pod in Pod.get(dyn_client=admin_client, label_selector=label_selector)
+        ]
+    pods_node_names = [node_name for _, node_name in pods_with_node_name]
+    nodes_names = [node.name for node in nodes]
+    nodes_without_utility_pods = [node_name for node_name in nodes_names if node_name not in pods_node_names]
     assert not nodes_without_utility_pods, (
         f"Missing pods with label {label_selector} for: {' '.join(nodes_without_utility_pods)}"
     )
-    return [pod for pod in pods if pod.node.name in [node.name for node in nodes]]
+    return [pod for pod, node_name in pods_with_node_name if node_name in nodes_names]
 
 
 def label_nodes(nodes, labels):
@@ -1009,8 +1167,12 @@ def get_machine_platform():
     return AMD_64 if os_machine_type == "x86_64" else os_machine_type
 
 
+def get_node_labels(node):
+    return cached_resource_instance(resource=node).metadata.get("labels", {})
+
+
 def get_nodes_with_label(nodes, label):
-    return [node for node in nodes if label in node.labels.keys()]
+    return [node for node in nodes if label in get_node_labels(node=node).keys()]
 
 
 def get_daemonset_yaml_file_with_image_hash(generated_pulled_secret=None, service_account=None):
@@ -1452,7 +1614,7 @@ def get_nodes_cpu_model(nodes):
     for node in nodes:
         nodes_cpu_model["common"][node.name] = set()
         nodes_cpu_model["modern"][node.name] = set()
-        for label, value in node.labels.items():
+        for label, value in get_node_labels(node=node).items():
             match_object = re.match(rf"{CPU_MODEL_LABEL_PREFIX}/(.*)", label)
             if is_cpu_model_not_in_excluded_list(
                 filter_list=EXCLUDED_CPU_MODELS, match=match_object, label_value=value
@@ -1504,8 +1666,10 @@ def get_common_cpu_from_nodes(cluster_cpus):
 
 def delete_resources_from_namespace_by_type(resources_types, namespace, wait=False):
     for resource_type in resources_types:
-        for resource in list(resource_type.get(namespace=namespace)):
-            resource.delete(wait=wait)
+        run_bulk_operation(
+            func=lambda resource: resource.delete(wait=wait),
+            resources=list(resource_type.get(namespace=namespace)),
+        )
 
 
 def get_linux_guest_agent_version(ssh_exec):
@@ -1558,6 +1722,7 @@ def verify_image_info(image_url, generated_pulled_secret, nodes_cpu_architecture
             f"oc image info {image_url} "
             f"--registry-config={generated_pulled_secret} --filter-by-os={nodes_cpu_architecture}"
         ),
+        check=True,
     )
 
 
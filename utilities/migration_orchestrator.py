@@ -0,0 +1,177 @@
+"""
+Concurrent VM live migrations, within per source node and cluster wide limits.
+"""
+
+import logging
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+from kubernetes.dynamic import DynamicClient
+from ocp_resources.namespace import Namespace
+from ocp_resources.virtual_machine_instance_migration import VirtualMachineInstanceMigration
+from pytest_testconfig import config as py_config
+
+from utilities.bulk_operations import run_bulk_operation
+from utilities.constants import TIMEOUT_12MIN
+from utilities.virt import (
+    VirtualMachineForTests,
+    get_kubevirt_hyperconverged_spec,
+    verify_vm_migrated,
+    wait_for_migration_finished,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+MIGRATION_MAX_ATTEMPTS = 3
+# KubeVirt defaults, when not set in the KubeVirt CR
+DEFAULT_PARALLEL_MIGRATIONS_PER_CLUSTER = 5
+DEFAULT_PARALLEL_OUTBOUND_MIGRATIONS_PER_NODE = 2
+
+
+def get_cluster_migration_limits(admin_client: DynamicClient) -> tuple[int, int]:
+    """
+    Args:
+        admin_client (DynamicClient): admin client
+
+    Returns:
+        tuple: KubeVirt parallelMigrationsPerCluster and parallelOutboundMigrationsPerNode
+    """
+    migrations_config = (
+        get_kubevirt_hyperconverged_spec(
+            admin_client=admin_client, hco_namespace=Namespace(name=py_config["hco_namespace"])
+        )
+        .get("configuration", {})
+        .get("migrations", {})
+    )
+    return (
+        migrations_config.get("parallelMigrationsPerCluster", DEFAULT_PARALLEL_MIGRATIONS_PER_CLUSTER),
+        migrations_config.get("parallelOutboundMigrationsPerNode", DEFAULT_PARALLEL_OUTBOUND_MIGRATIONS_PER_NODE),
+    )
+
+
+@dataclass
+class VMMigrationRecord:
+    source_node: str
+    attempts: int = 0
+    # Duration of the successful attempt, in seconds
+    duration: float | None = None
+    errors: list[str] = field(default_factory=list)
+
+
+@dataclass
+class MigrationsResult:
+    # Time from the first migration start to the last migration end, in seconds
+    makespan: float
+    migrations: dict[str, VMMigrationRecord]
+
+    @property
+    def failed(self) -> list[str]:
+        return [vm_name for vm_name, record in self.migrations.items() if record.duration is None]
+
+    @property
+    def errors(self) -> dict[str, list[str]]:
+        # Failed attempts, including those of VMs which migrated on a later attempt
+        return {vm_name: record.errors for vm_name, record in self.migrations.items() if record.errors}
+
+
+class MigrationOrchestrator:
+    """
+    Migrate VMs concurrently, keeping at most `max_in_flight` migrations in the cluster and `max_per_node`
+    migrations from each source node.
+
+    The limits default to, and are capped by, the KubeVirt parallelMigrationsPerCluster and
+    parallelOutboundMigrationsPerNode, as more migrations would only be queued by KubeVirt.
+    A failed migration is retried, up to `max_attempts` times, after the other pending migrations started; callers
+    verifying that migration works should set `max_attempts` to 1, so a failed migration is not hidden by a retry.
+    """
+
+    def __init__(
+        self,
+        vms: list[VirtualMachineForTests],
+        admin_client: DynamicClient,
+        max_in_flight: int | None = None,
+        max_per_node: int | None = None,
+        max_attempts: int = MIGRATION_MAX_ATTEMPTS,
+        timeout: int = TIMEOUT_12MIN,
+        wait_for_interfaces: bool = True,
+    ) -> None:
+        """
+        Args:
+            vms (list): running VMs to migrate
+            admin_client (DynamicClient): client to read the KubeVirt migrations configuration
+            max_in_flight (int, optional): maximum concurrent migrations in the cluster
+            max_per_node (int, optional): maximum concurrent migrations from a source node
+            max_attempts (int): maximum migration attempts per VM
+            timeout (int): time to wait for a single migration
+            wait_for_interfaces (bool): wait for the VMs interfaces after their migration
+        """
+        self.vms = vms
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        self.wait_for_interfaces = wait_for_interfaces
+        cluster_max_in_flight, cluster_max_per_node = get_cluster_migration_limits(admin_client=admin_client)
+        self.max_in_flight = min(max_in_flight or cluster_max_in_flight, cluster_max_in_flight)
+        self.max_per_node = min(max_per_node or cluster_max_per_node, cluster_max_per_node)
+
+    def _migrate(self, vm: VirtualMachineForTests, record: VMMigrationRecord) -> None:
+        start_time = time.monotonic()
+        node_before = vm.vmi.node
+        with VirtualMachineInstanceMigration(
+            name=vm.name,
+            namespace=vm.namespace,
+            vmi_name=vm.vmi.name,
+            client=vm.client,
+        ) as migration:
+            wait_for_migration_finished(vm=vm, migration=migration, timeout=self.timeout)
+
+        verify_vm_migrated(vm=vm, node_before=node_before, wait_for_interfaces=self.wait_for_interfaces)
+        record.duration = time.monotonic() - start_time
+
+    def run(self) -> MigrationsResult:
+        """
+        Returns:
+            MigrationsResult: makespan, and attempts and duration of each VM migration
+        """
+        source_nodes = run_bulk_operation(func=lambda vm: vm.vmi.node.name, resources=self.vms)
+        records = {
+            str(vm.name): VMMigrationRecord(source_node=source_node) for vm, source_node in zip(self.vms, source_nodes)
+        }
+        pending = list(self.vms)
+        in_flight: dict[Future, VirtualMachineForTests] = {}
+        node_migrations: Counter[str] = Counter()
+        start_time = time.monotonic()
+        LOGGER.info(
+            f"Migrating {len(pending)} VMs, max_in_flight={self.max_in_flight}, max_per_node={self.max_per_node}"
+        )
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            while pending or in_flight:
+                for vm in list(pending):
+                    if len(in_flight) >= self.max_in_flight:
+                        break
+                    record = records[str(vm.name)]
+                    if node_migrations[record.source_node] >= self.max_per_node:
+                        continue
+                    pending.remove(vm)
+                    record.attempts += 1
+                    node_migrations[record.source_node] += 1
+                    in_flight[executor.submit(self._migrate, vm=vm, record=record)] = vm
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    vm = in_flight.pop(future)
+                    record = records[str(vm.name)]
+                    node_migrations[record.source_node] -= 1
+                    if exception := future.exception():
+                        LOGGER.warning(f"VM {vm.name} migration attempt {record.attempts} failed: {exception}")
+                        record.errors.append(str(exception))
+                        if record.attempts < self.max_attempts:
+                            record.source_node = vm.vmi.node.name
+                            pending.append(vm)
+
+        result = MigrationsResult(makespan=time.monotonic() - start_time, migrations=records)
+        LOGGER.info(f"Migrated {len(self.vms)} VMs in {result.makespan:.1f} seconds, failed: {result.failed}")
+        if result.errors:
+            LOGGER.warning(f"Failed migration attempts: {result.errors}")
+        return result
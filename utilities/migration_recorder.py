@@ -0,0 +1,157 @@
+"""
+Record VM live migrations performance: duration, data processed and downtime, attributed to the running test.
+
+A migration is recorded when wait_for_migration_finished sees it succeed: the VMIM phases timestamps, the VMI
+migrationState, the libvirt completed job downtime (from the target virt-launcher pod) and the maximum of the
+kubevirt_vmi_migration_* Prometheus series during the migration.
+"""
+
+import functools
+import logging
+import re
+import shlex
+import threading
+from datetime import datetime, timezone
+from typing import Any
+
+from ocp_resources.virtual_machine_instance_migration import VirtualMachineInstanceMigration
+from ocp_utilities.monitoring import Prometheus
+
+import utilities.infra
+
+LOGGER = logging.getLogger(__name__)
+
+MIGRATIONS_FILE_NAME = "migrations.json"
+MIGRATION_METRICS = (
+    "kubevirt_vmi_migration_data_processed_bytes",
+    "kubevirt_vmi_migration_data_total_bytes",
+    "kubevirt_vmi_migration_data_remaining_bytes",
+    "kubevirt_vmi_migration_dirty_memory_rate_bytes",
+    "kubevirt_vmi_migration_disk_transfer_rate_bytes",
+)
+# Added to the migration duration in metrics queries, to include the samples scraped after the migration started
+METRICS_WINDOW_MARGIN = 60
+LIBVIRT_DOWNTIME_REGEX = re.compile(r"^Total downtime:\s+(\d+)\s*ms", re.MULTILINE)
+
+
+class MigrationsRecorder:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.enabled = False
+        self.records: list[dict[str, Any]] = []
+
+    def record(self, record: dict[str, Any]) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def pop_records(self) -> list[dict[str, Any]]:
+        with self._lock:
+            records, self.records = self.records, []
+        return records
+
+
+MIGRATIONS_RECORDER = MigrationsRecorder()
+
+
+def enable_migrations_recording() -> None:
+    MIGRATIONS_RECORDER.enabled = True
+    LOGGER.info("Migrations recording is enabled")
+
+
+def pop_migrations_records() -> list[dict[str, Any]]:
+    """
+    Returns:
+        list: migrations recorded since the last call
+    """
+    return MIGRATIONS_RECORDER.pop_records()
+
+
+@functools.cache
+def get_migrations_prometheus() -> Prometheus:
+    return Prometheus(verify_ssl=False, bearer_token=utilities.infra.get_prometheus_k8s_token(duration="86400s"))
+
+
+def _parse_timestamp(timestamp: str | None) -> datetime | None:
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00")) if timestamp else None
+
+
+def _get_libvirt_downtime_ms(vm: Any) -> int | None:
+    vmi = vm.privileged_vmi
+    job_info = vmi.virt_launcher_pod.execute(
+        command=shlex.split(f"virsh domjobinfo --completed {vmi.namespace}_{vmi.name}"), container="compute"
+    )
+    if match := LIBVIRT_DOWNTIME_REGEX.search(job_info):
+        return int(match.group(1))
+    return None
+
+
+def _get_migration_metrics(vmi_name: str, namespace: str, window: int) -> dict[str, float | None]:
+    prometheus = get_migrations_prometheus()
+    metrics: dict[str, float | None] = {}
+    for metric in MIGRATION_METRICS:
+        query = f"max_over_time({metric}{{name='{vmi_name}',namespace='{namespace}'}}[{window}s])"
+        results = prometheus.query(query=query).get("data", {}).get("result")
+        metrics[metric] = max(float(result["value"][1]) for result in results) if results else None
+    return metrics
+
+
+def record_migration(vm: Any, migration: VirtualMachineInstanceMigration) -> None:
+    """
+    Record a succeeded migration, if migrations recording is enabled. Failures to collect the data are logged.
+
+    Args:
+        vm (VirtualMachine): migrated VM
+        migration (VirtualMachineInstanceMigration): succeeded migration
+    """
+    if not MIGRATIONS_RECORDER.enabled:
+        return
+
+    try:
+        migration_status = migration.instance.status
+        migration_state = vm.vmi.instance.status.migrationState
+        start_time = _parse_timestamp(timestamp=migration_state.startTimestamp)
+        end_time = _parse_timestamp(timestamp=migration_state.endTimestamp)
+        duration = (end_time - start_time).total_seconds() if start_time and end_time else None
+        record: dict[str, Any] = {
+            "migration": migration.name,
+            "vm": vm.name,
+            "namespace": vm.namespace,
+            "phases": {
+                phase.phase: phase.phaseTransitionTimestamp
+                for phase in migration_status.phaseTransitionTimestamps or []
+            },
+            "start": migration_state.startTimestamp,
+            "end": migration_state.endTimestamp,
+            "mode": migration_state.mode,
+            "source_node": migration_state.sourceNode,
+            "target_node": migration_state.targetNode,
+            "target_pod": migration_state.targetPod,
+            "duration": duration,
+        }
+    except Exception as exp:
+        LOGGER.warning(f"Failed to record migration {migration.name}: {exp}")
+        return
+
+    try:
+        record["downtime_ms"] = _get_libvirt_downtime_ms(vm=vm)
+    except Exception as exp:
+        LOGGER.warning(f"Failed to get migration {migration.name} downtime: {exp}")
+        record["downtime_ms"] = None
+
+    try:
+        record["metrics"] = _get_migration_metrics(
+            vmi_name=vm.vmi.name,
+            namespace=vm.namespace,
+            window=int((datetime.now(tz=timezone.utc) - start_time).total_seconds() if start_time else 0)
+            + METRICS_WINDOW_MARGIN,
+        )
+    except Exception as exp:
+        LOGGER.warning(f"Failed to get migration {migration.name} metrics: {exp}")
+        record["metrics"] = {}
+
+    record["data_processed_bytes"] = record["metrics"].get("kubevirt_vmi_migration_data_processed_bytes")
+    LOGGER.info(
+        f"Migration {migration.name}: duration {duration}s, downtime {record['downtime_ms']}ms, "
+        f"data processed {record['data_processed_bytes']} bytes"
+    )
+    MIGRATIONS_RECORDER.record(record=record)
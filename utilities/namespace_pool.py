@@ -0,0 +1,171 @@
+"""
+Provision test namespaces ahead of time and delete them off the critical path.
+"""
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from kubernetes.dynamic import DynamicClient
+from ocp_resources.namespace import Namespace
+from ocp_resources.project_project_openshift_io import Project
+from ocp_resources.project_request import ProjectRequest
+
+from utilities.constants import TIMEOUT_2MIN, TIMEOUT_6MIN
+from utilities.exceptions import NamespaceDeletionError
+from utilities.infra import label_project
+
+LOGGER = logging.getLogger(__name__)
+
+# Opt-in, with --namespace-pool-size
+NAMESPACE_POOL_SIZE = 0
+NAMESPACE_POOL_MAX_PENDING_DELETIONS = 5
+
+
+class NamespacePool:
+    """
+    Pool of the namespaces of the upcoming test modules.
+
+    Namespace names are derived from the test module path, so a namespace cannot be handed from one module to
+    another. Instead, while a module runs, the namespaces of the next `size` modules (in execution order) are
+    provisioned in the background, and released namespaces are deleted asynchronously, with at most
+    `max_pending_deletions` deletions in flight.
+
+    Namespaces are provisioned the same way as create_ns: a ProjectRequest by the unprivileged client (the project is
+    returned once it is active and its RBAC has propagated), or a Namespace by the admin client.
+    """
+
+    def __init__(
+        self,
+        names: list[str],
+        admin_client: DynamicClient,
+        unprivileged_client: DynamicClient | None = None,
+        labels: dict[str, str] | None = None,
+        size: int = NAMESPACE_POOL_SIZE,
+        max_pending_deletions: int = NAMESPACE_POOL_MAX_PENDING_DELETIONS,
+        delete_timeout: int = TIMEOUT_6MIN,
+    ) -> None:
+        """
+        Args:
+            names (list): names of the namespaces to provision, in the order they are acquired
+            admin_client (DynamicClient): admin client
+            unprivileged_client (DynamicClient, optional): client creating the projects
+            labels (dict, optional): namespaces labels
+            size (int): number of namespaces to provision ahead, 0 to provision on acquire only
+            max_pending_deletions (int): maximum number of namespaces being deleted
+            delete_timeout (int): namespace deletion timeout
+        """
+        self.names = list(names)
+        self.admin_client = admin_client
+        self.unprivileged_client = unprivileged_client
+        self.labels = labels
+        self.size = size
+        self.max_pending_deletions = max_pending_deletions
+        self.delete_timeout = delete_timeout
+        self._provision_executor = ThreadPoolExecutor(max_workers=max(size, 1))
+        self._deletion_executor = ThreadPoolExecutor(max_workers=max_pending_deletions)
+        self._provisioned: dict[str, Future] = {}
+        self._pending_deletions: dict[str, Future] = {}
+        self._failed_deletions: dict[str, BaseException] = {}
+
+    def __enter__(self) -> "NamespacePool":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def _provision(self, name: str) -> Namespace | Project:
+        LOGGER.info(f"Provisioning namespace {name}")
+        namespace: Namespace | Project
+        if self.unprivileged_client:
+            namespace = ProjectRequest(
+                name=name, client=self.unprivileged_client, delete_timeout=self.delete_timeout
+            ).deploy()
+            label_project(name=name, label=self.labels, admin_client=self.admin_client)
+        else:
+            namespace = Namespace(
+                client=self.admin_client, name=name, label=self.labels, delete_timeout=self.delete_timeout
+            )
+            namespace.deploy()
+            namespace.wait_for_status(status=Namespace.Status.ACTIVE, timeout=TIMEOUT_2MIN)
+
+        return namespace
+
+    def _collect_deletions(self) -> None:
+        for name, future in list(self._pending_deletions.items()):
+            if future.done():
+                self._pending_deletions.pop(name)
+                if exception := future.exception():
+                    LOGGER.error(f"Failed to delete namespace {name}: {exception}")
+                    self._failed_deletions[name] = exception
+
+    def acquire(self, name: str) -> Namespace | Project:
+        """
+        Get a namespace, and start provisioning the next ones.
+
+        Namespaces provisioned for modules that were skipped (ordered before `name`) are released.
+
+        Args:
+            name (str): namespace name
+
+        Returns:
+            Namespace or Project: active namespace, a Project when provisioned by the unprivileged client
+        """
+        if name in self.names:
+            index = self.names.index(name)
+            for skipped_name in self.names[:index]:
+                self._release_provisioned(name=skipped_name)
+            del self.names[: index + 1]
+
+        for next_name in self.names[: self.size]:
+            if next_name not in self._provisioned and next_name not in self._pending_deletions:
+                self._provisioned[next_name] = self._provision_executor.submit(self._provision, next_name)
+
+        if future := self._provisioned.pop(name, None):
+            return future.result()
+
+        # The namespace may still be terminating if it was used by a previous run of the module
+        if pending_deletion := self._pending_deletions.get(name):
+            wait([pending_deletion])
+            self._collect_deletions()
+
+        return self._provision(name=name)
+
+    def release(self, namespace: Namespace | Project) -> None:
+        """
+        Delete a namespace asynchronously; wait if `max_pending_deletions` namespaces are being deleted.
+
+        Args:
+            namespace (Namespace or Project): namespace to delete
+        """
+        self._collect_deletions()
+        if len(self._pending_deletions) >= self.max_pending_deletions:
+            LOGGER.info(f"Waiting for one of {len(self._pending_deletions)} namespaces deletions")
+            wait(self._pending_deletions.values(), return_when=FIRST_COMPLETED)
+            self._collect_deletions()
+
+        LOGGER.info(f"Deleting namespace {namespace.name} in the background")
+        self._pending_deletions[str(namespace.name)] = self._deletion_executor.submit(namespace.clean_up)
+
+    def _release_provisioned(self, name: str) -> None:
+        future = self._provisioned.pop(name, None)
+        if future and not future.cancel() and not future.exception():
+            self.release(namespace=future.result())
+
+    def close(self) -> None:
+        """
+        Delete the namespaces that were not acquired, and wait for all deletions.
+
+        Raises:
+            NamespaceDeletionError: if any namespace deletion failed
+        """
+        for name in list(self._provisioned):
+            self._release_provisioned(name=name)
+        self._provision_executor.shutdown(wait=True)
+
+        wait(self._pending_deletions.values())
+        self._collect_deletions()
+        self._deletion_executor.shutdown(wait=True)
+
+        if self._failed_deletions:
+            raise NamespaceDeletionError(errors=self._failed_deletions)
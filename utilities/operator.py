@@ -28,6 +28,7 @@ from pytest_testconfig import config as py_config
 from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 
 import utilities.infra
+import utilities.virt
 from utilities.constants import (
     BASE_EXCEPTIONS_DICT,
     BREW_REGISTERY_SOURCE,
@@ -767,3 +768,5 @@ def apply_icsp_idms(
         initial_mcp_conditions=mcp_conditions,
         nodes=nodes,
     )
+    # Images may now be resolved through other mirrors
+    utilities.virt.clear_fedora_vm_body_inputs()
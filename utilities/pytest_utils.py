@@ -1,4 +1,5 @@
 import getpass
+import hashlib
 import importlib
 import logging
 import os
@@ -6,7 +7,12 @@ import re
 import shutil
 import socket
 import sys
+import tempfile
 
+import kubernetes
+import urllib3
+from kubernetes.client import ApiException
+from kubernetes.config import ConfigException
 from ocp_resources.config_map import ConfigMap
 from ocp_resources.namespace import Namespace
 from ocp_resources.resource import ResourceEditor
@@ -20,10 +26,12 @@ from utilities.constants import (
     POD_SECURITY_NAMESPACE_LABELS,
     TIMEOUT_2MIN,
 )
+from utilities.data_collector import get_data_collector_base
 from utilities.exceptions import MissingEnvironmentVariableError
 from utilities.infra import exit_pytest_execution
 
 LOGGER = logging.getLogger(__name__)
+DISCOVERY_CACHE_DIRECTORY_NAME = "discovery-cache"
 
 
 def get_base_matrix_name(matrix_name):
@@ -239,3 +247,65 @@ def get_cnv_version_explorer_url(pytest_config):
         if not version_explorer_url:
             raise MissingEnvironmentVariableError("Please set CNV_VERSION_EXPLORER_URL environment variable")
         return version_explorer_url
+
+
+def get_discovery_cache_files():
+    """
+    Get the API discovery cache files for the cluster of the current kubeconfig.
+
+    The kubernetes DynamicClient caches API discovery in <tmp dir>/osrcp-<md5 of API server URL>.json, and every
+    process creating a client (get_client) reads it.
+    A copy is kept next to the data collector directory, keyed by API server URL and server version, so it survives
+    the tmp directory of containerized runs and is not reused once the cluster is upgraded.
+
+    Returns:
+        tuple: persistent cache file path, DynamicClient cache file path
+    """
+    client_configuration = kubernetes.client.Configuration()
+    kubernetes.config.load_kube_config(
+        config_file=os.environ.get("KUBECONFIG", "~/.kube/config"), client_configuration=client_configuration
+    )
+    # A single, cheap request to validate the cache against the cluster version
+    server_version = (
+        kubernetes.client.VersionApi(api_client=kubernetes.client.ApiClient(configuration=client_configuration))
+        .get_code()
+        .git_version
+    )
+    host_hash = hashlib.md5(client_configuration.host.encode("utf-8"), usedforsecurity=False).hexdigest()
+    return (
+        os.path.join(
+            f"{get_data_collector_base()}{DISCOVERY_CACHE_DIRECTORY_NAME}", f"{host_hash}-{server_version}.json"
+        ),
+        os.path.join(tempfile.gettempdir(), f"osrcp-{host_hash}.json"),
+    )
+
+
+def restore_discovery_cache():
+    """
+    Restore the persisted API discovery cache, before any client is created, so the session and its worker
+    processes do not run API discovery again.
+    """
+    try:
+        persistent_cache_file, client_cache_file = get_discovery_cache_files()
+    except (ConfigException, ApiException, urllib3.exceptions.MaxRetryError) as exp:
+        LOGGER.warning(f"API discovery cache is not used: {exp}")
+        return
+
+    py_config["discovery_cache"] = {
+        "persistent_cache_file": persistent_cache_file,
+        "client_cache_file": client_cache_file,
+    }
+    if os.path.exists(persistent_cache_file):
+        LOGGER.info(f"Using API discovery cache {persistent_cache_file}")
+        shutil.copyfile(persistent_cache_file, client_cache_file)
+    elif os.path.exists(client_cache_file):
+        # Cached for another server version
+        os.remove(client_cache_file)
+
+
+def save_discovery_cache():
+    discovery_cache = py_config.get("discovery_cache")
+    if discovery_cache and os.path.exists(discovery_cache["client_cache_file"]):
+        persistent_cache_file = discovery_cache["persistent_cache_file"]
+        os.makedirs(os.path.dirname(persistent_cache_file), exist_ok=True)
+        shutil.copyfile(discovery_cache["client_cache_file"], persistent_cache_file)
@@ -0,0 +1,182 @@
+"""
+Background teardown of context managed resources.
+
+With --background-teardown, leaf resources (REAPER_BACKGROUND_RESOURCES: VMs, DataVolumes, Secrets and Services)
+leaving their context during the pytest teardown phase are deleted (Resource.clean_up, including waiting for
+finalizers) by a background reaper, so the deletion overlaps with the next test setup.
+Other resources (e.g. namespaces, node or cluster configuration) keep their synchronous teardown, so the teardown order
+of module and session fixtures is kept and their teardown errors still fail the owning test.
+Deploying a resource with the same kind, name and namespace as a resource being deleted waits for its deletion.
+At session end, deletions are given REAPER_SESSION_DEADLINE to complete; resources that were not deleted are reported
+and saved, and removed by leftovers_cleanup in the next session.
+"""
+
+import json
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.exceptions import NotFoundError
+from ocp_resources.datavolume import DataVolume
+from ocp_resources.resource import Resource
+from ocp_resources.secret import Secret
+from ocp_resources.service import Service
+from ocp_resources.virtual_machine import VirtualMachine
+
+from utilities.constants import TIMEOUT_10MIN
+from utilities.data_collector import get_data_collector_base
+
+LOGGER = logging.getLogger(__name__)
+
+REAPER_MAX_WORKERS = 10
+REAPER_SESSION_DEADLINE = TIMEOUT_10MIN
+REAPER_LEFTOVERS_FILE_NAME = "teardown-leftovers.json"
+# Resources no other resource depends on for its teardown
+REAPER_BACKGROUND_RESOURCES = (VirtualMachine, DataVolume, Secret, Service)
+
+
+def get_reaper_leftovers_file() -> str:
+    # Not under the data collector directory, which is removed at session start
+    return f"{get_data_collector_base()}{REAPER_LEFTOVERS_FILE_NAME}"
+
+
+class ResourceReaper:
+    def __init__(self, max_workers: int = REAPER_MAX_WORKERS) -> None:
+        self.active = False
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        # {(kind, namespace, name): (resource, clean_up future)}
+        self._pending: dict[tuple[str, str | None, str | None], tuple[Resource, Future]] = {}
+
+    @staticmethod
+    def _resource_key(resource: Resource) -> tuple[str, str | None, str | None]:
+        return resource.kind, getattr(resource, "namespace", None), resource.name
+
+    def reap(self, resource: Resource) -> None:
+        LOGGER.info(f"Deleting {resource.kind} {resource.name} in the background")
+        with self._lock:
+            self._pending[self._resource_key(resource=resource)] = (
+                resource,
+                self._executor.submit(resource.clean_up),
+            )
+
+    def wait_for(self, resource: Resource) -> None:
+        """
+        Wait for the deletion of a resource with the same kind, name and namespace, if any.
+
+        Args:
+            resource (Resource): resource about to be deployed
+        """
+        with self._lock:
+            pending = self._pending.get(self._resource_key(resource=resource))
+
+        if pending:
+            LOGGER.info(f"Waiting for {resource.kind} {resource.name} background deletion")
+            wait([pending[1]])
+
+    def close(self, timeout: int = REAPER_SESSION_DEADLINE) -> list[dict[str, Any]]:
+        """
+        Wait for all deletions, up to timeout.
+
+        Args:
+            timeout (int): deadline for all pending deletions
+
+        Returns:
+            list: resources that were not deleted (kind, api_version, name, namespace)
+        """
+        with self._lock:
+            pending = list(self._pending.values())
+
+        if pending:
+            LOGGER.info(f"Waiting up to {timeout} seconds for {len(pending)} background deletions")
+        wait([future for _, future in pending], timeout=timeout)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+        leftovers = []
+        for resource, future in pending:
+            if future.done() and not future.cancelled() and not future.exception() and future.result():
+                continue
+            error = future.exception() if future.done() and not future.cancelled() else "deletion did not complete"
+            LOGGER.error(f"{resource.kind} {resource.name} was not deleted: {error}")
+            leftovers.append({
+                "kind": resource.kind,
+                "api_version": resource.api_version,
+                "name": resource.name,
+                "namespace": getattr(resource, "namespace", None),
+            })
+
+        return leftovers
+
+
+RESOURCE_REAPER = ResourceReaper()
+
+
+def enable_background_teardown() -> None:
+    """
+    Route the context teardown of REAPER_BACKGROUND_RESOURCES to RESOURCE_REAPER while it is active, and make
+    Resource.deploy wait for the background deletion of the same resource.
+    """
+    if getattr(Resource.__exit__, "background_teardown", False):
+        return
+
+    original_exit = Resource.__exit__
+    original_deploy = Resource.deploy
+
+    def _exit(self, exc_type=None, exc_val=None, exc_tb=None):
+        if self.teardown and RESOURCE_REAPER.active and isinstance(self, REAPER_BACKGROUND_RESOURCES):
+            RESOURCE_REAPER.reap(resource=self)
+            return
+        original_exit(self, exc_type, exc_val, exc_tb)
+
+    def _deploy(self, *args, **kwargs):
+        RESOURCE_REAPER.wait_for(resource=self)
+        return original_deploy(self, *args, **kwargs)
+
+    _exit.background_teardown = True  # type: ignore[attr-defined]
+    Resource.__exit__ = _exit  # type: ignore[method-assign]
+    Resource.deploy = _deploy  # type: ignore[method-assign]
+    LOGGER.info("Background teardown is enabled")
+
+
+def set_background_teardown_active(active: bool) -> None:
+    RESOURCE_REAPER.active = active
+
+
+def save_reaper_leftovers() -> None:
+    """
+    Wait for the background deletions and save the resources that were not deleted, for leftovers_cleanup.
+    """
+    if leftovers := RESOURCE_REAPER.close():
+        leftovers_file = get_reaper_leftovers_file()
+        LOGGER.error(f"{len(leftovers)} resources were not deleted, saved to {leftovers_file}")
+        with open(leftovers_file, "w") as fd:
+            json.dump(leftovers, fd)
+
+
+def delete_reaper_leftovers(client: DynamicClient) -> None:
+    """
+    Delete the resources that the background reaper of a previous session did not delete.
+
+    Args:
+        client (DynamicClient): admin client
+    """
+    leftovers_file = get_reaper_leftovers_file()
+    if not os.path.exists(leftovers_file):
+        return
+
+    with open(leftovers_file) as fd:
+        leftovers = json.load(fd)
+
+    for leftover in leftovers:
+        LOGGER.info(f"Deleting teardown leftover {leftover['kind']} {leftover['name']}")
+        try:
+            client.resources.get(api_version=leftover["api_version"], kind=leftover["kind"]).delete(
+                name=leftover["name"], namespace=leftover["namespace"]
+            )
+        except NotFoundError:
+            continue
+
+    os.remove(leftovers_file)
@@ -0,0 +1,299 @@
+"""
+Pooled SSH connections to VMs, reused across VirtualMachineForTests.ssh_exec commands.
+
+Each command run through a plain rrmngmnt RemoteExecutor spawns a `virtctl port-forward --stdio` process and does a
+full SSH handshake. The pooled executor keeps one connected paramiko client per VM and credentials, with keepalive,
+and runs each command in a new channel of that client's transport.
+A connection whose transport is no longer active (e.g. the port-forward ended after the VM migrated or restarted) is
+re-established when the next session is opened. Connections of a migrated or deleted VM are closed explicitly, as
+the port-forward may only end after the keepalive interval.
+
+The pooled executor relies on rrmngmnt private API, which is only used through RrmngmntPrivateApi; with an rrmngmnt
+version it was not verified with, the plain RemoteExecutorFactory should be used (see RrmngmntPrivateApi.supported).
+"""
+
+import functools
+import importlib.metadata
+import logging
+import os
+import socket
+import threading
+
+import paramiko
+from packaging.version import Version
+from rrmngmnt import ssh
+from rrmngmnt.executor import Executor
+from rrmngmnt.user import UserWithPKey
+
+LOGGER = logging.getLogger(__name__)
+
+SSH_KEEPALIVE_INTERVAL = 15
+# Errors after which a pooled connection cannot be reused; a command timeout does not break the connection
+SSH_CONNECTION_ERRORS = (paramiko.SSHException, EOFError, socket.error)
+# rrmngmnt versions RrmngmntPrivateApi was verified with: minimum included, maximum excluded
+RRMNGMNT_MIN_VERSION = Version("0.1.32")
+RRMNGMNT_MAX_VERSION = Version("0.3")
+
+
+class RrmngmntPrivateApi:
+    """
+    rrmngmnt private API used by PooledRemoteExecutor: RemoteExecutor.Session._get_pkey and
+    _update_timeout_exception, and RemoteExecutor.Command._out.
+    """
+
+    @staticmethod
+    @functools.cache
+    def supported() -> bool:
+        rrmngmnt_version = Version(importlib.metadata.version("python-rrmngmnt"))
+        if RRMNGMNT_MIN_VERSION <= rrmngmnt_version < RRMNGMNT_MAX_VERSION:
+            return True
+
+        LOGGER.warning(f"SSH connections pooling is not verified with rrmngmnt {rrmngmnt_version}, it is disabled")
+        return False
+
+    @staticmethod
+    @functools.cache
+    def get_pkey(filename: str) -> paramiko.PKey:
+        # Cached, instead of reading the private key for every session
+        return ssh.RemoteExecutor.Session._get_pkey(filename=filename)
+
+    @staticmethod
+    def update_timeout_exception(session: ssh.RemoteExecutor.Session, exception: socket.timeout) -> None:
+        session._update_timeout_exception(exception)
+
+    @staticmethod
+    def command_started(command: ssh.RemoteExecutor.Command) -> bool:
+        return command._out is not None
+
+
+def get_host_ssh_key_file() -> str:
+    # The private key of RemoteExecutor use_pkey
+    return os.getenv("HOST_SSH_KEY", ssh.ID_RSA_PRV % os.path.expanduser("~"))
+
+
+class SSHConnectionPool:
+    """
+    Connected paramiko clients by (namespace, VM name, username, credentials); the credentials are the private key
+    file, or the password.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._key_locks: dict[tuple[str, str, str, str | None], threading.Lock] = {}
+        self._clients: dict[tuple[str, str, str, str | None], paramiko.SSHClient] = {}
+
+    def get(
+        self, key: tuple[str, str, str, str | None], session: "PooledRemoteExecutor.Session"
+    ) -> tuple[paramiko.SSHClient, bool]:
+        """
+        Args:
+            key (tuple): namespace, VM name, username and credentials
+            session (PooledRemoteExecutor.Session): session to connect with, if there is no active connection
+
+        Returns:
+            tuple: connected client, and True if it is a pooled connection (False if it was just connected)
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Connections to different VMs are established concurrently
+        with key_lock:
+            client = self._clients.get(key)
+            transport = client.get_transport() if client else None
+            if client and transport and transport.is_active():
+                return client, True
+
+            if client:
+                LOGGER.info(f"SSH connection to {key[0]}/{key[1]} is not active, reconnecting")
+                _close_client(client=client)
+            client = session.connect()
+            self._clients[key] = client
+            return client, False
+
+    def invalidate(self, key: tuple[str, str, str, str | None], client: paramiko.SSHClient) -> None:
+        """
+        Close the pooled connection, if it is still the given client.
+        """
+        with self._lock:
+            if self._clients.get(key) is client:
+                del self._clients[key]
+        _close_client(client=client)
+
+    def close(self, namespace: str | None = None, name: str | None = None) -> None:
+        """
+        Close pooled connections; all of them, or only the connections to the given VM.
+
+        Args:
+            namespace (str, optional): VM namespace
+            name (str, optional): VM name
+        """
+        with self._lock:
+            keys = [key for key in self._clients if namespace is None or (key[0], key[1]) == (namespace, name)]
+            clients = [self._clients.pop(key) for key in keys]
+        for client in clients:
+            _close_client(client=client)
+
+
+SSH_CONNECTION_POOL = SSHConnectionPool()
+
+
+def close_vm_ssh_connections(vm) -> None:
+    """
+    Close the pooled SSH connections to a VM, to reconnect to its new VMI on the next command.
+
+    Args:
+        vm (VirtualMachineForTests): VM which was migrated or deleted
+    """
+    SSH_CONNECTION_POOL.close(namespace=vm.namespace, name=vm.name)
+
+
+def _close_client(client: paramiko.SSHClient) -> None:
+    transport = client.get_transport()
+    sock = transport.sock if transport else None
+    client.close()
+    if isinstance(sock, paramiko.ProxyCommand):
+        try:
+            sock.close()
+            sock.process.wait(timeout=5)
+        except Exception as exp:
+            LOGGER.debug(f"Failed to stop SSH proxy command: {exp}")
+
+
+class PooledRemoteExecutor(ssh.RemoteExecutor):
+    """
+    RemoteExecutor whose sessions share the pooled connection of the VM.
+    """
+
+    class Session(ssh.RemoteExecutor.Session):
+        def __init__(self, executor: "PooledRemoteExecutor", timeout: float | None = None) -> None:
+            # Skip RemoteExecutor.Session init, which creates a client and reads the private key for every session
+            Executor.Session.__init__(self, executor)
+            self._timeout = timeout or ssh.RemoteExecutor.TCP_TIMEOUT
+            self._ssh: paramiko.SSHClient | None = None
+            self._reused = False
+            if isinstance(executor.user, UserWithPKey):
+                self.pkey = RrmngmntPrivateApi.get_pkey(filename=executor.user.private_key)
+            elif executor.use_pkey:
+                self.pkey = RrmngmntPrivateApi.get_pkey(filename=get_host_ssh_key_file())
+                executor.user.password = None
+            else:
+                self.pkey = None
+
+        def connect(self) -> paramiko.SSHClient:
+            """
+            Returns:
+                paramiko.SSHClient: new client, connected through a new proxy command process
+            """
+            LOGGER.info(f"Opening SSH connection to {self._executor.pool_key[0]}/{self._executor.pool_key[1]}")
+            client = paramiko.SSHClient()
+            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            try:
+                client.connect(
+                    self._executor.address,
+                    username=self._executor.user.name,
+                    password=self._executor.user.password,
+                    timeout=self._timeout,
+                    pkey=self.pkey,
+                    port=self._executor.port,
+                    sock=paramiko.ProxyCommand(self._executor.proxy_command),
+                    banner_timeout=self._executor.banner_timeout,
+                )
+            except Exception as exp:
+                _close_client(client=client)
+                if isinstance(exp, socket.timeout):
+                    RrmngmntPrivateApi.update_timeout_exception(session=self, exception=exp)
+                raise
+
+            client.get_transport().set_keepalive(SSH_KEEPALIVE_INTERVAL)
+            return client
+
+        def open(self) -> None:
+            self._ssh, self._reused = SSH_CONNECTION_POOL.get(key=self._executor.pool_key, session=self)
+
+        def run_cmd(self, cmd, input_=None, timeout=None, get_pty=False):
+            if self._executor.sudo:
+                cmd.insert(0, "sudo")
+
+            command = self.command(cmd)
+            try:
+                return command.run(input_, timeout, get_pty=get_pty)
+            except SSH_CONNECTION_ERRORS as exp:
+                # A pooled connection may end before its transport notices it; the command is run again on a new
+                # connection only if it was not started
+                if (
+                    not self._reused
+                    or RrmngmntPrivateApi.command_started(command=command)
+                    or isinstance(exp, socket.timeout)
+                ):
+                    raise
+                LOGGER.info(f"SSH connection to {self._executor.pool_key[1]} ended, reconnecting: {exp}")
+
+            SSH_CONNECTION_POOL.invalidate(key=self._executor.pool_key, client=self._ssh)
+            self.open()
+            return self.command(cmd).run(input_, timeout, get_pty=get_pty)
+
+        def close(self) -> None:
+            # The connection stays open in the pool
+            pass
+
+        def __exit__(self, type_, value, tb) -> None:
+            if type_ is socket.timeout:
+                RrmngmntPrivateApi.update_timeout_exception(session=self, exception=value)
+            if (
+                type_
+                and issubclass(type_, SSH_CONNECTION_ERRORS)
+                and not issubclass(type_, socket.timeout)
+                and self._ssh
+            ):
+                LOGGER.info(f"Closing SSH connection to {self._executor.pool_key[1]} after error: {value}")
+                SSH_CONNECTION_POOL.invalidate(key=self._executor.pool_key, client=self._ssh)
+
+    def __init__(self, pool_key: tuple[str, str, str, str | None], proxy_command: str, **kwargs) -> None:
+        """
+        Args:
+            pool_key (tuple): namespace, VM name, username and credentials
+            proxy_command (str): command connecting to the VM SSH port, e.g. virtctl port-forward --stdio
+        """
+        super().__init__(**kwargs)
+        self.pool_key = pool_key
+        self.proxy_command = proxy_command
+
+    def session(self, timeout: float | None = None) -> "PooledRemoteExecutor.Session":
+        return PooledRemoteExecutor.Session(self, timeout)
+
+
+class PooledRemoteExecutorFactory(ssh.RemoteExecutorFactory):
+    """
+    Build PooledRemoteExecutor; the proxy command process is only started when a new connection is needed.
+    """
+
+    def __init__(self, namespace: str, name: str, proxy_command: str, **kwargs) -> None:
+        """
+        Args:
+            namespace (str): VM namespace
+            name (str): VM name
+            proxy_command (str): command connecting to the VM SSH port, e.g. virtctl port-forward --stdio
+        """
+        super().__init__(**kwargs)
+        self.namespace = namespace
+        self.name = name
+        self.proxy_command = proxy_command
+
+    def build(self, host, user, sudo=False) -> PooledRemoteExecutor:
+        if isinstance(user, UserWithPKey):
+            credentials = user.private_key
+        elif self.use_pkey:
+            credentials = get_host_ssh_key_file()
+        else:
+            credentials = user.password
+
+        return PooledRemoteExecutor(
+            pool_key=(self.namespace, self.name, user.name, credentials),
+            proxy_command=self.proxy_command,
+            user=user,
+            address=host.ip,
+            use_pkey=self.use_pkey,
+            port=self.port,
+            sudo=sudo,
+            banner_timeout=self.banner_timeout,
+        )
@@ -125,8 +125,7 @@ def wait_for_ssp_conditions(
         condition_key1="type",
         condition_key2="status",
         total_timeout=TIMEOUT_3MIN,
-        polling_interval=polling_interval,
-        consecutive_checks_count=consecutive_checks_count,
+        stability_duration=(consecutive_checks_count - 1) * polling_interval,
     )
 
 
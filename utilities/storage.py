@@ -2,6 +2,8 @@ import logging
 import math
 import os
 import shlex
+import time
+from collections import Counter
 from contextlib import contextmanager
 
 import kubernetes
@@ -35,6 +37,7 @@ from utilities.constants import (
     OS_FLAVOR_CIRROS,
     OS_FLAVOR_WINDOWS,
     POD_CONTAINER_SPEC,
+    TIMEOUT_1MIN,
     TIMEOUT_1SEC,
     TIMEOUT_2MIN,
     TIMEOUT_3MIN,
@@ -49,13 +52,35 @@ from utilities.constants import (
     TIMEOUT_60MIN,
     Images,
 )
-from utilities.exceptions import UrlNotFoundError
+from utilities.dv_throughput import sample_dv_throughput
+from utilities.exceptions import DataVolumeImportError, UrlNotFoundError
+from utilities.golden_images import (
+    find_golden_image,
+    get_golden_image_annotations,
+    get_golden_image_labels,
+    get_url_content_id,
+    is_golden_image_up_to_date,
+    mark_golden_image_used,
+)
+from utilities.watch import watch_raw_objects
 
 HOTPLUG_VOLUME = "hotplugVolume"
 DATA_IMPORT_CRON_SUFFIX = "-image-cron"
 RESOURCE_MANAGED_BY_DATA_IMPORT_CRON_LABEL = f"{NamespacedResource.ApiGroup.CDI_KUBEVIRT_IO}/dataImportCron"
 HOSTPATH_CSI = "hostpath-csi"
 HPP_CSI = "hpp-csi"
+DV_IMPORT_MAX_PER_STORAGE_CLASS = 5
+DV_IMPORT_MAX_PER_NODE = 2
+# Importer pod restarts after which a DataVolume import is considered failed
+DV_IMPORT_MAX_RESTARTS = 3
+IMPORTER_POD_LABEL_SELECTOR = f"{CDI_LABEL}=importer"
+# DataVolume phases before its importer pod runs on a node
+DV_IMPORT_UNPLACED_PHASES = (
+    None,
+    DataVolume.Status.PENDING,
+    DataVolume.Status.PVC_BOUND,
+    DataVolume.Status.IMPORT_SCHEDULED,
+)
 
 
 LOGGER = logging.getLogger(__name__)
@@ -122,6 +147,8 @@ def create_dv(
     bind_immediate=None,
     preallocation=None,
     api_name="storage",
+    labels=None,
+    annotations=None,
 ):
     artifactory_secret = None
     cert_created = None
@@ -157,10 +184,13 @@ def create_dv(
         teardown=teardown,
         preallocation=preallocation,
         api_name=api_name,
+        label=labels,
+        annotations=annotations,
     ) as dv:
-        if sc_volume_binding_mode_is_wffc(sc=storage_class) and consume_wffc:
-            create_dummy_first_consumer_pod(dv=dv)
-        yield dv
+        with sample_dv_throughput(dv=dv, size=size, source=source):
+            if sc_volume_binding_mode_is_wffc(sc=storage_class) and consume_wffc:
+                create_dummy_first_consumer_pod(dv=dv)
+            yield dv
     utilities.infra.cleanup_artifactory_secret_and_config_map(
         artifactory_secret=artifactory_secret, artifactory_config_map=cert_created
     )
@@ -187,7 +217,9 @@ def data_volume(
         schedulable_nodes (list): List of schedulable nodes objects
         os_matrix (dict): Contains current os_matrix attributes
         check_dv_exists (bool): Skip DV creation if DV exists. Used for golden images. IF the DV exists in golden images
-        namespace, it can be used for cloning.
+        namespace, it can be used for cloning. With --golden-image-reuse, golden images are indexed by their source
+        image content: a DV with the same name and stale content is replaced, a DV of the same image on the same
+        storage class is cloned, and created DVs are kept after the session.
         bind_immediate (bool): if True, cdi.kubevirt.io/storage.bind.immediate.requested annotation
 
     Yields:
@@ -227,6 +259,9 @@ def data_volume(
     url = f"{get_test_artifact_server_url()}{image}" if source == "http" else None
 
     is_golden_image = False
+    golden_image_labels = None
+    golden_image_annotations = None
+    source_pvc = None
     # For golden images; images are created once per module in
     # golden images namepace and cloned when using common templates.
     # If the DV exists, yield the DV else create a new one in
@@ -237,12 +272,35 @@ def data_volume(
         consume_wffc = False
         bind_immediate = True
         is_golden_image = True
+        if url and py_config.get("golden_image_reuse") and not utilities.infra.url_excluded_from_validation(url):
+            content_id = get_url_content_id(url=url)
+            golden_image_labels = get_golden_image_labels(
+                url=url, content_id=content_id, storage_class=params_dict.get("storage_class", storage_class)
+            )
+            golden_image_annotations = get_golden_image_annotations(url=url, content_id=content_id)
         try:
-            golden_image = list(DataVolume.get(dyn_client=admin_client, name=dv_name, namespace=dv_namespace))
-            yield golden_image[0]
+            golden_image = list(DataVolume.get(dyn_client=admin_client, name=dv_name, namespace=dv_namespace))[0]
+            if not golden_image_labels or is_golden_image_up_to_date(dv=golden_image, labels=golden_image_labels):
+                if golden_image_labels:
+                    mark_golden_image_used(dv=golden_image)
+                yield golden_image
+                return
+            LOGGER.warning(f"Golden image {dv_name} source content changed; DV will be re-created.")
+            golden_image.clean_up()
         except NotFoundError:
             LOGGER.warning(f"Golden image {dv_name} not found; DV will be created.")
 
+        if golden_image_labels and (
+            indexed_golden_image := find_golden_image(
+                client=admin_client, namespace=dv_namespace, labels=golden_image_labels
+            )
+        ):
+            LOGGER.info(f"Golden image {dv_name} will be cloned from {indexed_golden_image.name}")
+            mark_golden_image_used(dv=indexed_golden_image)
+            source = "pvc"
+            source_pvc = indexed_golden_image.name
+            url = None
+
     # In hpp, volume must reside on the same worker as the VM
     # This is not needed for golden image PVC
     hostpath_node = (
@@ -265,7 +323,14 @@ def data_volume(
         "bind_immediate": bind_immediate,
         "preallocation": params_dict.get("preallocation", None),
         "url": url,
+        "source_pvc": source_pvc,
+        "source_namespace": dv_namespace if source_pvc else None,
+        "labels": golden_image_labels,
+        "annotations": golden_image_annotations,
     }
+    if golden_image_labels:
+        # Indexed golden images are kept for later sessions, and deleted by delete_stale_golden_images
+        dv_kwargs["teardown"] = False
     if params_dict.get("cert_configmap"):
         dv_kwargs["cert_configmap"] = params_dict.get("cert_configmap")
     # Create dv
@@ -288,9 +353,209 @@ def data_volume(
                     dv.wait_for_status(status="PendingPopulation", timeout=TIMEOUT_10SEC)
                 else:
                     dv.wait_for_dv_success(timeout=TIMEOUT_60MIN if OS_FLAVOR_WINDOWS in image else TIMEOUT_30MIN)
+                    if golden_image_labels:
+                        mark_golden_image_used(dv=dv, labels=golden_image_labels)
         yield dv
 
 
+def _get_import_state(client, namespaces):
+    dvs_status = {
+        (dv.metadata.namespace, dv.metadata.name): dv.status
+        for namespace in namespaces
+        for dv in DataVolume.get(dyn_client=client, namespace=namespace, raw=True)
+    }
+    node_imports = Counter(
+        pod.spec.nodeName
+        for namespace in namespaces
+        for pod in Pod.get(dyn_client=client, namespace=namespace, label_selector=IMPORTER_POD_LABEL_SELECTOR, raw=True)
+        if pod.spec.nodeName and pod.status.phase not in (Pod.Status.SUCCEEDED, Pod.Status.FAILED)
+    )
+    return dvs_status, node_imports
+
+
+def import_data_volumes(
+    dvs,
+    timeout=TIMEOUT_30MIN,
+    max_per_storage_class=DV_IMPORT_MAX_PER_STORAGE_CLASS,
+    max_per_node=DV_IMPORT_MAX_PER_NODE,
+    max_restarts=DV_IMPORT_MAX_RESTARTS,
+):
+    """
+    Deploy DataVolumes and wait for their imports, with limited concurrent imports per storage class and per node.
+
+    A DataVolume is deployed when fewer than max_per_storage_class imports of its storage class are running. When its
+    node is known ahead (hostpath_node), it is also deployed only when fewer than max_per_node imports run on that node:
+    the importer pods observed on the node, including those of DataVolumes without a known node, and the deployed
+    DataVolumes of the node whose importer pod does not run yet.
+    Imports progress (status.progress) is logged.
+
+    Args:
+        dvs (list): DataVolume objects to deploy, in deployment order
+        timeout (int): time to wait for each import to succeed, from its DataVolume deployment
+        max_per_storage_class (int): maximum concurrent imports per storage class
+        max_per_node (int): maximum concurrent importer pods per node
+        max_restarts (int): importer pod restarts after which an import is considered failed
+
+    Raises:
+        DataVolumeImportError: on the first failed import, failed phase or more than max_restarts importer restarts;
+            the other DataVolumes are not waited for
+        TimeoutExpiredError: if an import did not succeed within timeout
+    """
+    pending = list(dvs)
+    running = []
+    progress = {}
+    deploy_times = {}
+    seen = set()
+    namespaces = {dv.namespace for dv in dvs}
+    LOGGER.info(f"Importing {len(pending)} DataVolumes")
+    try:
+        # Each import has its own timeout; the sampler timeout only bounds DataVolumes that could never be deployed
+        for dvs_status, node_imports in TimeoutSampler(
+            wait_timeout=timeout * len(dvs),
+            sleep=TIMEOUT_5SEC,
+            func=_get_import_state,
+            client=dvs[0].client,
+            namespaces=namespaces,
+        ):
+            for dv in list(running):
+                dv_key = (dv.namespace, dv.name)
+                status = dvs_status.get(dv_key)
+                if not status:
+                    # A DataVolume which is garbage collected after it succeeded no longer exists
+                    if dv_key in seen and dv_key not in dvs_status:
+                        LOGGER.info(f"DataVolume {dv.name} imported and garbage collected")
+                        running.remove(dv)
+                    # A just deployed DataVolume may not have a status yet
+                    elif time.monotonic() - deploy_times[dv_key] > timeout:
+                        raise TimeoutExpiredError(f"DataVolume {dv.name} has no status after {timeout} seconds")
+                    continue
+
+                seen.add(dv_key)
+                if status.phase == DataVolume.Status.SUCCEEDED:
+                    LOGGER.info(f"DataVolume {dv.name} imported")
+                    running.remove(dv)
+                elif status.phase == DataVolume.Status.FAILED or (status.restartCount or 0) > max_restarts:
+                    raise DataVolumeImportError(dv_name=dv.name, namespace=dv.namespace, status=status)
+                elif time.monotonic() - deploy_times[dv_key] > timeout:
+                    raise TimeoutExpiredError(f"DataVolume {dv.name} import did not finish after {timeout} seconds")
+                elif status.progress and status.progress != progress.get(dv.name):
+                    progress[dv.name] = status.progress
+                    LOGGER.info(f"DataVolume {dv.name} import progress: {status.progress}")
+
+            storage_class_imports = Counter(dv.storage_class for dv in running)
+            # Imports of DataVolumes with a known node whose importer pod does not run yet
+            node_imports.update(
+                dv.hostpath_node
+                for dv in running
+                if dv.hostpath_node
+                and getattr(dvs_status.get((dv.namespace, dv.name)), "phase", None) in DV_IMPORT_UNPLACED_PHASES
+            )
+            for dv in list(pending):
+                if storage_class_imports[dv.storage_class] >= max_per_storage_class:
+                    continue
+                if dv.hostpath_node:
+                    if node_imports[dv.hostpath_node] >= max_per_node:
+                        continue
+                    node_imports[dv.hostpath_node] += 1
+                dv.deploy()
+                deploy_times[(dv.namespace, dv.name)] = time.monotonic()
+                pending.remove(dv)
+                running.append(dv)
+                storage_class_imports[dv.storage_class] += 1
+
+            if not pending and not running:
+                return
+    except TimeoutExpiredError:
+        LOGGER.error(
+            f"DataVolumes imports did not finish, running: {[dv.name for dv in running]}, "
+            f"pending: {[dv.name for dv in pending]}"
+        )
+        raise
+
+
+def wait_for_data_volumes_success(
+    dv_names,
+    namespace,
+    client=None,
+    timeout=TIMEOUT_30MIN,
+    failure_timeout=TIMEOUT_2MIN,
+    max_restarts=None,
+    pvc_wait_for_bound_timeout=TIMEOUT_1MIN,
+):
+    """
+    Wait for DataVolumes to succeed concurrently, from watches on the namespace DataVolumes, then for their PVCs to be
+    Bound, like DataVolume.wait_for_dv_success.
+
+    A DataVolume which no longer exists after it was seen was garbage collected after it succeeded.
+
+    Args:
+        dv_names (list): DataVolumes names
+        namespace (str): DataVolumes namespace
+        client (DynamicClient, optional): client to watch with
+        timeout (int): time to wait for all DataVolumes to succeed
+        failure_timeout (int): time to wait for all DataVolumes to exist and have a phase other than Pending
+        max_restarts (int, optional): importer pod restarts after which a DataVolume is considered failed; not
+            limited by default
+        pvc_wait_for_bound_timeout (int): time to wait for each PVC to be Bound, once its DataVolume succeeded
+
+    Raises:
+        DataVolumeImportError: on the first failed DataVolume, failed phase or more than max_restarts restarts
+        TimeoutExpiredError: if a DataVolume is absent, Pending or without a status after failure_timeout, not all
+            DataVolumes succeeded within timeout, or a PVC is not Bound
+    """
+    dvs_api = DataVolume(name=dv_names[0], namespace=namespace, client=client).api
+    start_time = time.monotonic()
+    seen = set()
+    not_started = set(dv_names)
+    try:
+        for raw_dvs in watch_raw_objects(api=dvs_api, timeout=failure_timeout, namespace=namespace):
+            for dv_name in set(not_started):
+                raw_dv = raw_dvs.get((namespace, dv_name))
+                if raw_dv:
+                    seen.add(dv_name)
+                if (not raw_dv and dv_name in seen) or (
+                    raw_dv and raw_dv.get("status", {}).get("phase") not in (None, DataVolume.Status.PENDING)
+                ):
+                    not_started.discard(dv_name)
+
+            if not not_started:
+                break
+    except TimeoutExpiredError:
+        LOGGER.error(f"DataVolumes {sorted(not_started)} are absent, Pending or without a status")
+        raise
+
+    succeeded = {}
+    try:
+        for raw_dvs in watch_raw_objects(api=dvs_api, timeout=timeout, namespace=namespace):
+            for dv_name in set(dv_names) - set(succeeded):
+                raw_dv = raw_dvs.get((namespace, dv_name))
+                status = (raw_dv or {}).get("status", {})
+                if raw_dv:
+                    seen.add(dv_name)
+                if status.get("phase") == DataVolume.Status.SUCCEEDED or (not raw_dv and dv_name in seen):
+                    succeeded[dv_name] = time.monotonic() - start_time
+                elif status.get("phase") == DataVolume.Status.FAILED or (
+                    max_restarts is not None and status.get("restartCount", 0) > max_restarts
+                ):
+                    raise DataVolumeImportError(dv_name=dv_name, namespace=namespace, status=status)
+
+            if len(succeeded) == len(set(dv_names)):
+                slowest_dv = max(succeeded, key=succeeded.get)
+                LOGGER.info(
+                    f"DataVolumes {dv_names} succeeded, slowest: {slowest_dv} after {succeeded[slowest_dv]:.1f} seconds"
+                )
+                break
+    except TimeoutExpiredError:
+        LOGGER.error(f"DataVolumes {sorted(set(dv_names) - set(succeeded))} did not succeed")
+        raise
+
+    # For CSI storage, PVC gets Bound after DV succeeded
+    for dv_name in succeeded:
+        PersistentVolumeClaim(name=dv_name, namespace=namespace, client=client).wait_for_status(
+            status=PersistentVolumeClaim.Status.BOUND, timeout=pvc_wait_for_bound_timeout
+        )
+
+
 def get_downloaded_artifact(remote_name, local_name):
     """
     Download image or artifact to local tmpdir path
@@ -0,0 +1,153 @@
+"""
+Client side processing of OpenShift Templates, following the server side processor (processedtemplates):
+parameters generation, ${PARAM} and ${{PARAM}} substitution, hardcoded namespaces stripping and object labels.
+"""
+
+import json
+import re
+import secrets
+import string
+from typing import Any
+
+from utilities.exceptions import TemplateProcessingError
+
+STRING_PARAMETER_REGEX = re.compile(r"\$\{([a-zA-Z0-9_]+)\}")
+NON_STRING_PARAMETER_REGEX = re.compile(r"^\$\{\{([a-zA-Z0-9_]+)\}\}$")
+GENERATOR_REGEX = re.compile(r"\[([a-zA-Z0-9\-\\]+)\]\{(\w+)\}")
+GENERATOR_RANGE_REGEX = re.compile(r"\\[wdaA]|[a-zA-Z0-9]-[a-zA-Z0-9]|[a-zA-Z0-9]")
+GENERATOR_MAX_LENGTH = 255
+EXPRESSION_GENERATOR = "expression"
+GENERATOR_CHARACTER_CLASSES = {
+    r"\w": string.ascii_letters + string.digits + "_",
+    r"\d": string.digits,
+    r"\a": string.ascii_letters + string.digits,
+    r"\A": "~!@#$%^&*()-_+={}[]\\|<,>.?/\"';:`",
+}
+
+
+def _expression_characters(ranges: str) -> str:
+    characters = ""
+    for char_range in GENERATOR_RANGE_REGEX.findall(ranges):
+        if char_range in GENERATOR_CHARACTER_CLASSES:
+            characters += GENERATOR_CHARACTER_CLASSES[char_range]
+        elif len(char_range) == 3:
+            if char_range[0] > char_range[2]:
+                raise TemplateProcessingError(f"Invalid range {char_range} in generator expression")
+            characters += "".join(chr(char) for char in range(ord(char_range[0]), ord(char_range[2]) + 1))
+        else:
+            characters += char_range
+    return characters
+
+
+def generate_expression_value(expression: str) -> str:
+    """
+    Generate a value from an "expression" generator, e.g. "[a-z0-9]{4}-[\\w]{8}".
+
+    Args:
+        expression (str): generator expression
+
+    Returns:
+        str: expression, with each [ranges]{length} replaced by random characters from the ranges
+    """
+    while match := GENERATOR_REGEX.search(expression):
+        ranges, length = match.groups()
+        if not length.isdigit() or int(length) > GENERATOR_MAX_LENGTH:
+            raise TemplateProcessingError(f"Invalid length {length} in generator expression {expression}")
+        characters = _expression_characters(ranges=ranges)
+        generated = "".join(secrets.choice(characters) for _ in range(int(length)))
+        expression = expression.replace(match.group(0), generated, 1)
+    return expression
+
+
+def _substitute_string(value: str, parameters: dict[str, str]) -> str:
+    for match in STRING_PARAMETER_REGEX.finditer(value):
+        if match.group(1) in parameters:
+            value = value.replace(match.group(0), parameters[match.group(1)], 1)
+    return value
+
+
+def _substitute(value: str, parameters: dict[str, str]) -> Any:
+    if (match := NON_STRING_PARAMETER_REGEX.match(value)) and match.group(1) in parameters:
+        try:
+            return json.loads(parameters[match.group(1)])
+        except json.JSONDecodeError as exp:
+            raise TemplateProcessingError(f"Invalid non-string value for parameter {match.group(1)}: {exp}")
+
+    return _substitute_string(value=value, parameters=parameters)
+
+
+def _substitute_object(obj: Any, parameters: dict[str, str]) -> Any:
+    if isinstance(obj, dict):
+        # Map keys (e.g. label keys) are substituted as well, always to a string
+        return {
+            _substitute_string(value=key, parameters=parameters): _substitute_object(obj=value, parameters=parameters)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_substitute_object(obj=value, parameters=parameters) for value in obj]
+    if isinstance(obj, str):
+        return _substitute(value=obj, parameters=parameters)
+    return obj
+
+
+def process_template_dict(template: dict[str, Any], parameters: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Process a Template the way the processedtemplates API does.
+
+    Args:
+        template (dict): Template resource dict
+        parameters (dict): parameters values by name; names which are not template parameters are ignored
+
+    Returns:
+        list: processed objects
+
+    Raises:
+        TemplateProcessingError: if the template cannot be processed locally (unsupported generator or object labels
+            target, missing required parameter, non-string parameter value); processing it on the server reports
+            the actual error, if any
+    """
+    parameters_values = {}
+    for parameter in template.get("parameters") or []:
+        name = parameter["name"]
+        value = parameters.get(name, parameter.get("value", ""))
+        if not isinstance(value, str):
+            raise TemplateProcessingError(f"Parameter {name} value is not a string: {value}")
+
+        if not value and (generator := parameter.get("generate")):
+            if generator != EXPRESSION_GENERATOR:
+                raise TemplateProcessingError(f"Unsupported generator {generator} for parameter {name}")
+            value = generate_expression_value(expression=parameter.get("from", ""))
+
+        if not value and parameter.get("required"):
+            raise TemplateProcessingError(f"Parameter {name} is required")
+        parameters_values[name] = value
+
+    object_labels = {
+        _substitute_string(value=key, parameters=parameters_values): _substitute(
+            value=value, parameters=parameters_values
+        )
+        for key, value in (template.get("labels") or {}).items()
+    }
+
+    objects = []
+    for template_object in template.get("objects", []):
+        # A hardcoded namespace is stripped, a parameterized namespace is kept
+        namespace = template_object.get("metadata", {}).get("namespace")
+        processed_object = _substitute_object(obj=template_object, parameters=parameters_values)
+        if namespace and not STRING_PARAMETER_REGEX.search(namespace):
+            processed_object["metadata"].pop("namespace")
+
+        if object_labels:
+            # The server also labels the pod templates of workload kinds
+            if processed_object.get("kind") != "VirtualMachine":
+                raise TemplateProcessingError(f"Object labels of {processed_object.get('kind')} are not supported")
+            metadata = processed_object.setdefault("metadata", {})
+            labels = metadata["labels"] = metadata.get("labels") or {}
+            for key, value in object_labels.items():
+                if labels.get(key, value) != value:
+                    raise TemplateProcessingError(f"Object label {key} conflicts with template label")
+                labels[key] = value
+
+        objects.append(processed_object)
+
+    return objects
@@ -9,6 +9,7 @@ import re
 import shlex
 from collections import defaultdict
 from contextlib import contextmanager
+from functools import cache
 from json import JSONDecodeError
 from subprocess import run
 from typing import Any, Dict
@@ -20,6 +21,7 @@ import yaml
 from benedict import benedict
 from kubernetes.client import ApiException
 from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
 from ocp_resources.datavolume import DataVolume
 from ocp_resources.kubevirt import KubeVirt
 from ocp_resources.node import Node
@@ -76,13 +78,28 @@ from utilities.constants import (
     TIMEOUT_12MIN,
     TIMEOUT_25MIN,
     TIMEOUT_30MIN,
-    VIRT_LAUNCHER,
     VIRTCTL,
     Images,
 )
 from utilities.data_collector import collect_vnc_screenshot_for_vms
+from utilities.exceptions import ImageInfoNotCachedError, TemplateProcessingError
 from utilities.hco import wait_for_hco_conditions
-from utilities.storage import get_default_storage_class
+from utilities.image_info_cache import (
+    get_image_info_cache_file,
+    is_image_info_cache_offline,
+    read_cached_image_info,
+    write_cached_image_info,
+)
+from utilities.migration_recorder import record_migration
+from utilities.ssh_pool import PooledRemoteExecutorFactory, RrmngmntPrivateApi, close_vm_ssh_connections
+from utilities.storage import get_default_storage_class, wait_for_data_volumes_success
+from utilities.template_processing import process_template_dict
+from utilities.watch import (
+    cached_resource_instance,
+    get_resource_cache,
+    wait_for_resource_state,
+    watch_raw_objects_merged,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -97,6 +114,16 @@ VM_ERROR_STATUSES = [
     VirtualMachine.Status.IMAGE_PULL_BACK_OFF,
     VirtualMachine.Status.ERR_IMAGE_PULL,
 ]
+MIGRATION_JOB_UID_LABEL = f"{Resource.ApiGroup.KUBEVIRT_IO}/migrationJobUID"
+POD_SCHEDULED_CONDITION = "PodScheduled"
+POD_UNSCHEDULABLE_REASON = "Unschedulable"
+POD_CONTAINER_FAILURE_REASONS = (
+    Pod.Status.CRASH_LOOPBACK_OFF,
+    Pod.Status.IMAGE_PULL_BACK_OFF,
+    Pod.Status.ERR_IMAGE_PULL,
+    "CreateContainerConfigError",
+    "CreateContainerError",
+)
 
 
 def wait_for_vm_interfaces(vmi: VirtualMachineInstance, timeout: int = TIMEOUT_12MIN) -> bool:
@@ -113,21 +140,22 @@ def wait_for_vm_interfaces(vmi: VirtualMachineInstance, timeout: int = TIMEOUT_1
     Raises:
         TimeoutExpiredError: After timeout reached.
     """
-    # Waiting for guest agent connection before checking guest agent interfaces report
-    LOGGER.info(f"Wait until guest agent is active on {vmi.name}")
-    vmi.wait_for_condition(
-        condition=VirtualMachineInstance.Condition.Type.AGENT_CONNECTED,
-        status=VirtualMachineInstance.Condition.Status.TRUE,
-        timeout=timeout,
-    )
-    LOGGER.info(f"Wait for {vmi.name} network interfaces")
-    sampler = TimeoutSampler(wait_timeout=timeout, sleep=1, func=lambda: vmi.instance)
-    for sample in sampler:
-        interfaces = sample.get("status", {}).get("interfaces", [])
-        active_interfaces = [interface for interface in interfaces if interface.get("interfaceName")]
-        if len(active_interfaces) == len(interfaces):
-            return True
-    return False
+
+    def _agent_interfaces_reported(_vmi_dict):
+        if not _vmi_dict:
+            return False
+        vmi_status = _vmi_dict.get("status", {})
+        # Guest agent interfaces report is checked only after the guest agent is connected
+        agent_connected = any(
+            condition["type"] == VirtualMachineInstance.Condition.Type.AGENT_CONNECTED
+            and condition["status"] == VirtualMachineInstance.Condition.Status.TRUE
+            for condition in vmi_status.get("conditions", [])
+        )
+        interfaces = vmi_status.get("interfaces", [])
+        return agent_connected and all(interface.get("interfaceName") for interface in interfaces)
+
+    LOGGER.info(f"Wait until guest agent is active and reports {vmi.name} network interfaces")
+    return bool(wait_for_resource_state(resource=vmi, condition=_agent_interfaces_reported, timeout=timeout))
 
 
 def generate_cloud_init_data(data):
@@ -429,6 +457,7 @@ class VirtualMachineForTests(VirtualMachine):
     def clean_up(self) -> bool:
         if self.exists and self.ready:
             self.stop(wait=True, vmi_delete_timeout=TIMEOUT_8MIN)
+        close_vm_ssh_connections(vm=self)
         super().clean_up()
         if self.custom_service:
             self.custom_service.delete(wait=True)
@@ -1030,20 +1059,28 @@ class VirtualMachineForTests(VirtualMachine):
         else:
             host_user = user.UserWithPKey(name=self.username, private_key=os.environ[CNV_VM_SSH_KEY_PATH])
         host.executor_user = host_user
-        host.executor_factory = ssh.RemoteExecutorFactory(
-            sock=self.virtctl_port_forward_cmd,
-        )
+        if RrmngmntPrivateApi.supported():
+            host.executor_factory = PooledRemoteExecutorFactory(
+                namespace=self.namespace,
+                name=self.name,
+                proxy_command=self.virtctl_port_forward_cmd,
+            )
+        else:
+            host.executor_factory = ssh.RemoteExecutorFactory(
+                sock=self.virtctl_port_forward_cmd,
+            )
         return host
 
-    def wait_for_specific_status(self, status, timeout=TIMEOUT_3MIN, sleep=TIMEOUT_5SEC):
+    def wait_for_specific_status(self, status, timeout=TIMEOUT_3MIN):
         LOGGER.info(f"Wait for {self.kind} {self.name} status to be {status}")
-        samples = TimeoutSampler(wait_timeout=timeout, sleep=sleep, func=lambda: self.printable_status)
         try:
-            for sample in samples:
-                if sample == status:
-                    return
+            wait_for_resource_state(
+                resource=self,
+                condition=lambda _vm_dict: (_vm_dict or {}).get("status", {}).get("printableStatus") == status,
+                timeout=timeout,
+            )
         except TimeoutExpiredError:
-            LOGGER.error(f"Status of {self.kind} {self.name} is {status}")
+            LOGGER.error(f"Status of {self.kind} {self.name} is {self.printable_status}")
             raise
 
     @property
@@ -1306,7 +1343,17 @@ class VirtualMachineForTestsFromTemplate(VirtualMachineForTests):
         template_object = self.template_object or get_template_by_labels(
             admin_client=self.client, template_labels=self.template_labels
         )
-        resources_list = template_object.process(client=get_client(), **template_kwargs)
+        # Read from the API server, not from the templates cache, to get the template as edited by the test
+        template_dict = template_object.instance.to_dict()
+        # Same as Template.process
+        template_dict["objects"][0]["metadata"]["labels"]["vm.kubevirt.io/template.namespace"] = template_dict[
+            "metadata"
+        ]["namespace"]
+        try:
+            resources_list = process_template_dict(template=template_dict, parameters=template_kwargs)
+        except TemplateProcessingError as exp:
+            LOGGER.warning(f"Processing template {template_object.name} on the server: {exp}")
+            resources_list = template_object.process(client=get_client(), **template_kwargs)
         for resource in resources_list:
             if resource["kind"] == VirtualMachine.kind and resource["metadata"]["name"] == self.name:
                 return resource
@@ -1350,15 +1397,25 @@ def vm_console_run_commands(
     return output if command_output else None
 
 
-def fedora_vm_body(name: str) -> dict[str, Any]:
-    pull_secret = utilities.infra.generate_openshift_pull_secret_file()
-
+@cache
+def get_fedora_vm_manifest() -> str:
     # Make sure we can find the file even if utilities was installed via pip.
-    yaml_file = os.path.abspath("utilities/manifests/vm-fedora.yaml")
+    with open(os.path.abspath("utilities/manifests/vm-fedora.yaml"), "r") as fd:
+        return fd.read()
 
-    with open(yaml_file, "r") as fd:
-        data = fd.read()
 
+@cache
+def get_fedora_vm_image() -> str:
+    """
+    Get the Fedora container disk image, pinned by the digest of the cluster nodes architecture.
+
+    Resolved once per session (pull secret file, nodes architecture and oc image info);
+    use clear_fedora_vm_body_inputs to resolve it again.
+
+    Returns:
+        str: image@digest
+    """
+    pull_secret = utilities.infra.generate_openshift_pull_secret_file()
     image = Images.Fedora.FEDORA_CONTAINER_IMAGE
     image_info = get_oc_image_info(
         image=image,
@@ -1367,16 +1424,37 @@ def fedora_vm_body(name: str) -> dict[str, Any]:
             nodes=list(Node.get(dyn_client=get_client())),
         ),
     )
-    image_digest = image_info["digest"]
+    return f"{image}@{image_info['digest']}"
+
+
+def fedora_vm_body(name: str, image: str | None = None) -> dict[str, Any]:
+    """
+    Args:
+        name (str): VM name
+        image (str, optional): container disk image, from get_fedora_vm_image if not given.
+            When creating several VMs, get the image once and pass it to every body.
+
+    Returns:
+        dict: Fedora VM body
+    """
     return generate_dict_from_yaml_template(
-        stream=io.StringIO(data),
+        stream=io.StringIO(get_fedora_vm_manifest()),
         name=name,
-        image=f"{image}@{image_digest}",
+        image=image or get_fedora_vm_image(),
     )
 
 
-def kubernetes_taint_exists(node):
-    taints = node.instance.spec.taints
+def clear_fedora_vm_body_inputs() -> None:
+    """
+    Drop the session memoized fedora_vm_body inputs, when the cluster registry configuration or pull secret changed.
+    """
+    LOGGER.info("Clearing Fedora VM body inputs")
+    get_fedora_vm_manifest.cache_clear()
+    get_fedora_vm_image.cache_clear()
+
+
+def kubernetes_taint_exists(node, bypass_cache=False):
+    taints = cached_resource_instance(resource=node, bypass_cache=bypass_cache).spec.taints
     if taints:
         return any(taint.key == K8S_TAINT and taint.effect == NO_SCHEDULE for taint in taints)
 
@@ -1482,6 +1560,103 @@ def wait_for_console(vm):
         LOGGER.info(f"Successfully connected to {vm.name} console")
 
 
+YAML_TEMPLATE_PLACEHOLDER_PREFIX = "yaml-template-placeholder-"
+# The closing delimiter keeps a variable placeholder from matching the start of another one, e.g. n and name
+YAML_TEMPLATE_PLACEHOLDER_REGEX = re.compile(rf"{YAML_TEMPLATE_PLACEHOLDER_PREFIX}(\w+)-end")
+PLAIN_YAML_STRING_REGEX = re.compile(r"^[\w][\w.:/@+-]*$")
+
+
+def yaml_template_placeholder(var: str) -> str:
+    return f"{YAML_TEMPLATE_PLACEHOLDER_PREFIX}{var}-end"
+
+
+def load_yaml(data: str) -> Any:
+    # The libyaml (C) loader is much faster; PyYAML may be built without it
+    return yaml.load(data, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def is_plain_yaml_string(value: Any) -> bool:
+    """
+    Check that a value renders to the same string in any YAML context it may be placed in.
+
+    Args:
+        value (Any): template variable value
+
+    Returns:
+        bool: True if value is a string that YAML loads as is, e.g. not "true", "1" or "null"
+    """
+    return isinstance(value, str) and bool(PLAIN_YAML_STRING_REGEX.match(value)) and load_yaml(data=value) == value
+
+
+class CompiledYamlTemplate:
+    """
+    Jinja YAML template, compiled once.
+
+    Templates whose variables are only used as plain `{{ var }}` expressions are also parsed once into a dict
+    skeleton, with a placeholder for each variable; rendering such a template with plain string values deep copies
+    the skeleton and replaces the placeholders, without rendering and parsing YAML.
+    """
+
+    def __init__(self, data: str) -> None:
+        self.data = data
+        expressions = re.findall(r"{{ .* }}", data)
+        self.variables = [expression.split()[1] for expression in expressions]
+        self.template = jinja2.Template(data)
+        self.skeleton = None
+        if all(expression == f"{{{{ {var} }}}}" for expression, var in zip(expressions, self.variables)):
+            self.skeleton = load_yaml(
+                data=self.template.render(**{var: yaml_template_placeholder(var=var) for var in self.variables})
+            )
+
+    def _fill_skeleton(self, obj: Any, values: dict[str, str]) -> Any:
+        if isinstance(obj, dict):
+            return {
+                self._fill_skeleton(obj=key, values=values): self._fill_skeleton(obj=value, values=values)
+                for key, value in obj.items()
+            }
+        if isinstance(obj, list):
+            return [self._fill_skeleton(obj=value, values=values) for value in obj]
+        if isinstance(obj, str) and YAML_TEMPLATE_PLACEHOLDER_PREFIX in obj:
+            return YAML_TEMPLATE_PLACEHOLDER_REGEX.sub(lambda match: values[match.group(1)], obj)
+        return obj
+
+    def render(self, **kwargs: Any) -> Any:
+        """
+        Args:
+            **kwargs: template variables values
+
+        Returns:
+            Any: rendered YAML object
+
+        Raises:
+            MissingTemplateVariables: If not all template variables exists
+        """
+        for var in self.variables:
+            if var not in kwargs:
+                raise MissingTemplateVariables(var=var, template=self.data)
+
+        values = {var: kwargs[var] for var in self.variables}
+        if self.skeleton is not None and all(is_plain_yaml_string(value=value) for value in values.values()):
+            # A fresh object for every call, as callers modify the returned body
+            return self._fill_skeleton(obj=self.skeleton, values=values)
+
+        return load_yaml(data=self.template.render(**kwargs))
+
+
+@cache
+def get_compiled_yaml_template(data: str) -> CompiledYamlTemplate:
+    """
+    Get a template from the compiled templates registry, compiling it on first use.
+
+    Args:
+        data (str): Yaml template content.
+
+    Returns:
+        CompiledYamlTemplate: compiled template
+    """
+    return CompiledYamlTemplate(data=data)
+
+
 def generate_dict_from_yaml_template(stream, **kwargs):
     """
     Generate YAML from yaml template.
@@ -1495,15 +1670,7 @@ def generate_dict_from_yaml_template(stream, **kwargs):
     Raises:
         MissingTemplateVariables: If not all template variables exists
     """
-    data = stream.read()
-    # Find all template variables
-    template_vars = [i.split()[1] for i in re.findall(r"{{ .* }}", data)]
-    for var in template_vars:
-        if var not in kwargs.keys():
-            raise MissingTemplateVariables(var=var, template=data)
-    template = jinja2.Template(data)
-    out = template.render(**kwargs)
-    return yaml.safe_load(out)
+    return get_compiled_yaml_template(data=stream.read()).render(**kwargs)
 
 
 class MissingTemplateVariables(Exception):
@@ -1623,6 +1790,39 @@ def assert_vm_not_error_status(vm: VirtualMachineForTests, timeout: int = TIMEOU
         raise
 
 
+def wait_for_vmi_running(vmi: VirtualMachineInstance, timeout: int = TIMEOUT_4MIN) -> None:
+    """
+    Wait for the VMI phase to be Running, using a watch on the VMI.
+
+    Args:
+        vmi (VirtualMachineInstance): VMI object.
+        timeout (int): how much time to wait for VMI to reach Running state
+
+    Raises:
+        TimeoutExpiredError: After timeout is reached or if the VMI phase is Failed
+    """
+
+    def _vmi_phase(_vmi_dict):
+        return (_vmi_dict or {}).get("status", {}).get("phase")
+
+    LOGGER.info(f"Wait for {vmi.kind} {vmi.name} status to be {vmi.Status.RUNNING}")
+    try:
+        wait_for_resource_state(
+            resource=vmi,
+            condition=lambda _vmi_dict: _vmi_phase(_vmi_dict=_vmi_dict) == vmi.Status.RUNNING,
+            stop_condition=lambda _vmi_dict: _vmi_phase(_vmi_dict=_vmi_dict) == vmi.Status.FAILED,
+            timeout=timeout,
+        )
+    except TimeoutExpiredError:
+        try:
+            virt_pod = vmi.virt_launcher_pod
+            LOGGER.error(f"Status of virt-launcher pod {virt_pod.name}: {virt_pod.status}")
+            LOGGER.debug(f"{virt_pod.name} *****LOGS*****\n{virt_pod.log(container='compute')}")
+        except ResourceNotFoundError as virt_pod_ex:
+            LOGGER.error(virt_pod_ex)
+        raise
+
+
 def wait_for_running_vm(
     vm: VirtualMachineForTests,
     wait_until_running_timeout: int = TIMEOUT_4MIN,
@@ -1645,7 +1845,7 @@ def wait_for_running_vm(
     """
     assert_vm_not_error_status(vm=vm)
     try:
-        vm.vmi.wait_until_running(timeout=wait_until_running_timeout)
+        wait_for_vmi_running(vmi=vm.vmi, timeout=wait_until_running_timeout)
 
         if wait_for_interfaces:
             wait_for_vm_interfaces(vmi=vm.vmi)
@@ -1688,8 +1888,9 @@ def running_vm(
 
         LOGGER.info(f"VM {_vm.name} status before dv check: {_vm.printable_status}")
         LOGGER.info(f"Volume(s) in VM spec: {_vm_dv_volumes_names_list} ")
-        for dv_name in _vm_dv_volumes_names_list:
-            DataVolume(name=dv_name, namespace=_vm.namespace).wait_for_dv_success(timeout=_dv_wait_timeout)
+        wait_for_data_volumes_success(
+            dv_names=_vm_dv_volumes_names_list, namespace=_vm.namespace, timeout=_dv_wait_timeout
+        )
 
     # To support all use cases of: 'runStrategy', container/VM from template, VM started outside this function
     allowed_vm_start_exceptions_list = [
@@ -1790,44 +1991,84 @@ def migrate_vm_and_verify(
     return None
 
 
+def get_pod_failure(raw_pod: dict[str, Any]) -> str | None:
+    """
+    Args:
+        raw_pod (dict): raw pod object
+
+    Returns:
+        str or None: why the pod cannot run - failed, unschedulable or a container failing to start, None otherwise
+    """
+    status = raw_pod.get("status", {})
+    if status.get("phase") == Pod.Status.FAILED:
+        return f"failed: {status.get('reason')} {status.get('message')}"
+
+    for condition in status.get("conditions", []):
+        if (
+            condition["type"] == POD_SCHEDULED_CONDITION
+            and condition["status"] == Pod.Condition.Status.FALSE
+            and condition.get("reason") == POD_UNSCHEDULABLE_REASON
+        ):
+            return f"unschedulable: {condition.get('message')}"
+
+    for container_status in status.get("initContainerStatuses", []) + status.get("containerStatuses", []):
+        waiting = container_status.get("state", {}).get("waiting", {})
+        if waiting.get("reason") in POD_CONTAINER_FAILURE_REASONS:
+            return f"container {container_status['name']} {waiting['reason']}: {waiting.get('message')}"
+
+    return None
+
+
 def wait_for_migration_finished(vm, migration, timeout=TIMEOUT_12MIN):
-    sleep = TIMEOUT_10SEC
-    samples = TimeoutSampler(wait_timeout=timeout, sleep=sleep, func=lambda: migration.instance.status.phase)
-    counter = 0
-    sample = None
+    """
+    Wait for a migration to succeed, from the migration and migration target pod watch events.
+
+    Fails as soon as the migration fails, or its target pod fails, is unschedulable or has a container failing to
+    start.
+
+    Raises:
+        TimeoutExpiredError: if the migration did not succeed within timeout, or failed
+    """
+    phase = None
     try:
-        for sample in samples:
-            if sample == migration.Status.SUCCEEDED:
-                break
-            elif sample == "Scheduling":
-                counter += 1
-                # If migration stuck in Scheduling state for more than 4 minutes - most likely it will be failed
-                # Need to collect data before 5 min timeout reached and target POD is removed
-                if counter >= TIMEOUT_4MIN / sleep:
-                    # Get status/events for PODs in non-running or failed state
-                    for pod in utilities.infra.get_pod_by_name_prefix(
-                        dyn_client=get_client(),
-                        pod_prefix=VIRT_LAUNCHER,
-                        namespace=vm.namespace,
-                        get_all=True,
-                    ):
-                        if pod.status not in (Pod.Status.RUNNING, Pod.Status.COMPLETED, Pod.Status.SUCCEEDED):
-                            pod_events = [
-                                event["raw_object"]["message"]
-                                for event in pod.events(timeout=TIMEOUT_5SEC, field_selector="type==Warning")
-                            ]
-                            LOGGER.error(
-                                f"POD Conditions:\n {pod.instance.status.conditions[0]}\n"
-                                f"POD Events:\n {', '.join(pod_events)}"
-                            )
+        for watch_name, raw_objects in watch_raw_objects_merged(
+            watches={
+                "migration": {
+                    "api": migration.api,
+                    "namespace": migration.namespace,
+                    "field_selector": f"metadata.name={migration.name}",
+                },
+                "target_pod": {
+                    "api": migration.client.resources.get(api_version=Pod.api_version, kind=Pod.kind),
+                    "namespace": vm.namespace,
+                    "label_selector": f"{MIGRATION_JOB_UID_LABEL}={migration.instance.metadata.uid}",
+                },
+            },
+            timeout=timeout,
+        ):
+            if watch_name == "migration":
+                migration_status = (raw_objects.get((migration.namespace, migration.name)) or {}).get("status", {})
+                phase = migration_status.get("phase")
+                if phase == migration.Status.SUCCEEDED:
+                    break
+                if phase == migration.Status.FAILED:
+                    failure_reason = migration_status.get("migrationState", {}).get("failureReason")
+                    raise TimeoutExpiredError(f"VMIM {migration.name} failed: {failure_reason}")
+                continue
+
+            for raw_pod in raw_objects.values():
+                if pod_failure := get_pod_failure(raw_pod=raw_pod):
                     raise TimeoutExpiredError(
-                        f"VMIM {migration.name} stuck in Scheduling state and probably will be failed"
+                        f"VMIM {migration.name} target pod {raw_pod['metadata']['name']} {pod_failure}"
                     )
     except TimeoutExpiredError:
-        if sample:
-            LOGGER.error(f"Status of VMIM {migration.name} is {sample}")
+        if phase:
+            LOGGER.error(f"Status of VMIM {migration.name} is {phase}")
         raise
 
+    # The SSH port-forward to the source virt-launcher pod ends with it
+    close_vm_ssh_connections(vm=vm)
+    record_migration(vm=vm, migration=migration)
     if vm.instance.spec.template.spec.evictionStrategy == LIVE_MIGRATE:
         verify_one_pdb_per_vm(vm=vm)
 
@@ -2023,10 +2264,10 @@ def wait_for_node_schedulable_status(node, status, timeout=60):
     sampler = TimeoutSampler(wait_timeout=timeout, sleep=1, func=lambda: node.instance.spec.unschedulable)
     for sample in sampler:
         if status:
-            if not sample and not kubernetes_taint_exists(node):
+            if not sample and not kubernetes_taint_exists(node=node, bypass_cache=True):
                 return
         else:
-            if sample and kubernetes_taint_exists(node):
+            if sample and kubernetes_taint_exists(node=node, bypass_cache=True):
                 return
 
 
@@ -2084,15 +2325,34 @@ def verify_one_pdb_per_vm(vm):
     assert len(pdbs_dict) == 1, f"VM {vm.name} must have one {pdb_resource_name}, current: {pdbs_dict}"
 
 
-def get_template_by_labels(admin_client, template_labels):
-    template = list(
-        Template.get(
-            dyn_client=admin_client,
-            singular_name=Template.singular_name,
-            namespace="openshift",
-            label_selector=",".join([f"{label}=true" for label in template_labels if OS_FLAVOR_FEDORA not in label]),
-        ),
+def get_common_templates_cache():
+    # Only the common templates, in the openshift namespace, are looked up by labels; templates are read with the
+    # admin client, whichever client the VM is created with
+    return get_resource_cache(
+        client=utilities.infra.cache_admin_client(), resource_class=Template, namespace="openshift"
     )
+
+
+def get_template_by_labels(admin_client, template_labels):
+    label_selector = ",".join([f"{label}=true" for label in template_labels if OS_FLAVOR_FEDORA not in label])
+    templates_cache = get_common_templates_cache()
+    if templates_cache:
+        labels = dict(
+            selector_label.partition("=")[::2] for selector_label in label_selector.split(",") if selector_label
+        )
+        template = [
+            Template(client=admin_client, name=raw_template["metadata"]["name"], namespace="openshift")
+            for raw_template in templates_cache.list(namespace="openshift", labels=labels)
+        ]
+    else:
+        template = list(
+            Template.get(
+                dyn_client=admin_client,
+                singular_name=Template.singular_name,
+                namespace="openshift",
+                label_selector=label_selector,
+            ),
+        )
     if any(
         f"{Template.ApiGroup.OS_TEMPLATE_KUBEVIRT_IO}/{OS_FLAVOR_FEDORA}" in template_label
         for template_label in template_labels
@@ -2216,6 +2476,9 @@ def wait_for_kubevirt_conditions(
 ):
     """
     Checking Kubevirt status.conditions
+
+    The conditions are watched, and must hold for the time consecutive_checks_count checks every sleep seconds would
+    take.
     """
     utilities.infra.wait_for_consistent_resource_conditions(
         dynamic_client=admin_client,
@@ -2225,8 +2488,7 @@ def wait_for_kubevirt_conditions(
         condition_key1=condition_key1,
         condition_key2=condition_key2,
         total_timeout=wait_timeout,
-        polling_interval=sleep,
-        consecutive_checks_count=consecutive_checks_count,
+        stability_duration=(consecutive_checks_count - 1) * sleep,
     )
 
 
@@ -2253,9 +2515,37 @@ def wait_for_kv_stabilize(admin_client, hco_namespace):
 def get_oc_image_info(  # type: ignore[return]
     image: str, pull_secret: str | None = None, architecture: str = LINUX_AMD_64
 ) -> dict[str, Any]:
+    """
+    Get image info (oc image info), through the persistent image info cache.
+
+    A cached entry is used while it is younger than IMAGE_INFO_CACHE_TTL; an expired entry is still used if the
+    registry lookup fails. In offline mode (IMAGE_INFO_CACHE_OFFLINE=true) only cached entries are used.
+
+    Args:
+        image (str): image reference
+        pull_secret (str, optional): registry config file path
+        architecture (str): image OS/architecture
+
+    Returns:
+        dict: image info
+
+    Raises:
+        ImageInfoNotCachedError: in offline mode, if the image info is not cached
+        TimeoutExpiredError: if the registry lookup failed and the image info is not cached
+    """
+
     def _get_image_json(cmd: str) -> dict[str, Any]:
         return json.loads(run_command(command=shlex.split(cmd), check=False)[1])
 
+    cache_file = get_image_info_cache_file(image=image, architecture=architecture, pull_secret=pull_secret)
+    if is_image_info_cache_offline():
+        if cached_image_info := read_cached_image_info(cache_file=cache_file, max_age=None):
+            return cached_image_info
+        raise ImageInfoNotCachedError(image=image, architecture=architecture)
+
+    if cached_image_info := read_cached_image_info(cache_file=cache_file):
+        return cached_image_info
+
     base_command = f"oc image -o json info {image} --filter-by-os {architecture}"
     if pull_secret:
         base_command = f"{base_command} --registry-config={pull_secret}"
@@ -2269,8 +2559,12 @@ def get_oc_image_info(  # type: ignore[return]
             cmd=base_command,
         ):
             if sample:
+                write_cached_image_info(cache_file=cache_file, image=image, image_info=sample)
                 return sample
     except TimeoutExpiredError:
+        if cached_image_info := read_cached_image_info(cache_file=cache_file, max_age=None):
+            LOGGER.warning(f"Failed to run {base_command}, using expired cached image info")
+            return cached_image_info
         LOGGER.error(f"Failed to parse {base_command}")
         raise
 
@@ -0,0 +1,231 @@
+"""
+Warm pool of running VMs, leased to tests which do not change the VM.
+"""
+
+import logging
+import shlex
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import Any, Callable
+
+from kubernetes.dynamic import DynamicClient
+from pyhelper_utils.shell import run_ssh_commands
+
+from utilities.bulk_operations import run_bulk_operation
+from utilities.constants import OS_FLAVOR_FEDORA
+from utilities.virt import VirtualMachineForTests, fedora_vm_body, running_vm
+
+LOGGER = logging.getLogger(__name__)
+
+WARM_VM_POOL_SIZE = 1
+WARM_VM_POOL_MAX_WORKERS = 5
+WARM_VM_POOL_FLAVORS: dict[str, Callable[..., dict[str, Any]]] = {OS_FLAVOR_FEDORA: fedora_vm_body}
+# Guest state compared with the state of the VM when it was provisioned, when it is released
+VM_STATE_COMMANDS = {
+    # User space processes names; kernel threads are children of kthreadd (pid 2)
+    "processes": "ps --ppid 2 -p 2 --deselect -o comm=",
+    "addresses": "ip -brief address",
+    "routes": "ip route",
+}
+
+
+def get_vm_state(vm: VirtualMachineForTests) -> dict[str, Any]:
+    """
+    Args:
+        vm (VirtualMachineForTests): running VM
+
+    Returns:
+        dict: VM guest processes names, addresses and routes
+    """
+    outputs = run_ssh_commands(
+        host=vm.ssh_exec, commands=[shlex.split(command) for command in VM_STATE_COMMANDS.values()]
+    )
+    state: dict[str, Any] = dict(zip(VM_STATE_COMMANDS, outputs))
+    state["processes"] = sorted(set(state["processes"].split()))
+    return state
+
+
+class WarmVMPool:
+    """
+    Pool of running VMs per flavor.
+
+    `size` VMs of each flavor are started in the background when the pool is entered. A leased VM is released back
+    to the pool: its guest state (processes, network addresses and routes) is compared with its state when it was
+    provisioned, processes started by the test are killed, and if the state still differs - or the VM was marked
+    dirty - the VM is deleted and replaced by a new one.
+    When no VM is ready or being provisioned, lease provisions one, which is returned to the pool on release.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        client: DynamicClient,
+        size: int = WARM_VM_POOL_SIZE,
+        flavors: dict[str, Callable[..., dict[str, Any]]] | None = None,
+    ) -> None:
+        """
+        Args:
+            namespace (str): namespace of the pool VMs
+            client (DynamicClient): client creating the VMs
+            size (int): number of VMs of each flavor to start ahead
+            flavors (dict, optional): VM body function by flavor, the function gets the VM name
+        """
+        self.namespace = namespace
+        self.client = client
+        self.size = size
+        self.flavors = flavors or WARM_VM_POOL_FLAVORS
+        self._executor = ThreadPoolExecutor(max_workers=WARM_VM_POOL_MAX_WORKERS)
+        self._lock = threading.Lock()
+        self._ready: dict[str, list[VirtualMachineForTests]] = {flavor: [] for flavor in self.flavors}
+        # Provisioning and releasing VMs, which end up in self._ready
+        self._pending: dict[str, list[Future]] = {flavor: [] for flavor in self.flavors}
+        self._baselines: dict[str, dict[str, Any]] = {}
+        self._dirty: set[str] = set()
+
+    def __enter__(self) -> "WarmVMPool":
+        for flavor in self.flavors:
+            for _ in range(self.size):
+                self._submit(flavor=flavor, func=partial(self._provision_ready, flavor=flavor))
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def _submit(self, flavor: str, func: Callable[[], None]) -> None:
+        with self._lock:
+            self._pending[flavor].append(self._executor.submit(func))
+
+    def _provision(self, flavor: str) -> VirtualMachineForTests:
+        name = f"warm-{flavor}"
+        LOGGER.info(f"Provisioning warm {flavor} VM")
+        vm = VirtualMachineForTests(
+            name=name,
+            namespace=self.namespace,
+            client=self.client,
+            body=self.flavors[flavor](name=name),
+        )
+        vm.deploy()
+        try:
+            running_vm(vm=vm)
+            self._baselines[str(vm.name)] = get_vm_state(vm=vm)
+        except Exception:
+            vm.clean_up()
+            raise
+
+        return vm
+
+    def _provision_ready(self, flavor: str) -> None:
+        vm = self._provision(flavor=flavor)
+        with self._lock:
+            self._ready[flavor].append(vm)
+
+    def lease(self, flavor: str = OS_FLAVOR_FEDORA) -> VirtualMachineForTests:
+        """
+        Get a running VM; wait for a VM being provisioned or released, if there is no ready VM.
+        If that background provisioning or release failed, a VM is provisioned for the caller.
+
+        Args:
+            flavor (str): VM flavor
+
+        Returns:
+            VirtualMachineForTests: running VM, with SSH
+        """
+        while True:
+            with self._lock:
+                if self._ready[flavor]:
+                    vm = self._ready[flavor].pop()
+                    LOGGER.info(f"Leasing warm VM {vm.name}")
+                    return vm
+                pending = list(self._pending[flavor])
+
+            if not pending:
+                return self._provision(flavor=flavor)
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            with self._lock:
+                for future in done:
+                    self._pending[flavor].remove(future)
+            # Background work was queued for earlier tests; its failure is logged, not raised to this test
+            failed = [future for future in done if future.exception()]
+            for future in failed:
+                LOGGER.error(f"Warm {flavor} VM provisioning or release failed: {future.exception()}")
+            if failed:
+                return self._provision(flavor=flavor)
+
+    def mark_dirty(self, vm: VirtualMachineForTests) -> None:
+        """
+        Recycle a leased VM when it is released, e.g. when a test changed the guest configuration.
+
+        Args:
+            vm (VirtualMachineForTests): leased VM
+        """
+        self._dirty.add(str(vm.name))
+
+    def release(self, vm: VirtualMachineForTests, flavor: str = OS_FLAVOR_FEDORA, dirty: bool = False) -> None:
+        """
+        Verify and reset a leased VM in the background, or recycle it.
+
+        Args:
+            vm (VirtualMachineForTests): leased VM
+            flavor (str): VM flavor
+            dirty (bool): if True, recycle the VM
+        """
+        self._submit(
+            flavor=flavor,
+            func=partial(self._return, vm=vm, flavor=flavor, dirty=dirty or vm.name in self._dirty),
+        )
+
+    def _reset(self, vm: VirtualMachineForTests) -> bool:
+        baseline = self._baselines[str(vm.name)]
+        try:
+            state = get_vm_state(vm=vm)
+            if new_processes := set(state["processes"]) - set(baseline["processes"]):
+                LOGGER.info(f"Killing processes {new_processes} in warm VM {vm.name}")
+                run_ssh_commands(
+                    host=vm.ssh_exec,
+                    commands=[
+                        shlex.split(f"sudo pkill -x {shlex.quote(process)} || true") for process in new_processes
+                    ],
+                )
+                state = get_vm_state(vm=vm)
+        except Exception as exp:
+            LOGGER.warning(f"Failed to verify warm VM {vm.name}: {exp}")
+            return False
+
+        if state != baseline:
+            LOGGER.info(f"Warm VM {vm.name} state changed, baseline: {baseline}, current: {state}")
+            return False
+
+        return True
+
+    def _return(self, vm: VirtualMachineForTests, flavor: str, dirty: bool) -> None:
+        if not dirty and self._reset(vm=vm):
+            with self._lock:
+                self._ready[flavor].append(vm)
+            return
+
+        LOGGER.info(f"Recycling warm VM {vm.name}")
+        self._dirty.discard(vm.name)
+        self._baselines.pop(str(vm.name), None)
+        vm.clean_up()
+        self._provision_ready(flavor=flavor)
+
+    def close(self) -> None:
+        """
+        Wait for the VMs being provisioned or released, and delete all VMs.
+
+        Raises:
+            BulkOperationError: if any VM deletion failed
+        """
+        for pending in self._pending.values():
+            wait(pending)
+            for future in pending:
+                if exception := future.exception():
+                    LOGGER.error(f"Warm VM provisioning or release failed: {exception}")
+        self._executor.shutdown(wait=True)
+
+        run_bulk_operation(
+            func=lambda vm: vm.clean_up(),
+            resources=[vm for ready in self._ready.values() for vm in ready],
+        )
@@ -0,0 +1,476 @@
+"""
+Watch based waiters for cluster resources.
+
+Instead of re-reading a resource every few seconds, the state is listed once and then kept up to date from the
+API server watch stream, resuming from the last seen resourceVersion.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Generator
+from http import HTTPStatus
+from typing import Any
+
+from kubernetes.client import ApiException
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.resource import ResourceInstance
+from ocp_resources.resource import Resource
+from timeout_sampler import TimeoutExpiredError, TimeoutWatch
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+from utilities.constants import TIMEOUT_1SEC, TIMEOUT_5SEC, TIMEOUT_10MIN, TIMEOUT_10SEC
+
+LOGGER = logging.getLogger(__name__)
+
+WATCH_EVENT_DELETED = "DELETED"
+WATCH_EVENT_BOOKMARK = "BOOKMARK"
+# Watch requests timeout when the watch can be stopped, so a watch without events notices it was stopped
+WATCH_STOP_CHECK_INTERVAL = TIMEOUT_10SEC
+
+_RESOURCE_CACHES: dict[tuple[Any, ...], "ResourceCache"] = {}
+_RESOURCE_CACHES_LOCK = threading.Lock()
+
+
+def raw_object_key(raw_object: dict[str, Any]) -> tuple[str | None, str | None]:
+    return raw_object["metadata"].get("namespace"), raw_object["metadata"]["name"]
+
+
+def _list_raw_objects(
+    api: Any, namespace: str | None, field_selector: str | None, label_selector: str | None
+) -> tuple[dict[tuple[str | None, str | None], dict[str, Any]], str]:
+    resources_list = Resource.retry_cluster_exceptions(
+        func=api.get,
+        namespace=namespace,
+        field_selector=field_selector,
+        label_selector=label_selector,
+    ).to_dict()
+    return (
+        {raw_object_key(raw_object=raw_object): raw_object for raw_object in resources_list["items"]},
+        resources_list["metadata"]["resourceVersion"],
+    )
+
+
+def watch_raw_objects(
+    api: Any,
+    timeout: int,
+    namespace: str | None = None,
+    field_selector: str | None = None,
+    label_selector: str | None = None,
+    stop: threading.Event | None = None,
+) -> Generator[dict[tuple[str | None, str | None], dict[str, Any]], None, None]:
+    """
+    Yield the current state of all matching objects on every change.
+
+    The objects are listed once, then changes are streamed from the list resourceVersion.
+    If the resourceVersion expired (410 Gone), the objects are listed again and the watch is resumed from there.
+
+    Args:
+        api (ResourceInstance): dynamic client resource API (e.g. resource.api)
+        timeout (int): time to watch in seconds
+        namespace (str, optional): namespace to watch, None for all namespaces or cluster scoped resources
+        field_selector (str, optional): field selector, e.g. metadata.name=<name>
+        label_selector (str, optional): label selector
+        stop (threading.Event, optional): return when set, checked at least every WATCH_STOP_CHECK_INTERVAL seconds
+
+    Yields:
+        dict: raw objects by (namespace, name). The same dict is updated in place between yields.
+
+    Raises:
+        TimeoutExpiredError: when timeout is reached
+    """
+    timeout_watcher = TimeoutWatch(timeout=timeout)
+    raw_objects: dict[tuple[str | None, str | None], dict[str, Any]] = {}
+    resource_version = None
+    while timeout_watcher.remaining_time() > 0:
+        if stop and stop.is_set():
+            return
+
+        if resource_version is None:
+            raw_objects, resource_version = _list_raw_objects(
+                api=api, namespace=namespace, field_selector=field_selector, label_selector=label_selector
+            )
+            yield raw_objects
+
+        watch_timeout = max(int(timeout_watcher.remaining_time()), TIMEOUT_1SEC)
+        try:
+            for event in api.watch(
+                namespace=namespace,
+                field_selector=field_selector,
+                label_selector=label_selector,
+                resource_version=resource_version,
+                timeout=min(watch_timeout, WATCH_STOP_CHECK_INTERVAL) if stop else watch_timeout,
+            ):
+                if stop and stop.is_set():
+                    return
+
+                raw_object = event["raw_object"]
+                resource_version = raw_object["metadata"]["resourceVersion"]
+                if event["type"] == WATCH_EVENT_BOOKMARK:
+                    continue
+
+                if event["type"] == WATCH_EVENT_DELETED:
+                    raw_objects.pop(raw_object_key(raw_object=raw_object), None)
+                else:
+                    raw_objects[raw_object_key(raw_object=raw_object)] = raw_object
+
+                yield raw_objects
+
+        except ApiException as exp:
+            if exp.status != HTTPStatus.GONE:
+                raise
+
+            LOGGER.info(f"Watch resourceVersion {resource_version} expired, listing {api.kind} again")
+            resource_version = None
+
+        except (ProtocolError, ReadTimeoutError) as exp:
+            LOGGER.warning(f"Watch on {api.kind} was interrupted, resuming from {resource_version}: {exp}")
+
+    raise TimeoutExpiredError(
+        f"{api.kind} namespace={namespace} field_selector={field_selector} label_selector={label_selector}"
+    )
+
+
+def watch_raw_objects_merged(
+    watches: dict[str, dict[str, Any]], timeout: int
+) -> Generator[tuple[str, dict[tuple[str | None, str | None], dict[str, Any]]], None, None]:
+    """
+    Watch several resources at once, e.g. a resource and the pods it creates.
+
+    Each watch runs in a background thread; when the caller stops iterating, the threads exit on their next event,
+    or within WATCH_STOP_CHECK_INTERVAL seconds without events.
+
+    Args:
+        watches (dict): watch_raw_objects kwargs (api, namespace, field_selector, label_selector) by watch name
+        timeout (int): time to watch in seconds
+
+    Yields:
+        tuple: watch name, and a copy of its raw objects by (namespace, name), on every change of any watch
+
+    Raises:
+        TimeoutExpiredError: when timeout is reached
+    """
+    timeout_watcher = TimeoutWatch(timeout=timeout)
+    changes: queue.Queue[tuple[str, Any]] = queue.Queue()
+    stop = threading.Event()
+
+    def _watch(watch_name: str, watch_kwargs: dict[str, Any]) -> None:
+        try:
+            for raw_objects in watch_raw_objects(timeout=timeout, stop=stop, **watch_kwargs):
+                changes.put((watch_name, dict(raw_objects)))
+        except Exception as exp:
+            changes.put((watch_name, exp))
+
+    for watch_name, watch_kwargs in watches.items():
+        threading.Thread(
+            target=_watch, args=(watch_name, watch_kwargs), name=f"watch-{watch_name}", daemon=True
+        ).start()
+
+    try:
+        while remaining_time := timeout_watcher.remaining_time():
+            try:
+                watch_name, change = changes.get(timeout=remaining_time)
+            except queue.Empty:
+                break
+            if isinstance(change, Exception):
+                raise change
+            yield watch_name, change
+    finally:
+        stop.set()
+
+    raise TimeoutExpiredError(f"Watches {list(watches)}")
+
+
+def wait_for_resource_state(
+    resource: Resource,
+    condition: Callable[[dict[str, Any] | None], bool],
+    timeout: int,
+    stop_condition: Callable[[dict[str, Any] | None], bool] | None = None,
+) -> dict[str, Any] | None:
+    """
+    Wait for a resource to reach a state, using a watch on the resource instead of polling it.
+
+    Args:
+        resource (Resource): resource to wait for
+        condition (Callable): gets the raw resource dict (None if the resource does not exist), returns True when
+            the wait is done
+        timeout (int): time to wait in seconds
+        stop_condition (Callable, optional): same signature as condition, returns True when the wait should fail
+
+    Returns:
+        dict or None: the raw resource dict which met the condition
+
+    Raises:
+        TimeoutExpiredError: when the condition is not met within timeout, or stop_condition is met
+    """
+    raw_object = None
+    namespace = getattr(resource, "namespace", None)
+    try:
+        for raw_objects in watch_raw_objects(
+            api=resource.api,
+            timeout=timeout,
+            namespace=namespace,
+            field_selector=f"metadata.name={resource.name}",
+        ):
+            raw_object = raw_objects.get((namespace, resource.name))
+            if condition(raw_object):
+                return raw_object
+
+            if stop_condition and stop_condition(raw_object):
+                raise TimeoutExpiredError(f"Stop condition met for {resource.kind} {resource.name}")
+
+    except TimeoutExpiredError:
+        LOGGER.error(f"{resource.kind} {resource.name} last seen status: {(raw_object or {}).get('status')}")
+        raise
+
+    return None
+
+
+class ResourceCache:
+    """
+    In memory cache of a resource kind, kept in sync by a watch running in a background thread.
+
+    Reads are served from memory without API calls. Use get_resource_cache to share caches across the session, and
+    stop_resource_caches to stop them.
+    """
+
+    def __init__(self, api: Any, namespace: str | None = None, label_selector: str | None = None) -> None:
+        """
+        Args:
+            api (ResourceInstance): dynamic client resource API
+            namespace (str, optional): namespace to cache, None for all namespaces or cluster scoped resources
+            label_selector (str, optional): cache only objects matching the label selector
+        """
+        self.api = api
+        self.namespace = namespace
+        self.label_selector = label_selector
+        self._raw_objects: dict[tuple[str | None, str | None], dict[str, Any]] = {}
+        self._synced = threading.Event()
+        self._sync_waited = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._sync, name=f"resource-cache-{api.kind}-{namespace}-{label_selector}", daemon=True
+        )
+        self._thread.start()
+
+    def _sync(self) -> None:
+        while not self._stop.is_set():
+            try:
+                for raw_objects in watch_raw_objects(
+                    api=self.api,
+                    timeout=TIMEOUT_10MIN,
+                    namespace=self.namespace,
+                    label_selector=self.label_selector,
+                    stop=self._stop,
+                ):
+                    self._raw_objects = raw_objects
+                    self._synced.set()
+            except TimeoutExpiredError:
+                continue
+            except Exception as exp:
+                # Readers fall back to the API server until the cache is synced again
+                LOGGER.warning(f"{self.api.kind} cache watch failed, re-syncing: {exp}")
+                self._synced.clear()
+                self._stop.wait(timeout=TIMEOUT_5SEC)
+
+    def wait_for_sync(self, timeout: int = TIMEOUT_10SEC) -> bool:
+        """
+        Wait for the cache first sync; later calls return whether the cache is synced, without waiting.
+
+        Args:
+            timeout (int): time to wait for the first sync
+
+        Returns:
+            bool: True if the cache is synced
+        """
+        if self._sync_waited:
+            return self._synced.is_set()
+
+        self._sync_waited = True
+        return self._synced.wait(timeout=timeout)
+
+    def stop(self) -> None:
+        # The watch notices it was stopped within WATCH_STOP_CHECK_INTERVAL seconds
+        self._stop.set()
+        self._synced.clear()
+
+    def get(self, name: str | None, namespace: str | None = None) -> dict[str, Any] | None:
+        return self._raw_objects.get((namespace, name))
+
+    def list(self, namespace: str | None = None, labels: dict[str, str] | None = None) -> list[dict[str, Any]]:
+        """
+        Args:
+            namespace (str, optional): return only objects in this namespace
+            labels (dict, optional): return only objects which have all these labels
+
+        Returns:
+            list: raw objects
+        """
+        return [
+            raw_object
+            for raw_object in list(self._raw_objects.values())
+            if (not namespace or raw_object["metadata"].get("namespace") == namespace)
+            and (labels or {}).items() <= raw_object["metadata"].get("labels", {}).items()
+        ]
+
+
+def _resource_class_api(client: DynamicClient, resource_class: type[Resource]) -> Any:
+    if resource_class.api_version:
+        return client.resources.get(api_version=resource_class.api_version, kind=resource_class.kind)
+
+    return next(
+        api
+        for api in client.resources.search(group=resource_class.api_group, kind=resource_class.kind)
+        if api.preferred
+    )
+
+
+def get_resource_cache(
+    client: DynamicClient,
+    resource_class: type[Resource],
+    namespace: str | None = None,
+    label_selector: str | None = None,
+) -> ResourceCache | None:
+    """
+    Get the session wide cache of a resource kind, creating it on first use.
+
+    Only the first lookup of a cache waits for it to sync; later lookups of an unsynced cache return None at once.
+
+    Args:
+        client (DynamicClient): client to list and watch with
+        resource_class (Resource): resource class, e.g. Node
+        namespace (str, optional): namespace to cache, None for all namespaces or cluster scoped resources
+        label_selector (str, optional): cache only objects matching the label selector
+
+    Returns:
+        ResourceCache or None: the cache, None if it could not be synced (callers should read from the API server)
+    """
+    cache_key = (client, resource_class.kind, resource_class.api_group, namespace, label_selector)
+    with _RESOURCE_CACHES_LOCK:
+        if cache_key not in _RESOURCE_CACHES:
+            _RESOURCE_CACHES[cache_key] = ResourceCache(
+                api=_resource_class_api(client=client, resource_class=resource_class),
+                namespace=namespace,
+                label_selector=label_selector,
+            )
+        resource_cache = _RESOURCE_CACHES[cache_key]
+
+    if resource_cache.wait_for_sync():
+        return resource_cache
+
+    LOGGER.warning(f"{resource_class.kind} cache is not synced, reading from the API server")
+    return None
+
+
+def stop_resource_caches() -> None:
+    """
+    Stop the watches of all the session resource caches.
+    """
+    with _RESOURCE_CACHES_LOCK:
+        resource_caches = list(_RESOURCE_CACHES.values())
+        _RESOURCE_CACHES.clear()
+
+    for resource_cache in resource_caches:
+        resource_cache.stop()
+
+
+def cached_resource_instance(resource: Resource, bypass_cache: bool = False) -> ResourceInstance:
+    """
+    Get the resource instance from the session cache of its kind.
+
+    Args:
+        resource (Resource): resource to get
+        bypass_cache (bool): read from the API server, for callers which must see their own latest writes
+
+    Returns:
+        ResourceInstance: same as resource.instance
+    """
+    namespace = getattr(resource, "namespace", None)
+    if not bypass_cache:
+        resource_cache = get_resource_cache(client=resource.client, resource_class=type(resource), namespace=namespace)
+        if resource_cache and (raw_object := resource_cache.get(name=resource.name, namespace=namespace)):
+            return ResourceInstance(client=resource.api, instance=raw_object)
+
+    return resource.instance
+
+
+def wait_for_stable_state(
+    client: DynamicClient,
+    resource_class: type[Resource],
+    condition: Callable[[dict[str, Any] | None], bool],
+    stability_duration: int,
+    timeout: int,
+    namespace: str | None = None,
+    name: str | None = None,
+    stop_condition: Callable[[dict[str, Any] | None], bool] | None = None,
+) -> dict[str, Any] | None:
+    """
+    Wait for a resource to meet a condition continuously for a stability duration, tracked from watch events.
+
+    The first object matching namespace and name is checked, as the condition is usually on a singleton CR.
+
+    Args:
+        client (DynamicClient): client to list and watch with
+        resource_class (Resource): resource class, e.g. HyperConverged
+        condition (Callable): gets the raw resource dict (None if it does not exist), returns True when met
+        stability_duration (int): time in seconds the condition must hold without interruption
+        timeout (int): time to wait in seconds
+        namespace (str, optional): resource namespace
+        name (str, optional): resource name
+        stop_condition (Callable, optional): same signature as condition, returns True when the wait should fail
+
+    Returns:
+        dict or None: the raw resource dict which met the condition
+
+    Raises:
+        TimeoutExpiredError: when the condition is not stable within timeout, or stop_condition is met
+    """
+    api = _resource_class_api(client=client, resource_class=resource_class)
+    timeout_watcher = TimeoutWatch(timeout=timeout)
+    stable_since = None
+    raw_object = None
+    stop_condition_met = False
+    while not stop_condition_met:
+        # Wake up when the stability window elapses, even if no events arrive
+        watch_timeout = timeout_watcher.remaining_time()
+        if stable_since is not None:
+            watch_timeout = min(watch_timeout, stable_since + stability_duration - time.time())
+
+        try:
+            for raw_objects in watch_raw_objects(
+                api=api,
+                timeout=watch_timeout,
+                namespace=namespace,
+                field_selector=f"metadata.name={name}" if name else None,
+            ):
+                raw_object = next(iter(raw_objects.values()), None)
+                if stop_condition and stop_condition(raw_object):
+                    stop_condition_met = True
+                    break
+
+                if not condition(raw_object):
+                    stable_since = None
+                    continue
+
+                if stable_since is None:
+                    stable_since = time.time()
+                    # Restart the watch with a timeout that ends with the stability window
+                    break
+
+                if time.time() - stable_since >= stability_duration:
+                    return raw_object
+
+        except TimeoutExpiredError:
+            # Either the stability window or the total timeout ended, both are checked below
+            pass
+
+        if stable_since is not None and time.time() - stable_since >= stability_duration:
+            return raw_object
+
+        if not timeout_watcher.remaining_time():
+            break
+
+    raise TimeoutExpiredError(
+        f"{resource_class.kind} {name or ''} {'stop condition met' if stop_condition_met else 'is not stable'}"
+    )